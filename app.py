@@ -7,37 +7,53 @@ import tkinter as tk
 from tkinter import messagebox
 import sys
 import os
+import multiprocessing
 
 # Add tasched directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Time the imports below when TASCHED_PROFILE_STARTUP is set
+from tasched.services.startup_profile import get_startup_profiler, SETUP_SHOWN_MARK
+get_startup_profiler().install_import_hook()
+
 from tasched.constants import *
 from tasched.core.models import Task, Schedule, Settings
 from tasched.core.scheduler_engine import SchedulerEngine
+from tasched.core.timer_hub import get_timer_hub
 from tasched.services.theme_service import get_theme_service
 from tasched.services.resource_service import get_resource_service
 from tasched.services.storage_service import get_storage_service
 from tasched.services.log_service import get_log_service
-from tasched.services.audio_service import get_audio_service
-from tasched.ui.run_window import RunWindow
-from tasched.ui.alert_windows import WarningPopup, TimeUpWindow
+from tasched.services.journal_service import get_event_journal
+from tasched.services.image_service import get_image_service
 from tasched.ui.setup_window import SetupWindow
 
 
+HALL_FOLLOW_JOB = "hall_sync.follow"
+
+
 class TaSchedApp:
     """Main TaSched Application"""
 
     def __init__(self):
+        self.profiler = get_startup_profiler()
+        self.profiler.mark("modules imported")
+
         self.root = tk.Tk()
         self.root.title(APP_FULL_NAME)
         self.root.state('zoomed')  # Maximized window on launch
 
-        # Services
+        # One heartbeat for the countdown, clock, ticker and alert timers
+        self.timer_hub = get_timer_hub(self.root)
+
+        # Services (audio and the database start once the setup window is shown)
         self.theme = get_theme_service()
         self.resource = get_resource_service()
         self.storage = get_storage_service()
         self.log = get_log_service()
-        self.audio = get_audio_service()
+        self.audio = None
+        self.broadcast = None
+        self.hall_sync = None
 
         # Load settings
         self.settings = self.storage.load_settings()
@@ -51,10 +67,18 @@ class TaSchedApp:
         self.scheduler.set_warning_callback(self._on_warning)
         self.scheduler.set_timeup_callback(self._on_timeup)
 
-        # Windows
+        # Task whose background music is currently playing
+        self._music_task_id = None
+
+        # Hall sync follower: schedule key, task index by wire key, and the last state shown
+        self._hall_schedule_key = None
+        self._hall_task_index = {}
+        self._followed = None
+
+        # Windows (alert windows are built once the setup window is shown)
         self.run_window = None
-        self.warning_popup = WarningPopup(self.root)
-        self.timeup_window = TimeUpWindow(self.root)
+        self.warning_popup = None
+        self.timeup_window = None
 
         # Configure root window
         self._setup_root()
@@ -63,12 +87,74 @@ class TaSchedApp:
         icon_path = self.resource.get_image(WAEC_ICON)
         if icon_path:
             try:
-                self.root.iconbitmap(icon_path)
+                self.root.iconbitmap(self.resource.materialize(icon_path))
             except Exception:
                 pass
 
         # Log startup
         self.log.info(f"{APP_NAME} v{APP_VERSION} started")
+        self.profiler.mark("setup window built")
+
+        # Start the rest once the setup window has been drawn
+        self.root.after_idle(self._on_setup_shown)
+
+    def _on_setup_shown(self):
+        """Record when the setup window was drawn, then defer the background services"""
+        self.profiler.mark(SETUP_SHOWN_MARK)
+        self.root.after(STARTUP_DEFER_MS, self._start_background_services)
+
+    def _start_background_services(self):
+        """Start audio, the database and the alert windows (safe to call more than once)"""
+        if self.audio is not None:
+            return
+
+        from tasched.services.audio_service import get_audio_service
+        from tasched.services.tone_cache import get_tone_cache
+        from tasched.ui.alert_windows import WarningPopup, TimeUpWindow
+
+        # Mixer initialisation runs on the audio worker thread
+        self.audio = get_audio_service()
+
+        # Transcode tones to cached PCM in the background, then decode them
+        # up front so the first alert plays instantly
+        get_tone_cache().prewarm(self.resource.list_sounds(),
+                                 on_complete=self.audio.preload_sounds)
+
+        # Create the database tables off the Tk thread
+        self.storage.warm_up()
+
+        # Remote displays: the server runs on its own thread
+        if self.settings.broadcast_enabled:
+            from tasched.services.broadcast_service import get_broadcast_service
+            broadcast = get_broadcast_service()
+            if broadcast.start(self.settings.broadcast_host, self.settings.broadcast_port):
+                self.broadcast = broadcast
+                self.log.info(f"Broadcasting on port {broadcast.port}")
+
+        # Several hall PCs showing one schedule
+        if self.settings.hall_sync_role in (HALL_SYNC_ROLE_MASTER, HALL_SYNC_ROLE_FOLLOWER):
+            from tasched.services.hall_sync_service import get_hall_sync_service
+            hall_sync = get_hall_sync_service()
+            start = (hall_sync.start_master if self.settings.hall_sync_role == HALL_SYNC_ROLE_MASTER
+                     else hall_sync.start_follower)
+            if start(self.settings.hall_sync_group, self.settings.hall_sync_port,
+                     self.settings.hall_sync_interface):
+                self.hall_sync = hall_sync
+
+        # Alerts are for the audience: in dual display they open on its monitor
+        alert_monitor_x = None
+        if self.settings.dual_display:
+            alert_monitor_x = self.settings.audience_monitor_x
+            if alert_monitor_x is None:
+                alert_monitor_x = self.root.winfo_screenwidth()  # as AudienceView assumes
+        self.warning_popup = WarningPopup(self.root, monitor_x=alert_monitor_x)
+        self.timeup_window = TimeUpWindow(self.root, monitor_x=alert_monitor_x)
+
+        # Scale the time-up background off the Tk thread while the schedule is built
+        self.timeup_window.prerender()
+
+        self.profiler.mark("background services started")
+        self.profiler.finish()
 
     def _setup_root(self):
         """Configure root window"""
@@ -81,24 +167,37 @@ class TaSchedApp:
     def _start_from_setup(self, schedule: Schedule):
         """Start schedule from setup window"""
         try:
+            # In case the schedule is started before background startup ran
+            self._start_background_services()
+
             # Load into scheduler
             self.scheduler.load_schedule(schedule)
 
+            # Make sure time-up images are ready before the first task ends
+            self.timeup_window.prerender()
+
             # Create run window
+            from tasched.ui.run_window import RunWindow
             self.run_window = RunWindow(
                 self.root,
-                on_pause_callback=self.scheduler.pause,
-                on_resume_callback=self.scheduler.resume,
+                on_pause_callback=self._pause_schedule,
+                on_resume_callback=self._resume_schedule,
                 on_skip_callback=self.scheduler.skip_task,
                 on_force_next_callback=self.scheduler.force_next_task,
-                on_stop_callback=self._stop_schedule
+                on_stop_callback=self._stop_schedule,
+                glyph_countdown=self.settings.glyph_countdown,
+                dual_display=self.settings.dual_display,
+                audience_x=self.settings.audience_monitor_x
             )
 
             # Hide setup window
             self.root.withdraw()
 
-            # Start schedule
-            self.scheduler.start()
+            # Start schedule (a hall sync follower counts down from the master's state)
+            if self._is_hall_follower():
+                self._start_following(schedule)
+            else:
+                self.scheduler.start()
 
         except Exception as e:
             messagebox.showerror(
@@ -112,16 +211,94 @@ class TaSchedApp:
 
     def _on_tick(self, schedule, current_task):
         """Handle timer tick"""
+        self._sync_background_music(current_task)
+
         if self.run_window:
             next_task = self.scheduler.get_next_task()
             self.run_window.update(schedule, current_task, next_task)
 
+        self._publish_state()
+
+    def _publish_state(self):
+        """Send the scheduler state to remote displays and hall followers"""
+        schedule = self.scheduler.schedule
+        current_task = self.scheduler.get_current_task()
+
+        if self.hall_sync:
+            self.hall_sync.publish(schedule, current_task)
+
+        if self.broadcast:
+            from tasched.services.broadcast_service import build_state
+            self.broadcast.publish(build_state(schedule, current_task, self.scheduler.get_next_task())
+                                   if schedule else build_state(None))
+
+    # ========== Hall Sync Follower ==========
+
+    def _is_hall_follower(self) -> bool:
+        """True when this PC mirrors a hall sync master"""
+        return self.hall_sync is not None and self.hall_sync.role == HALL_SYNC_ROLE_FOLLOWER
+
+    def _start_following(self, schedule: Schedule):
+        """Show the master's countdown for the loaded schedule"""
+        from tasched.services.hall_sync_service import id_key
+        self._hall_schedule_key = id_key(schedule.id)
+        self._hall_task_index = {id_key(task.id): index for index, task in enumerate(schedule.tasks)}
+        self._followed = None
+        self.timer_hub.add_periodic(HALL_FOLLOW_JOB, self._follow_master, HALL_SYNC_POLL_MS, aligned=False)
+
+    def _stop_following(self):
+        """Stop mirroring the master"""
+        self.timer_hub.cancel(HALL_FOLLOW_JOB)
+        self._followed = None
+
+    def _follow_master(self):
+        """Push the master's state to the scheduler when the shown second changes"""
+        state = self.hall_sync.latest()
+        if state is None or state.schedule_key != self._hall_schedule_key:
+            return  # nothing heard yet, or the master runs another schedule
+
+        # Same schedule loaded on both PCs: match tasks by id, else by position
+        task_index = self._hall_task_index.get(state.task_key, state.task_index)
+        shown = (task_index, self.hall_sync.remaining_seconds(state), state.state)
+        if shown == self._followed:
+            return
+        self._followed = shown
+        self.scheduler.follow(*shown)
+
+    def _pause_schedule(self):
+        """Pause the schedule (ticks stop, so publish the paused state here)"""
+        self.scheduler.pause()
+        self._publish_state()
+
+    def _resume_schedule(self):
+        """Resume the schedule"""
+        self.scheduler.resume()
+        self._publish_state()
+
+    def _sync_background_music(self, task):
+        """Start or stop background music when the running task changes"""
+        if task.id == self._music_task_id:
+            return
+        self._music_task_id = task.id
+
+        music = task.sound_profile.background_music
+        music_path = self.resource.get_sound(music) if music else None
+        if music_path:
+            self.audio.play_background_music(music_path)
+        else:
+            self.audio.stop_background_music()
+
     def _on_task_complete(self, task):
         """Handle task completion"""
         print(f"Task completed: {task.title}")
 
     def _on_schedule_complete(self, schedule):
         """Handle schedule completion"""
+        self._stop_following()
+        self._music_task_id = None
+        self.audio.stop_background_music()
+        self._publish_state()
+
         if self.run_window:
             self.run_window.destroy()
             self.run_window = None
@@ -156,7 +333,11 @@ class TaSchedApp:
         )
 
         if result:
+            self._stop_following()
             self.scheduler.stop()
+            self._music_task_id = None
+            self.audio.stop_background_music()
+            self._publish_state()
 
             if self.run_window:
                 self.run_window.destroy()
@@ -173,7 +354,17 @@ class TaSchedApp:
     def cleanup(self):
         """Clean up resources on exit"""
         self.scheduler.cleanup()
-        self.audio.cleanup()
+        get_event_journal().close()
+        if self.audio:
+            self.audio.cleanup()
+        if self.broadcast:
+            self.broadcast.stop()
+        if self.hall_sync:
+            self.hall_sync.stop()
+        get_image_service().shutdown()
+        self.timer_hub.shutdown()
+        if self.timer_hub.frames:
+            self.log.debug("Timer hub job timing:\n" + self.timer_hub.report())
         self.log.info(f"{APP_NAME} closed")
 
 
@@ -190,4 +381,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the image prerender process pool in frozen builds
+    multiprocessing.freeze_support()
     main()
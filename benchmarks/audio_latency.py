@@ -0,0 +1,202 @@
+"""
+TaSched - Audio Latency Benchmark
+Measures the time from WarningPopup.show() to the first sound being
+queued on the mixer, with cold and warm sound/tone caches.
+
+Usage:
+    python benchmarks/audio_latency.py [--backend null|dummy|pygame] [--runs N] [--no-ui]
+
+The null backend needs neither pygame nor a sound card; "dummy" runs the
+real pygame mixer on SDL's dummy driver. The popup needs a display (use
+xvfb-run on a build machine), or pass --no-ui to time the audio service
+call alone.
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import wave
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tasched.constants import (
+    AUDIO_FREQUENCY,
+    AUDIO_SIZE,
+    AUDIO_CHANNELS,
+    AUDIO_BACKEND_NULL,
+    AUDIO_BACKEND_DUMMY,
+    AUDIO_BACKEND_PYGAME,
+    SYNTH_TONE,
+    WAEC_TONE
+)
+from tasched.services.audio_backend import (
+    NullBackend,
+    PygameBackend,
+    create_audio_backend,
+    set_audio_backend
+)
+
+
+class TimedPygameBackend(PygameBackend):
+    """pygame backend that timestamps the first channel play"""
+
+    def __init__(self, driver: str = None):
+        super().__init__(driver)
+        self._played_at = None
+        self._played = threading.Event()
+
+    def play_channel(self, channel_id, sound, volume):
+        super().play_channel(channel_id, sound, volume)
+        if self._played_at is None:
+            self._played_at = time.perf_counter()
+        self._played.set()
+
+    def reset(self):
+        self._played_at = None
+        self._played.clear()
+
+    def wait_for_play(self, timeout=None):
+        if not self._played.wait(timeout):
+            return None
+        return self._played_at
+
+
+def make_backend(name: str):
+    """Create a backend able to report when the first sound was queued"""
+    if name == AUDIO_BACKEND_NULL:
+        return create_audio_backend(AUDIO_BACKEND_NULL)
+    return TimedPygameBackend(driver="dummy" if name == AUDIO_BACKEND_DUMMY else None)
+
+
+def played_at(backend, timeout: float = 5.0):
+    """Wait for the first play and return its perf_counter timestamp"""
+    result = backend.wait_for_play(timeout)
+    if result is None:
+        return None
+    return result.timestamp if isinstance(backend, NullBackend) else result
+
+
+def write_test_tone(path: str):
+    """Write a synthesised beep as WAV so every backend can decode it"""
+    from tasched.services.tone_synth import render_tone, warning_tone_key
+
+    raw = render_tone(warning_tone_key(0), AUDIO_FREQUENCY, AUDIO_CHANNELS)
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(AUDIO_CHANNELS)
+        wav.setsampwidth(abs(AUDIO_SIZE) // 8)
+        wav.setframerate(AUDIO_FREQUENCY)
+        wav.writeframes(raw)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure alert audio latency")
+    parser.add_argument("--backend", default=AUDIO_BACKEND_NULL,
+                        choices=[AUDIO_BACKEND_NULL, AUDIO_BACKEND_DUMMY, AUDIO_BACKEND_PYGAME])
+    parser.add_argument("--runs", type=int, default=20, help="measurements per case")
+    parser.add_argument("--no-ui", action="store_true",
+                        help="call the audio service directly instead of showing the popup")
+    args = parser.parse_args()
+
+    # The backend must be in place before the audio service is created
+    backend = make_backend(args.backend)
+    set_audio_backend(backend)
+
+    from tasched.core.models import Task, SoundProfile
+    from tasched.services.audio_service import get_audio_service
+    from tasched.services.resource_service import get_resource_service
+    from tasched.services.tone_cache import ToneCache
+
+    audio = get_audio_service()
+    if not audio.wait_until_ready(timeout=10.0):
+        print(f"Audio backend '{args.backend}' failed to initialize")
+        return 1
+
+    work_dir = tempfile.mkdtemp(prefix="tasched_bench_")
+    try:
+        if args.backend == AUDIO_BACKEND_NULL:
+            # The null backend only decodes WAV
+            tone_path = os.path.join(work_dir, "bench_tone.wav")
+            write_test_tone(tone_path)
+        else:
+            tone_path = get_resource_service().get_sound(WAEC_TONE)
+
+        root = popup = None
+        if not args.no_ui:
+            import tkinter as tk
+            from tasched.ui.alert_windows import WarningPopup
+            try:
+                root = tk.Tk()
+            except tk.TclError as e:
+                print(f"No display available ({e}); run under xvfb-run or pass --no-ui")
+                return 1
+            root.withdraw()
+            popup = WarningPopup(root)
+
+        def trigger(sound_name: str):
+            task = Task(title="Benchmark", sound_profile=SoundProfile(warning_sound=sound_name))
+            if popup:
+                popup.show(task, 60)
+            elif sound_name == SYNTH_TONE:
+                audio.play_synth_warning(2)
+            else:
+                audio.play_warning_sound(sound_name)
+
+        def measure(sound_name: str, cold: bool) -> float:
+            if cold:
+                audio.sound_cache.clear()
+                # Fresh cache directory: nothing transcoded yet
+                cache_dir = tempfile.mkdtemp(dir=work_dir)
+                audio.tone_cache = ToneCache(cache_dir)
+            audio.stop_alerts()
+            time.sleep(0.02)
+            backend.reset()
+
+            start = time.perf_counter()
+            trigger(sound_name)
+            end = played_at(backend)
+            if root:
+                root.update()
+                popup.dismiss()
+            if end is None:
+                raise RuntimeError(f"No sound was queued for {sound_name}")
+            return (end - start) * 1000
+
+        cases = [("file", tone_path), ("synth", SYNTH_TONE)]
+        rows = []
+
+        for label, sound_name in cases:
+            for cold in (True, False):
+                if not cold:
+                    # Warm: transcoded, analysed and decoded ahead of time
+                    if label == "file":
+                        audio.tone_cache.transcode(sound_name)
+                    measure(sound_name, cold=False)
+
+                samples = sorted(measure(sound_name, cold) for _ in range(args.runs))
+                p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+                rows.append(f"{label:<8}{'cold' if cold else 'warm':<7}"
+                            f"{statistics.median(samples):>11.2f}{p95:>10.2f}{samples[-1]:>10.2f}")
+
+        if root:
+            root.destroy()
+
+        # Printed at the end so the audio worker's log lines do not interleave
+        print()
+        print(f"Backend: {args.backend}   UI: {'no' if args.no_ui else 'WarningPopup.show'}   runs: {args.runs}")
+        print(f"{'case':<8}{'cache':<7}{'median ms':>11}{'p95 ms':>10}{'max ms':>10}")
+        for row in rows:
+            print(row)
+    finally:
+        audio.cleanup()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+TaSched - Model Memory Benchmark
+Compares the memory held by the slotted Task/Schedule models with the
+same objects in the previous layout (a plain instance __dict__ each).
+
+Usage:
+    python benchmarks/model_memory.py [--tasks N] [--runs R]
+
+"runs" keeps R decoded copies of one schedule alive at once (e.g. one
+per hall).
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tasched.core.models import DisplayOptions, Schedule, SoundProfile, Task
+
+
+# ========== Previous Layout ==========
+
+def previous_layout(cls: type) -> type:
+    """The model as a plain dataclass (an instance __dict__ each), as before slots"""
+    return make_dataclass(cls.__name__, [
+        (f.name, f.type, field(default=f.default, default_factory=f.default_factory)) for f in fields(cls)
+    ])
+
+
+PlainSoundProfile = previous_layout(SoundProfile)
+PlainDisplayOptions = previous_layout(DisplayOptions)
+PlainTask = previous_layout(Task)
+PlainSchedule = previous_layout(Schedule)
+
+
+def plain_schedule_from_dict(data: dict):
+    """Decode into the previous layout"""
+    tasks = [
+        PlainTask(**{**t, 'sound_profile': PlainSoundProfile(**t['sound_profile']),
+                     'display': PlainDisplayOptions(**t['display'])})
+        for t in data['tasks']
+    ]
+    return PlainSchedule(**{**data, 'tasks': tasks})
+
+
+# ========== Benchmark ==========
+
+def build_schedule(count: int) -> Schedule:
+    """Schedule of tasks with typical (mostly default) settings"""
+    schedule = Schedule(name="Benchmark")
+    for index in range(count):
+        schedule.add_task(Task(title=f"Paper {index + 1}", duration_seconds=60 * (30 + index % 90)))
+    return schedule
+
+
+def measure(build) -> int:
+    """Bytes still allocated after build() returns (the result is kept alive)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure memory per task")
+    parser.add_argument("--tasks", type=int, default=1000, help="tasks per schedule")
+    parser.add_argument("--runs", type=int, default=10, help="copies of the schedule kept alive")
+    args = parser.parse_args()
+
+    data = build_schedule(args.tasks).to_dict()
+
+    before_one = measure(lambda: plain_schedule_from_dict(data))
+    after_one = measure(lambda: Schedule.from_dict(data))
+    before_runs = measure(lambda: [plain_schedule_from_dict(data) for _ in range(args.runs)])
+    after_runs = measure(lambda: [Schedule.from_dict(data) for _ in range(args.runs)])
+
+    tasks = args.tasks
+    print(f"Memory per task ({tasks} tasks, tracemalloc)")
+    print(f"  Instance __dict__ (before)           {before_one / tasks:>8.0f} B")
+    print(f"  Slotted (after)                      {after_one / tasks:>8.0f} B"
+          f"  ({before_one / max(1, after_one):.1f}x smaller)")
+    print(f"{args.runs} copies of one schedule")
+    print(f"  Instance __dict__ (before)           {before_runs / 1024:>8.0f} KiB")
+    print(f"  Slotted (after)                      {after_runs / 1024:>8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
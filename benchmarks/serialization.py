@@ -0,0 +1,139 @@
+"""
+TaSched - Serialization Benchmark
+Compares the generated model encoders/decoders with the previous
+dataclasses.asdict / cls(**data) implementation, for plain dict
+conversion, template save/load through SQLite and duplicate_task.
+
+Usage:
+    python benchmarks/serialization.py [--tasks N] [--repeat R]
+
+orjson is used for the JSON step when it is installed.
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tasched.core.models import DisplayOptions, Schedule, SoundProfile, Task
+from tasched.core.serializers import dumps, loads, optional_module
+
+
+# ========== Previous Implementation ==========
+
+def legacy_schedule_to_dict(schedule: Schedule) -> dict:
+    """Schedule.to_dict before generated encoders"""
+    return {
+        'id': schedule.id,
+        'name': schedule.name,
+        'date': schedule.date,
+        'task_ids': schedule.task_ids,
+        'tasks': [dataclasses.asdict(task) for task in schedule.tasks],
+        'auto_start': schedule.auto_start,
+        'auto_advance': schedule.auto_advance,
+        'gap_between_tasks': schedule.gap_between_tasks,
+        'state': schedule.state,
+        'current_task_index': schedule.current_task_index,
+        'created_at': schedule.created_at,
+        'started_at': schedule.started_at,
+        'completed_at': schedule.completed_at
+    }
+
+
+def legacy_task_from_dict(data: dict) -> Task:
+    """Task(**data), converting nested dicts in __post_init__ through **data as well"""
+    data = dict(data)
+    data['sound_profile'] = SoundProfile(**data['sound_profile'])
+    data['display'] = DisplayOptions(**data['display'])
+    return Task(**data)
+
+
+def legacy_schedule_from_dict(data: dict) -> Schedule:
+    """Schedule.from_dict before generated decoders"""
+    data = dict(data)
+    tasks_data = data.pop('tasks', [])
+    schedule = Schedule(**data)
+    schedule.tasks = [legacy_task_from_dict(t) for t in tasks_data]
+    return schedule
+
+
+# ========== Benchmark ==========
+
+def build_schedule(count: int) -> Schedule:
+    """Schedule of tasks with typical settings"""
+    schedule = Schedule(name="Benchmark")
+    for index in range(count):
+        task = Task(title=f"Paper {index + 1}", duration_seconds=60 * (30 + index % 90))
+        task.display.ticker_text = "Candidates must remain seated"
+        schedule.add_task(task)
+    return schedule
+
+
+def best_of(repeat: int, func) -> float:
+    """Fastest of several runs, in milliseconds (garbage collection paused, as timeit does)"""
+    best = float('inf')
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - started)
+    finally:
+        gc.enable()
+    return best * 1000
+
+
+def report(label: str, before: float, after: float):
+    print(f"  {label:<34}{before:>9.2f} ms{after:>9.2f} ms{before / after:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure model serialization speed")
+    parser.add_argument("--tasks", type=int, default=5000, help="tasks per schedule")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (best is shown)")
+    args = parser.parse_args()
+
+    schedule = build_schedule(args.tasks)
+    data = schedule.to_dict()
+    text = json.dumps(data)
+
+    backend = "orjson" if optional_module("orjson") else "json"
+    print(f"{args.tasks} tasks, backend {backend}; best of {args.repeat}")
+    print(f"  {'':<34}{'before':>12}{'after':>12}")
+
+    report("Schedule.to_dict",
+           best_of(args.repeat, lambda: legacy_schedule_to_dict(schedule)),
+           best_of(args.repeat, schedule.to_dict))
+    report("Schedule.from_dict",
+           best_of(args.repeat, lambda: legacy_schedule_from_dict(data)),
+           best_of(args.repeat, lambda: Schedule.from_dict(data)))
+    report("Template encode (dict + JSON)",
+           best_of(args.repeat, lambda: json.dumps(legacy_schedule_to_dict(schedule))),
+           best_of(args.repeat, lambda: dumps(schedule.to_dict())))
+    report("Template decode (JSON + dict)",
+           best_of(args.repeat, lambda: legacy_schedule_from_dict(json.loads(text))),
+           best_of(args.repeat, lambda: Schedule.from_dict(loads(text))))
+
+    task = schedule.tasks[0]
+    report("Task round trip x1000 (duplicate)",
+           best_of(args.repeat, lambda: [legacy_task_from_dict(dataclasses.asdict(task)) for _ in range(1000)]),
+           best_of(args.repeat, lambda: [Task.from_dict(task.to_dict()) for _ in range(1000)]))
+
+    # Storage path end to end (current implementation only)
+    from tasched.services.storage_service import StorageService
+    with tempfile.TemporaryDirectory() as directory:
+        storage = StorageService(os.path.join(directory, "bench.db"))
+        save = best_of(args.repeat, lambda: storage.save_template("Bench", "", schedule))
+        load = best_of(args.repeat, lambda: storage.get_template("template_bench"))
+    print(f"  StorageService.save_template      {save:>9.2f} ms")
+    print(f"  StorageService.get_template       {load:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
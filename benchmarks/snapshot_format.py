@@ -0,0 +1,65 @@
+"""
+TaSched - Snapshot Format Benchmark
+Compares template/export encodings of a large schedule: the previous
+json.dumps(asdict) text, JSON through the current serializers, and the
+binary snapshot format with and without compression.
+
+Usage:
+    python benchmarks/snapshot_format.py [--tasks N] [--repeat R]
+
+Times include model conversion (to_dict/from_dict) so the rows compare
+Schedule -> bytes -> Schedule end to end.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from serialization import best_of, build_schedule, legacy_schedule_from_dict, legacy_schedule_to_dict
+from tasched.core.models import Schedule
+from tasched.core.serializers import dumps, loads, optional_module
+from tasched.core.snapshot import schedule_from_snapshot, schedule_to_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure snapshot size and speed")
+    parser.add_argument("--tasks", type=int, default=5000, help="tasks per schedule")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (best is shown)")
+    args = parser.parse_args()
+
+    schedule = build_schedule(args.tasks)
+    backend = "orjson" if optional_module("orjson") else "json"
+
+    formats = [
+        ("Legacy JSON (asdict)",
+         lambda: json.dumps(legacy_schedule_to_dict(schedule)),
+         lambda data: legacy_schedule_from_dict(json.loads(data))),
+        (f"JSON ({backend})",
+         lambda: dumps(schedule.to_dict()),
+         lambda data: Schedule.from_dict(loads(data))),
+        ("Snapshot",
+         lambda: schedule_to_snapshot(schedule, compress=False),
+         schedule_from_snapshot),
+        ("Snapshot (zlib)",
+         lambda: schedule_to_snapshot(schedule),
+         schedule_from_snapshot),
+    ]
+
+    print(f"{args.tasks} tasks; best of {args.repeat}")
+    print(f"  {'':<24}{'size':>12}{'save':>12}{'load':>12}")
+    baseline = None
+    for label, save, load in formats:
+        data = save()
+        size = len(data.encode('utf-8') if isinstance(data, str) else data)
+        baseline = baseline or size
+        save_ms = best_of(args.repeat, save)
+        load_ms = best_of(args.repeat, lambda: load(data))
+        print(f"  {label:<24}{size / 1024:>9.0f} KiB{save_ms:>9.2f} ms{load_ms:>9.2f} ms"
+              f"  ({size / baseline:.1%} of legacy size)")
+
+
+if __name__ == "__main__":
+    main()
@@ -94,6 +94,37 @@ TICKER_POSITION_BOTTOM = "bottom"
 TICKER_SPEED_SLOW = 1
 TICKER_SPEED_MEDIUM = 3
 TICKER_SPEED_FAST = 6
+TICKER_FPS = 30  # ticker animation frame rate
+TICKER_PIXELS_PER_SPEED = 10  # scroll pixels per second per speed step
+TIMER_HUB_FRAME_MS = 16  # jobs due within half a frame run in the same heartbeat
+TICK_SLEW_MS = 50  # most a countdown second is stretched or shortened to reach a wall-clock boundary
+TASK_TREE_OVERSCAN = 10  # setup task list rows rendered beyond the visible ones
+
+# Startup
+STARTUP_DEFER_MS = 50  # delay after the setup window is drawn before audio/storage start
+STARTUP_TARGET_MS = 500  # time-to-setup-window goal shown in the startup profile
+STARTUP_PROFILE_ENV = "TASCHED_PROFILE_STARTUP"  # set to 1 to print the startup profile
+
+# Remote Display Broadcast
+BROADCAST_HOST = "0.0.0.0"  # listen on every interface so LAN displays can connect
+BROADCAST_PORT = 8765
+BROADCAST_KEEPALIVE_SECONDS = 15  # idle streams get a comment/ping this often
+BROADCAST_CLIENT_QUEUE = 32  # messages buffered per client before it is resynced
+
+# Hall Sync (several PCs showing one schedule)
+HALL_SYNC_ROLE_OFF = "off"
+HALL_SYNC_ROLE_MASTER = "master"
+HALL_SYNC_ROLE_FOLLOWER = "follower"
+HALL_SYNC_GROUP = "239.255.84.83"  # administratively scoped multicast group
+HALL_SYNC_PORT = 8766
+HALL_SYNC_TTL = 1  # stay on the local network segment
+HALL_SYNC_RESEND_SECONDS = 1.0  # master repeats its last state frame this often
+HALL_SYNC_PING_SECONDS = 2.0  # follower clock-offset ping interval once settled
+HALL_SYNC_SAMPLES = 8  # offset samples kept; the lowest-delay one is used
+HALL_SYNC_POLL_MS = 20  # follower display check interval
+
+# Serialization
+SERIALIZER_BACKEND = "auto"  # "auto" uses orjson when installed, "json" forces the standard library
 
 # Display Modes
 DISPLAY_MODE_FULLSCREEN = "fullscreen"
@@ -104,10 +135,27 @@ DATA_DIR = "tasched/data"
 ASSETS_DIR = "tasched/assets"
 IMAGES_DIR = "tasched/assets/images"
 SOUNDS_DIR = "tasched/assets/sounds"
+WEB_CLIENT_FILE = "tasched/assets/web/index.html"
+
+# Asset Index
+SOUND_EXTENSIONS = ('.mp3', '.wav', '.ogg')
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.ico')
+SCHEDULE_EXPORT_EXTENSION = ".tsched"  # snapshot files from Export Schedule
+ASSET_INDEX_CHECK_INTERVAL = 1.0  # min seconds between directory mtime checks
+
+# Asset Bundle (frozen builds)
+ASSET_BUNDLE_FILE = "tasched_assets.tsab"  # looked up next to the executable, then in the base path
+ASSET_BUNDLE_ENV = "TASCHED_ASSET_BUNDLE"  # environment variable forcing a bundle path
+BUNDLE_PATH_PREFIX = "bundle:"  # asset paths served from the bundle look like bundle:sound/name.mp3
+BUNDLE_EXTRACT_DIR = "bundle_files"  # assets extracted for APIs that need a real file
 
 # Database
 DB_FILE = "tasched.db"
 
+# Event Journal
+JOURNAL_FLUSH_INTERVAL = 0.5  # seconds the worker waits for new events
+JOURNAL_BATCH_SIZE = 200  # max events written per sink call
+
 # JSON Files (for templates and settings)
 SETTINGS_FILE = "settings.json"
 TEMPLATES_FILE = "templates.json"
@@ -119,11 +167,22 @@ WAEC_LOGO = "WAEC_Logo.webp"
 WAEC_ICON = "WAEC_Icon.ico"
 WAEC_TONE = "WAEC_Tone.mp3"
 
+# Synthesised Tones (generated in memory, no sound file needed)
+SYNTH_TONE_PREFIX = "synth:"
+SYNTH_TONE = "synth:beep"  # selectable sound name for the built-in beep patterns
+
 # Window Sizes
 SETUP_WINDOW_WIDTH = 900
 SETUP_WINDOW_HEIGHT = 700
 RUN_WINDOW_WIDTH = 800
 RUN_WINDOW_HEIGHT = 600
+RUN_CONSOLE_WIDTH = 720  # dual-display operator console
+RUN_CONSOLE_HEIGHT = 420
+CONSOLE_COUNTDOWN_FONT_SIZE = 48
+AUDIENCE_TITLE_FONT_SIZE = 56  # dual-display audience view
+AUDIENCE_COUNTDOWN_FONT_SIZE = 160
+AUDIENCE_TICKER_FONT_SIZE = 28
+AUDIENCE_TICKER_HEIGHT = 70
 WARNING_POPUP_WIDTH = 400
 WARNING_POPUP_HEIGHT = 250
 TIMEUP_WINDOW_WIDTH = 600
@@ -138,8 +197,37 @@ FONT_SIZE_XLARGE = 24
 FONT_SIZE_TITLE = 32
 FONT_SIZE_CLOCK = 72
 
+# Glyph countdown (pre-rasterised digits, see Settings.glyph_countdown)
+GLYPH_CHARACTERS = "0123456789:"
+GLYPH_FONT_FILES = ("segoeuib.ttf", "arialbd.ttf", "DejaVuSans-Bold.ttf")  # bold faces, first found wins
+
 # Audio Settings
 AUDIO_FREQUENCY = 22050
 AUDIO_SIZE = -16
 AUDIO_CHANNELS = 2
 AUDIO_BUFFER = 512
+AUDIO_SOUND_CACHE_MAX_BYTES = 32 * 1024 * 1024  # decoded PCM kept in memory
+AUDIO_CHANNEL_WARNING = 0  # reserved mixer channel for warning tones
+AUDIO_CHANNEL_TIMEUP = 1  # reserved mixer channel for time-up tones
+AUDIO_RESERVED_CHANNELS = 2
+AUDIO_DUCK_LEVEL = 0.25  # background music gain while an alert plays
+AUDIO_DUCK_ATTACK_MS = 150  # ramp time down to the duck level
+AUDIO_DUCK_RELEASE_MS = 800  # ramp time back to full level after alerts
+AUDIO_ENVELOPE_STEP_MS = 10  # gain update interval while ramping
+AUDIO_DUCK_POLL_MS = 100  # alert-finished check interval while music is held ducked
+TONE_CACHE_DIR = "tone_cache"  # transcoded tones, inside the data directory
+IMAGE_CACHE_DIR = "image_cache"  # pre-scaled images, inside the data directory
+PRERENDER_WORKERS = 2  # threads decoding and scaling images off the Tk thread
+PRERENDER_PROCESS_PIXELS = 4_000_000  # target area above which scaling runs in a worker process
+PRERENDER_POLL_MS = 50  # how often the Tk thread collects finished prerenders
+
+# Audio Backends
+AUDIO_BACKEND_ENV = "TASCHED_AUDIO_BACKEND"  # environment variable selecting the backend
+AUDIO_BACKEND_PYGAME = "pygame"
+AUDIO_BACKEND_DUMMY = "dummy"  # pygame on SDL's dummy driver (no sound card needed)
+AUDIO_BACKEND_NULL = "null"  # in-process recording sink, no pygame needed
+
+# Loudness Normalisation
+LOUDNESS_TARGET_RMS = 0.1  # target tone RMS relative to full scale (about -20 dBFS)
+LOUDNESS_PEAK_CEILING = 0.98  # never scale a tone's peak above this
+LOUDNESS_MAX_GAIN = 8.0  # cap boost for near-silent tones
@@ -0,0 +1,30 @@
+"""
+TaSched - Lazy Imports
+Heavy optional modules are imported on first use, not at startup
+"""
+
+import importlib
+from types import ModuleType
+from typing import Optional, Set
+
+# Optional modules already found to be missing
+_missing: Set[str] = set()
+
+
+def optional_module(name: str) -> Optional[ModuleType]:
+    """
+    Import a module on first use
+
+    Args:
+        name: Module name (e.g. "numpy")
+
+    Returns:
+        The module, or None if it is not installed
+    """
+    if name in _missing:
+        return None
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        _missing.add(name)
+        return None
@@ -1,16 +1,20 @@
 """
 TaSched - Core Data Models
 Defines Task, Schedule, and Settings models
+Task, Schedule and their profiles are slotted: a schedule can hold
+thousands of tasks, and without an instance __dict__ each one takes
+about a third less memory.
 """
 
 import uuid
 from datetime import datetime, time
 from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
+from tasched.core.serializers import generate_codec
 from tasched.constants import *
 
 
-@dataclass
+@dataclass(slots=True)
 class SoundProfile:
     """Sound configuration for a task"""
     warning_sound: str = WAEC_TONE
@@ -18,14 +22,17 @@ class SoundProfile:
     background_music: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return _encode_sound_profile(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SoundProfile':
-        return cls(**data)
+        return _decode_sound_profile(data)
 
 
-@dataclass
+_encode_sound_profile, _decode_sound_profile = generate_codec(SoundProfile)
+
+
+@dataclass(slots=True)
 class DisplayOptions:
     """Display configuration for a task"""
     fullscreen_timeup: bool = True
@@ -36,14 +43,17 @@ class DisplayOptions:
     ticker_speed: int = TICKER_SPEED_MEDIUM
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return _encode_display_options(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DisplayOptions':
-        return cls(**data)
+        return _decode_display_options(data)
 
 
-@dataclass
+_encode_display_options, _decode_display_options = generate_codec(DisplayOptions)
+
+
+@dataclass(slots=True)
 class Task:
     """
     Represents a single task with duration, alerts, and display settings
@@ -121,16 +131,18 @@ class Task:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert task to dictionary"""
-        data = asdict(self)
-        return data
+        return _encode_task(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Task':
         """Create task from dictionary"""
-        return cls(**data)
+        return _decode_task(data)
 
 
-@dataclass
+_encode_task, _decode_task = generate_codec(Task)
+
+
+@dataclass(slots=True)
 class Schedule:
     """
     Represents a collection of tasks to be executed in sequence
@@ -251,29 +263,16 @@ class Schedule:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert schedule to dictionary"""
-        return {
-            'id': self.id,
-            'name': self.name,
-            'date': self.date,
-            'task_ids': self.task_ids,
-            'tasks': [task.to_dict() for task in self.tasks],
-            'auto_start': self.auto_start,
-            'auto_advance': self.auto_advance,
-            'gap_between_tasks': self.gap_between_tasks,
-            'state': self.state,
-            'current_task_index': self.current_task_index,
-            'created_at': self.created_at,
-            'started_at': self.started_at,
-            'completed_at': self.completed_at
-        }
+        return _encode_schedule(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Schedule':
         """Create schedule from dictionary"""
-        tasks_data = data.pop('tasks', [])
-        schedule = cls(**data)
-        schedule.tasks = [Task.from_dict(t) for t in tasks_data]
-        return schedule
+        return _decode_schedule(data)
+
+
+# task_prefix has never been part of the saved schedule
+_encode_schedule, _decode_schedule = generate_codec(Schedule, exclude=('task_prefix',))
 
 
 @dataclass
@@ -293,14 +292,27 @@ class Settings:
     default_ticker_direction: str = TICKER_DIRECTION_LEFT
     default_ticker_speed: int = TICKER_SPEED_MEDIUM
     window_always_on_top: bool = False
+    glyph_countdown: bool = False  # draw the countdown from cached digit images
+    dual_display: bool = False  # operator console here, audience view on the second monitor
+    audience_monitor_x: Optional[int] = None  # left edge of the audience monitor (default: right of the primary)
+    broadcast_enabled: bool = False  # serve the countdown to browsers on the LAN
+    broadcast_host: str = BROADCAST_HOST
+    broadcast_port: int = BROADCAST_PORT
+    hall_sync_role: str = HALL_SYNC_ROLE_OFF  # off, master or follower
+    hall_sync_group: str = HALL_SYNC_GROUP
+    hall_sync_port: int = HALL_SYNC_PORT
+    hall_sync_interface: str = "0.0.0.0"
     enable_sound: bool = True
     sound_volume: float = 0.7
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert settings to dictionary"""
-        return asdict(self)
+        return _encode_settings(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Settings':
         """Create settings from dictionary"""
-        return cls(**data)
+        return _decode_settings(data)
+
+
+_encode_settings, _decode_settings = generate_codec(Settings)
@@ -3,33 +3,40 @@ TaSched - Scheduler Engine
 State machine and execution loop for running schedules
 """
 
+import time
 from typing import Callable, Optional
 import tkinter as tk
 
 from tasched.core.models import Schedule, Task
+from tasched.core.timer_hub import get_timer_hub
 from tasched.core.warning_engine import WarningEngine
 from tasched.constants import *
-from tasched.services.log_service import get_log_service
-from tasched.services.storage_service import get_storage_service
+from tasched.services.journal_service import get_event_journal
+
+
+TICK_JOB = "scheduler.tick"
 
 
 class SchedulerEngine:
     """
     Core scheduler engine - manages schedule execution with state machine
-    Uses Tkinter's after() for UI-safe timer updates
+    Ticks are driven by the shared timer hub. The first tick after start or
+    resume comes a full second later; later ticks drift onto wall-clock
+    seconds by at most TICK_SLEW_MS each, so no countdown second is cut
+    short or stretched noticeably.
     """
 
     def __init__(self, root: tk.Tk):
         self.root = root
         self.schedule: Optional[Schedule] = None
         self.warning_engine = WarningEngine()
-        self.log_service = get_log_service()
-        self.storage_service = get_storage_service()
+        self.journal = get_event_journal()
 
         # Timer control
-        self.timer_id = None
+        self.timer_hub = get_timer_hub(root)
         self.is_running = False
         self.gap_countdown = 0
+        self._tick_due: Optional[float] = None  # time.time() of the pending tick
 
         # Callbacks
         self.on_tick_callback: Callable = None
@@ -70,7 +77,10 @@ class SchedulerEngine:
         """Load a schedule for execution"""
         self.schedule = schedule
         self.schedule.reset()
-        self.log_service.log_schedule_start(schedule.name, schedule.id)
+        self._record(
+            "schedule_loaded",
+            f"Schedule loaded: {schedule.name} (ID: {schedule.id})"
+        )
 
     def start(self, from_task_index: int = 0):
         """
@@ -80,34 +90,36 @@ class SchedulerEngine:
             from_task_index: Start from specific task index (default: 0)
         """
         if not self.schedule:
-            self.log_service.error("Cannot start: No schedule loaded")
+            self._note("Cannot start: No schedule loaded", "ERROR")
             return
 
         if not self.schedule.tasks:
-            self.log_service.error("Cannot start: Schedule has no tasks")
+            self._note("Cannot start: Schedule has no tasks", "ERROR")
             return
 
         # Set starting task
         self.schedule.current_task_index = from_task_index
         self.schedule.start()
+        self._record(
+            "schedule_started",
+            f"Schedule started: {self.schedule.name} (ID: {self.schedule.id})",
+            {'from_task_index': from_task_index}
+        )
 
         # Start first task
         current_task = self.schedule.get_current_task()
         if current_task:
             current_task.start()
             self.warning_engine.reset_for_task(current_task)
-            self.log_service.log_task_start(current_task.title, current_task.id)
-
-            # Log to database
-            self.storage_service.log_event(
-                self.schedule.id,
-                self.schedule.name,
-                "schedule_started",
-                {'from_task_index': from_task_index}
+            self._record(
+                "task_started",
+                f"Task started: {current_task.title} (ID: {current_task.id})",
+                {'task': current_task.title}
             )
 
         # Start timer loop
         self.is_running = True
+        self._tick_due = None
         self._tick()
 
     def pause(self):
@@ -118,11 +130,9 @@ class SchedulerEngine:
 
             current_task = self.schedule.get_current_task()
             if current_task:
-                self.log_service.log_task_paused(current_task.title)
-                self.storage_service.log_event(
-                    self.schedule.id,
-                    self.schedule.name,
+                self._record(
                     "schedule_paused",
+                    f"Task paused: {current_task.title}",
                     {'task': current_task.title}
                 )
 
@@ -137,15 +147,14 @@ class SchedulerEngine:
 
             current_task = self.schedule.get_current_task()
             if current_task:
-                self.log_service.log_task_resumed(current_task.title)
-                self.storage_service.log_event(
-                    self.schedule.id,
-                    self.schedule.name,
+                self._record(
                     "schedule_resumed",
+                    f"Task resumed: {current_task.title}",
                     {'task': current_task.title}
                 )
 
             # Restart timer loop
+            self._tick_due = None
             self._tick()
 
     def skip_task(self):
@@ -160,15 +169,16 @@ class SchedulerEngine:
         current_task = self.schedule.get_current_task()
         if current_task:
             current_task.skip()
-            self.log_service.log_task_skipped(current_task.title)
-            self.storage_service.log_event(
-                self.schedule.id,
-                self.schedule.name,
+            self._record(
                 "task_skipped",
-                {'task': current_task.title, 'action': 'skip_and_wait'}
+                f"Task skipped: {current_task.title}",
+                {'task': current_task.title, 'action': 'skip_and_wait'},
+                level="WARNING"
             )
 
-        # Advance to next task (will respect absolute time if set)
+        # Advance to next task (will respect absolute time if set); its first
+        # second counts from now, not from the skipped task's tick phase
+        self._tick_due = None
         self._advance_to_next_task(wait_for_absolute_time=True)
 
     def force_next_task(self):
@@ -182,18 +192,18 @@ class SchedulerEngine:
         current_task = self.schedule.get_current_task()
         if current_task:
             current_task.skip()
-            self.log_service.log_task_skipped(current_task.title)
-            self.storage_service.log_event(
-                self.schedule.id,
-                self.schedule.name,
+            self._record(
                 "task_forced_next",
-                {'task': current_task.title, 'action': 'force_and_adjust'}
+                f"Task skipped: {current_task.title}",
+                {'task': current_task.title, 'action': 'force_and_adjust'},
+                level="WARNING"
             )
 
         # Adjust remaining tasks' absolute times based on current time
         self._adjust_remaining_task_times()
 
         # Advance to next task immediately (ignore absolute time)
+        self._tick_due = None
         self._advance_to_next_task(wait_for_absolute_time=False)
 
     def stop(self):
@@ -202,28 +212,110 @@ class SchedulerEngine:
             self.schedule.cancel()
             self.is_running = False
 
-            self.log_service.log_schedule_end(
-                self.schedule.name,
-                self.schedule.id,
-                "cancelled"
-            )
-            self.storage_service.log_event(
-                self.schedule.id,
-                self.schedule.name,
+            self._record(
                 "schedule_cancelled",
-                {}
+                f"Schedule ended: {self.schedule.name} (ID: {self.schedule.id}) - Status: cancelled"
             )
 
             # Cancel timer
             self._cancel_timer()
 
+    # ========== Hall Sync ==========
+
+    def follow(self, task_index: int, remaining_seconds: int, state: str):
+        """
+        Mirror another PC's schedule instead of counting down locally
+        Used by hall sync followers. Task changes, warnings, time-up and the
+        tick callback fire as they would on the master.
+
+        A master that has not started yet (idle/ready) leaves the follower
+        waiting, and a finished master only ends a run that this follower
+        joined, so a hall PC started first does not show TIME UP.
+
+        Args:
+            task_index: Master's current task index
+            remaining_seconds: Seconds left on the master's current task
+            state: Master's schedule state
+        """
+        if not self.schedule or not self.schedule.tasks:
+            return
+        schedule = self.schedule
+
+        if state in (SCHEDULE_STATE_IDLE, SCHEDULE_STATE_READY):
+            return  # waiting for the master to start
+
+        if state in (SCHEDULE_STATE_COMPLETED, SCHEDULE_STATE_CANCELLED):
+            if schedule.state in (SCHEDULE_STATE_IDLE, SCHEDULE_STATE_READY,
+                                  SCHEDULE_STATE_COMPLETED, SCHEDULE_STATE_CANCELLED):
+                return  # left over from an earlier run, or already ended
+            if state == SCHEDULE_STATE_COMPLETED:
+                current_task = schedule.get_current_task()
+                if current_task and current_task.state == TASK_STATE_ACTIVE:
+                    current_task.complete()
+                self._complete_schedule()
+            else:
+                self.stop()
+            return
+
+        task_index = max(0, min(task_index, len(schedule.tasks) - 1))
+        if schedule.state == SCHEDULE_STATE_IDLE or task_index != schedule.current_task_index:
+            previous = schedule.get_current_task()
+            if schedule.state == SCHEDULE_STATE_IDLE:
+                schedule.start()
+            elif previous and previous.state in (TASK_STATE_ACTIVE, TASK_STATE_PAUSED):
+                previous.complete()
+            schedule.current_task_index = task_index
+            self.gap_countdown = 0
+            self._start_task(schedule.get_current_task())
+
+        if state == SCHEDULE_STATE_PAUSED and schedule.state != SCHEDULE_STATE_PAUSED:
+            schedule.pause()
+        elif state == SCHEDULE_STATE_RUNNING and schedule.state == SCHEDULE_STATE_PAUSED:
+            schedule.resume()
+        self.is_running = False  # the master drives the countdown
+
+        current_task = schedule.get_current_task()
+        if current_task.state in (TASK_STATE_COMPLETED, TASK_STATE_SKIPPED):
+            return  # between tasks on the master
+
+        changed = current_task.remaining_seconds != remaining_seconds
+        current_task.remaining_seconds = max(0, remaining_seconds)
+        if changed:
+            self.warning_engine.evaluate(current_task)
+            if current_task.remaining_seconds == 0:
+                current_task.complete()
+                self._record(
+                    "task_completed",
+                    f"Task ended: {current_task.title} (ID: {current_task.id}) - Status: completed",
+                    {'task': current_task.title, 'duration': current_task.duration_seconds}
+                )
+                if self.on_task_complete_callback:
+                    self.on_task_complete_callback(current_task)
+
+        if self.on_tick_callback:
+            self.on_tick_callback(schedule, current_task)
+
     # ========== Timer Loop ==========
 
     def _cancel_timer(self):
-        """Cancel the current timer callback if it exists"""
-        if self.timer_id:
-            self.root.after_cancel(self.timer_id)
-            self.timer_id = None
+        """Cancel the pending tick if there is one"""
+        self.timer_hub.cancel(TICK_JOB)
+
+    def _schedule_tick(self):
+        """
+        Queue the next tick (replaces any pending tick)
+        Each tick is due one second after the previous one was, not after it
+        ran, so a late tick is caught up instead of skipping a second.
+        """
+        now = time.time()
+        if self._tick_due is None:
+            due = now + 1.0  # first tick after start/resume
+        else:
+            due = self._tick_due + 1.0
+            slew = TICK_SLEW_MS / 1000
+            due += max(-slew, min(slew, round(due) - due))
+        self._tick_due = due
+        self.timer_hub.schedule(TICK_JOB, self._tick, max(0.0, (due - now) * 1000))
 
     def _tick(self):
         """Execute one timer tick (called every second)"""
@@ -237,9 +329,8 @@ class SchedulerEngine:
                 # Gap complete, start next task
                 self._start_next_task()
             else:
-                # Schedule next tick - cancel existing timer first
-                self._cancel_timer()
-                self.timer_id = self.root.after(1000, self._tick)
+                # Schedule next tick
+                self._schedule_tick()
             return
 
         # Get current task
@@ -263,18 +354,15 @@ class SchedulerEngine:
         if time_is_up:
             self._handle_task_complete(current_task)
         else:
-            # Schedule next tick - cancel existing timer first
-            self._cancel_timer()
-            self.timer_id = self.root.after(1000, self._tick)
+            # Schedule next tick
+            self._schedule_tick()
 
     def _handle_task_complete(self, task: Task):
         """Handle task completion"""
         task.complete()
-        self.log_service.log_task_end(task.title, task.id, "completed")
-        self.storage_service.log_event(
-            self.schedule.id,
-            self.schedule.name,
+        self._record(
             "task_completed",
+            f"Task ended: {task.title} (ID: {task.id}) - Status: completed",
             {'task': task.title, 'duration': task.duration_seconds}
         )
 
@@ -287,9 +375,8 @@ class SchedulerEngine:
             # Check if there's a gap
             if self.schedule.gap_between_tasks > 0:
                 self.gap_countdown = self.schedule.gap_between_tasks
-                # Continue ticking for gap - cancel existing timer first
-                self._cancel_timer()
-                self.timer_id = self.root.after(1000, self._tick)
+                # Continue ticking for gap
+                self._schedule_tick()
             else:
                 # No gap, advance immediately
                 self._advance_to_next_task()
@@ -315,18 +402,16 @@ class SchedulerEngine:
                 seconds_until_start = self._calculate_wait_time(next_task.absolute_start_time)
 
                 if seconds_until_start > 0:
-                    # Set gap countdown to wait until absolute time - cancel existing timer first
+                    # Set gap countdown to wait until absolute time
                     self.gap_countdown = seconds_until_start
-                    self.log_service.info(f"Waiting {seconds_until_start}s until {next_task.absolute_start_time} for '{next_task.title}'")
-                    self._cancel_timer()
-                    self.timer_id = self.root.after(1000, self._tick)
+                    self._note(f"Waiting {seconds_until_start}s until {next_task.absolute_start_time} for '{next_task.title}'")
+                    self._schedule_tick()
                     return
 
             # Check gap before starting
             if self.schedule.gap_between_tasks > 0 and self.gap_countdown == 0:
                 self.gap_countdown = self.schedule.gap_between_tasks
-                self._cancel_timer()
-                self.timer_id = self.root.after(1000, self._tick)
+                self._schedule_tick()
             else:
                 self._start_next_task()
         else:
@@ -356,7 +441,7 @@ class SchedulerEngine:
             diff = (target - now).total_seconds()
             return int(diff)
         except Exception as e:
-            self.log_service.error(f"Error calculating wait time for '{absolute_time_str}': {e}")
+            self._note(f"Error calculating wait time for '{absolute_time_str}': {e}", "ERROR")
             return 0
 
     def _adjust_remaining_task_times(self):
@@ -394,42 +479,35 @@ class SchedulerEngine:
             if self.schedule.gap_between_tasks > 0:
                 cumulative_time += timedelta(seconds=self.schedule.gap_between_tasks)
 
-        self.log_service.info(f"Adjusted remaining {len(tasks) - next_index} task start times from {now.strftime('%H:%M')}")
+        self._note(f"Adjusted remaining {len(tasks) - next_index} task start times from {now.strftime('%H:%M')}")
 
     def _start_next_task(self):
         """Start the next task"""
-        next_task = self.schedule.get_current_task()
-        if next_task:
-            next_task.start()
-            self.warning_engine.reset_for_task(next_task)
-            self.log_service.log_task_start(next_task.title, next_task.id)
-            self.storage_service.log_event(
-                self.schedule.id,
-                self.schedule.name,
+        self._start_task(self.schedule.get_current_task())
+
+        # Continue timer loop
+        self._schedule_tick()
+
+    def _start_task(self, task: Optional[Task]):
+        """Mark a task active and reset its warnings"""
+        if task:
+            task.start()
+            self.warning_engine.reset_for_task(task)
+            self._record(
                 "task_started",
-                {'task': next_task.title}
+                f"Task started: {task.title} (ID: {task.id})",
+                {'task': task.title}
             )
 
-        # Continue timer loop - cancel existing timer first
-        self._cancel_timer()
-        self.timer_id = self.root.after(1000, self._tick)
-
     def _complete_schedule(self):
         """Handle schedule completion"""
         if self.schedule:
             self.schedule.complete()
             self.is_running = False
 
-            self.log_service.log_schedule_end(
-                self.schedule.name,
-                self.schedule.id,
-                "completed"
-            )
-            self.storage_service.log_event(
-                self.schedule.id,
-                self.schedule.name,
+            self._record(
                 "schedule_completed",
-                {}
+                f"Schedule ended: {self.schedule.name} (ID: {self.schedule.id}) - Status: completed"
             )
 
             # Trigger schedule complete callback
@@ -438,18 +516,52 @@ class SchedulerEngine:
 
     def _handle_warning(self, task: Task, remaining_seconds: int):
         """Handle warning event from warning engine"""
-        self.log_service.log_warning(task.title, remaining_seconds)
+        self._record(
+            "warning_triggered",
+            f"Warning triggered for task '{task.title}' - {remaining_seconds}s remaining",
+            {'task': task.title, 'remaining_seconds': remaining_seconds}
+        )
 
         if self.on_warning_callback:
             self.on_warning_callback(task, remaining_seconds)
 
     def _handle_timeup(self, task: Task):
         """Handle time-up event from warning engine"""
-        self.log_service.log_timeup(task.title)
+        self._record(
+            "task_timeup",
+            f"Time-up for task: {task.title}",
+            {'task': task.title}
+        )
 
         if self.on_timeup_callback:
             self.on_timeup_callback(task)
 
+    # ========== Journal ==========
+
+    def _record(self, event_type: str, message: str, data: dict = None, level: str = "INFO"):
+        """
+        Record a schedule transition in the event journal
+        One event feeds both the text log and run_history
+
+        Args:
+            event_type: run_history event type
+            message: Text log line
+            data: Optional event payload
+            level: Text log level
+        """
+        self.journal.record(
+            event_type,
+            message,
+            level=level,
+            schedule_id=self.schedule.id,
+            schedule_name=self.schedule.name,
+            data=data
+        )
+
+    def _note(self, message: str, level: str = "INFO"):
+        """Record a text-log-only journal entry (not a run_history event)"""
+        self.journal.record("note", message, level=level)
+
     # ========== Status Methods ==========
 
     def get_current_task(self) -> Optional[Task]:
@@ -0,0 +1,199 @@
+"""
+TaSched - Serializers
+Generated encoders/decoders for the dataclass models, and the JSON backend
+dataclasses.asdict walks every field through reflection and deep-copies
+nested values, and from_dict(**data) rebuilds keyword dicts per task.
+generate_codec() instead writes one plain function per model when the
+model is defined: the encoder is a single dict literal and the decoder
+assigns each field of a bare instance, skipping the __init__ default
+handling (__post_init__ still runs). Nested models call their own
+generated functions directly.
+
+dumps()/loads() use orjson when it is installed and the standard json
+module otherwise; pack()/unpack() use msgpack when installed (JSON bytes
+otherwise).
+"""
+
+import json
+from dataclasses import MISSING, fields
+from typing import Any, Callable, Dict, Iterable, List, Tuple, get_args, get_origin
+
+from tasched.core.lazy_import import optional_module
+from tasched.constants import SERIALIZER_BACKEND
+
+# Generated functions by model class
+_encoders: Dict[type, Callable] = {}
+_decoders: Dict[type, Callable] = {}
+
+
+# ========== Code Generation ==========
+
+def generate_codec(cls: type, exclude: Iterable[str] = ()) -> Tuple[Callable, Callable]:
+    """
+    Generate the encoder and decoder for a dataclass
+
+    Fields whose type is (a list of) a model registered earlier are
+    encoded/decoded with that model's functions. Lists are copied on
+    encode so the dict never aliases the object. The decoder ignores
+    unknown keys and fills missing ones with the field defaults.
+
+    Args:
+        cls: Dataclass to generate for
+        exclude: Fields left out of the encoded dict
+
+    Returns:
+        (encode(obj) -> dict, decode(dict) -> obj)
+    """
+    name = cls.__name__
+    namespace: Dict[str, Any] = {name: cls, '_new': object.__new__}
+    encode_items: List[str] = []
+    decode_fast: List[str] = []
+    decode_args: List[str] = []
+
+    for f in fields(cls):
+        key = f.name
+        nested, is_list = _nested_model(f.type)
+        if nested is not None:
+            namespace[f"_enc_{nested.__name__}"] = _encoders[nested]
+            namespace[f"_dec_{nested.__name__}"] = _decoders[nested]
+
+        # Encoder
+        if key not in exclude:
+            value = f"o.{key}"
+            if nested is not None and is_list:
+                value = f"[_enc_{nested.__name__}(x) for x in {value}]"
+            elif nested is not None:
+                value = f"_enc_{nested.__name__}({value})"
+            elif _is_list(f.type):
+                value = f"list({value})"
+            encode_items.append(f"{key!r}: {value}")
+
+        # Decoder
+        if f.default is not MISSING:
+            namespace[f"_d_{key}"] = f.default
+            default = f"_d_{key}"
+        elif f.default_factory is not MISSING:
+            namespace[f"_f_{key}"] = f.default_factory
+            default = f"_f_{key}()"
+        else:
+            default = None
+
+        if nested is not None and is_list:
+            present = f"[_dec_{nested.__name__}(x) for x in d[{key!r}]]"
+        elif nested is not None:
+            present = f"_dec_{nested.__name__}(d[{key!r}])"
+        else:
+            present = f"d[{key!r}]"
+        if default is None:
+            fallback = present
+        elif present == f"d[{key!r}]" and default.startswith("_d_"):
+            fallback = f"d.get({key!r}, {default})"
+        else:
+            fallback = f"{present} if {key!r} in d else {default}"
+        decode_args.append(f"o.{key} = {fallback}")
+        # Excluded fields are never in encoded dicts
+        decode_fast.append(f"o.{key} = {fallback if key in exclude else present}")
+
+    # Complete dicts (anything this module wrote) take the first block;
+    # a missing key falls back to the one that fills in defaults
+    post_init = "    o.__post_init__()\n" if hasattr(cls, '__post_init__') else ""
+    source = (
+        f"def encode_{name}(o):\n"
+        f"    return {{{', '.join(encode_items)}}}\n"
+        f"\n"
+        f"def decode_{name}(d):\n"
+        f"    if d.__class__ is not dict:\n"
+        f"        return d  # already a {name}\n"
+        f"    o = _new({name})\n"
+        f"    try:\n"
+        f"        " + "\n        ".join(decode_fast) + "\n"
+        f"    except KeyError:\n"
+        f"        " + "\n        ".join(decode_args) + "\n"
+        f"{post_init}"
+        f"    return o\n"
+    )
+    exec(compile(source, f"<serializers:{name}>", "exec"), namespace)
+
+    encode = namespace[f"encode_{name}"]
+    decode = namespace[f"decode_{name}"]
+    encode.__source__ = decode.__source__ = source
+    _encoders[cls] = encode
+    _decoders[cls] = decode
+    return encode, decode
+
+
+def _is_list(annotation) -> bool:
+    return annotation is list or get_origin(annotation) is list
+
+
+def _nested_model(annotation) -> Tuple[Any, bool]:
+    """(registered model, is a list of it) for a field annotation"""
+    if annotation in _encoders:
+        return annotation, False
+    if _is_list(annotation):
+        args = get_args(annotation)
+        if args and args[0] in _encoders:
+            return args[0], True
+    return None, False
+
+
+# ========== Backends ==========
+
+def _backend() -> str:
+    """Resolve the configured backend ("auto" prefers orjson)"""
+    if SERIALIZER_BACKEND == "json":
+        return "json"
+    return "orjson" if optional_module("orjson") else "json"
+
+
+def dumps(data: Any) -> str:
+    """
+    Serialise to compact JSON text
+
+    Args:
+        data: JSON-compatible value
+
+    Returns:
+        JSON string
+    """
+    if _backend() == "orjson":
+        return optional_module("orjson").dumps(data).decode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+
+def loads(text) -> Any:
+    """
+    Parse JSON text (str or bytes)
+
+    Returns:
+        Parsed value
+    """
+    if _backend() == "orjson":
+        return optional_module("orjson").loads(text)
+    return json.loads(text)
+
+
+def pack(data: Any) -> bytes:
+    """
+    Serialise to bytes (msgpack if installed, else UTF-8 JSON)
+
+    Returns:
+        Encoded bytes
+    """
+    msgpack = optional_module("msgpack")
+    if msgpack is not None:
+        return msgpack.packb(data, use_bin_type=True)
+    return dumps(data).encode('utf-8')
+
+
+def unpack(data: bytes) -> Any:
+    """
+    Parse bytes written by pack()
+
+    Returns:
+        Decoded value
+    """
+    msgpack = optional_module("msgpack")
+    if msgpack is not None and data[:1] not in (b"{", b"["):
+        return msgpack.unpackb(data, raw=False)
+    return loads(data)
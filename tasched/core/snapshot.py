@@ -0,0 +1,514 @@
+"""
+TaSched - Snapshot Format
+Versioned compact binary encoding for exported schedules
+Templates are stored as JSON, which orjson saves and loads faster than
+this pure-Python encoder; snapshots are used where size matters (files
+copied between PCs). Templates saved as snapshots by earlier versions
+still load.
+A snapshot stores a model's to_dict() output without the fields that
+equal the model defaults. Every string (keys, ids, titles, sound names)
+is stored once in a string table and referenced by index. Lists of
+records, such as a schedule's tasks, are stored column by column: a
+column where every task has the default is left out, a column with a few
+overrides stores only those rows, and string/int columns are packed as
+arrays. The body can be zlib-compressed.
+
+Layout:
+    magic "TSNP" | version u8 | flags u8 | body (zlib if FLAG_ZLIB)
+    body = varint string count, uint32 UTF-8 length per string,
+           the strings' UTF-8 bytes, value
+
+Value tags:
+    0x00-0x7F  small int            0x80-0xBF  string 0-63
+    0xC0 None  0xC1 False  0xC2 True
+    0xC3 int (zigzag varint)        0xC4 float (float64)
+    0xC5 string (varint index)      0xC6 list (varint count)
+    0xC7 dict (varint count)        0xC8 table
+    0xD0-0xDF  list of 0-15         0xE0-0xEF  dict of 0-15
+
+Table: varint rows, varint columns, then per column its key (a value),
+a column kind and the data:
+    sparse   varint count, (varint row delta, value) pairs
+    strings  uint32 little-endian string index per row
+    ints     int32 little-endian per row
+    values   one value per row
+    table    nested table (a column of records)
+"""
+
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import MISSING, fields, is_dataclass
+from itertools import accumulate, chain
+from operator import itemgetter
+from typing import Any, Dict, List
+
+from tasched.core.models import Schedule, Task
+
+SNAPSHOT_MAGIC = b"TSNP"
+SNAPSHOT_VERSION = 1
+FLAG_ZLIB = 0x01
+
+TAG_NONE = 0xC0
+TAG_FALSE = 0xC1
+TAG_TRUE = 0xC2
+TAG_INT = 0xC3
+TAG_FLOAT = 0xC4
+TAG_STR = 0xC5
+TAG_LIST = 0xC6
+TAG_DICT = 0xC7
+TAG_TABLE = 0xC8
+TAG_FIXSTR = 0x80
+TAG_FIXLIST = 0xD0
+TAG_FIXDICT = 0xE0
+
+COLUMN_SPARSE = 0
+COLUMN_STRINGS = 1
+COLUMN_INTS = 2
+COLUMN_VALUES = 3
+COLUMN_TABLE = 4
+
+FLOAT = struct.Struct("<d")
+INT32_MIN = -(1 << 31)
+INT32_MAX = (1 << 31) - 1
+BIG_ENDIAN = sys.byteorder == 'big'
+
+# Absent key / no default
+_ABSENT = object()
+
+
+class Table:
+    """
+    Marks a list of records (dicts) to be stored column by column
+
+    Args:
+        rows: Records, typically sharing their keys
+        defaults: Value per key that need not be stored
+        nested: Defaults of the records in record-valued columns, per key
+    """
+
+    __slots__ = ('rows', 'defaults', 'nested')
+
+    def __init__(self, rows: List[Dict[str, Any]], defaults: Dict[str, Any] = None,
+                 nested: Dict[str, Dict[str, Any]] = None):
+        self.rows = rows
+        self.defaults = defaults or {}
+        self.nested = nested or {}
+
+
+def is_snapshot(data) -> bool:
+    """True if data (bytes) starts with the snapshot magic"""
+    return isinstance(data, (bytes, bytearray, memoryview)) and bytes(data[:4]) == SNAPSHOT_MAGIC
+
+
+# ========== Encoding ==========
+
+class _Writer:
+    """Builds the string table and value stream in one pass"""
+
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.out = bytearray()
+
+    def varint(self, value: int):
+        out = self.out
+        while value > 0x7F:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+
+    def string_index(self, value: str) -> int:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        return index
+
+    def value(self, value: Any):
+        out = self.out
+        kind = value.__class__
+
+        if kind is str:
+            index = self.string_index(value)
+            if index < 64:
+                out.append(TAG_FIXSTR | index)
+            else:
+                out.append(TAG_STR)
+                self.varint(index)
+        elif kind is int:
+            if 0 <= value < 0x80:
+                out.append(value)
+            else:
+                out.append(TAG_INT)
+                self.varint(value << 1 if value >= 0 else ((-value) << 1) - 1)  # zigzag
+        elif value is None:
+            out.append(TAG_NONE)
+        elif kind is bool:
+            out.append(TAG_TRUE if value else TAG_FALSE)
+        elif kind is dict:
+            if len(value) < 16:
+                out.append(TAG_FIXDICT | len(value))
+            else:
+                out.append(TAG_DICT)
+                self.varint(len(value))
+            for key, item in value.items():
+                self.value(key)
+                self.value(item)
+        elif kind is list or kind is tuple:
+            if len(value) < 16:
+                out.append(TAG_FIXLIST | len(value))
+            else:
+                out.append(TAG_LIST)
+                self.varint(len(value))
+            for item in value:
+                self.value(item)
+        elif kind is float:
+            out.append(TAG_FLOAT)
+            out += FLOAT.pack(value)
+        elif kind is Table:
+            out.append(TAG_TABLE)
+            self.table(value.rows, value.defaults, value.nested)
+        else:
+            raise TypeError(f"Cannot snapshot {kind.__name__} values")
+
+    def table(self, rows: List[Dict[str, Any]], defaults: Dict[str, Any],
+              nested: Dict[str, Dict[str, Any]] = None):
+        """Write records column by column, skipping default values"""
+        count = len(rows)
+        columns = []
+        for key in dict.fromkeys(chain.from_iterable(rows)):
+            default = defaults.get(key, _ABSENT)
+            try:
+                column = list(map(itemgetter(key), rows))
+            except KeyError:
+                column = [row.get(key, _ABSENT) for row in rows]
+            unchanged = column.count(_ABSENT)
+            if default is not _ABSENT:
+                unchanged += column.count(default)
+            if unchanged < count:
+                columns.append((key, default, column, count - unchanged))
+
+        self.varint(count)
+        self.varint(len(columns))
+        nested = nested or {}
+        for key, default, column, changed in columns:
+            self.value(key)
+            self.column(column, default, changed, nested.get(key))
+
+    def column(self, column: List[Any], default: Any, changed: int, nested: Dict[str, Any] = None):
+        """Write one table column in its most compact form"""
+        out = self.out
+        count = len(column)
+
+        if changed * 4 <= count or (default is _ABSENT and _ABSENT in column):
+            out.append(COLUMN_SPARSE)
+            self.varint(changed)
+            previous = 0
+            for row, value in enumerate(column):
+                if value is _ABSENT or value == default:
+                    continue
+                self.varint(row - previous)
+                self.value(value)
+                previous = row
+            return
+
+        if default is not _ABSENT:
+            column = [default if value is _ABSENT else value for value in column]
+        kinds = set(map(type, column))
+
+        if kinds == {str}:
+            out.append(COLUMN_STRINGS)
+            strings = self.strings
+            for value in dict.fromkeys(column):
+                if value not in strings:
+                    strings[value] = len(strings)
+            self._array('I', list(map(strings.__getitem__, column)))
+        elif kinds == {int} and INT32_MIN <= min(column) and max(column) <= INT32_MAX:
+            out.append(COLUMN_INTS)
+            self._array('i', column)
+        elif kinds == {dict}:
+            out.append(COLUMN_TABLE)
+            self.table(column, nested or (default if default.__class__ is dict else {}))
+        else:
+            out.append(COLUMN_VALUES)
+            for value in column:
+                self.value(value)
+
+    def _array(self, typecode: str, values: List[int]):
+        """Append 32-bit little-endian integers"""
+        packed = array(typecode, values)
+        if BIG_ENDIAN:
+            packed.byteswap()
+        self.out += packed.tobytes()
+
+    def body(self) -> bytes:
+        """String table followed by the value stream"""
+        values = self.out
+        self.out = bytearray()
+        encoded = [string.encode('utf-8') for string in self.strings]  # index order
+        self.varint(len(encoded))
+        self._array('I', list(map(len, encoded)))
+        self.out += b"".join(encoded)
+        return bytes(self.out + values)
+
+
+def dump_snapshot(data: Any, compress: bool = True) -> bytes:
+    """
+    Encode a JSON-like value (dicts, lists, str, int, float, bool, None, Table)
+
+    Args:
+        data: Value to encode
+        compress: zlib-compress the body
+
+    Returns:
+        Snapshot bytes
+    """
+    writer = _Writer()
+    writer.value(data)
+    body = writer.body()
+    flags = 0
+    if compress:
+        body = zlib.compress(body, 1)
+        flags |= FLAG_ZLIB
+    return SNAPSHOT_MAGIC + bytes((SNAPSHOT_VERSION, flags)) + body
+
+
+# ========== Decoding ==========
+
+class _Reader:
+    """Walks a decompressed body"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+        self.strings: List[str] = []
+
+    def varint(self) -> int:
+        data = self.data
+        pos = self.pos
+        result = 0
+        shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                self.pos = pos
+                return result
+            shift += 7
+
+    def string_table(self):
+        lengths = self._array('I', self.varint())
+        start = self.pos
+        data = self.data
+        ends = list(accumulate(lengths, initial=start))
+        self.strings = [data[begin:end].decode('utf-8') for begin, end in zip(ends, ends[1:])]
+        self.pos = ends[-1]
+
+    def value(self) -> Any:
+        tag = self.data[self.pos]
+        self.pos += 1
+
+        if tag < 0x80:
+            return tag
+        if tag < 0xC0:
+            return self.strings[tag & 0x3F]
+        if tag >= TAG_FIXDICT:
+            return self.dict(tag & 0x0F)
+        if tag >= TAG_FIXLIST:
+            return [self.value() for _ in range(tag & 0x0F)]
+        if tag == TAG_NONE:
+            return None
+        if tag == TAG_FALSE:
+            return False
+        if tag == TAG_TRUE:
+            return True
+        if tag == TAG_STR:
+            return self.strings[self.varint()]
+        if tag == TAG_INT:
+            encoded = self.varint()
+            return (encoded >> 1) ^ -(encoded & 1)
+        if tag == TAG_DICT:
+            return self.dict(self.varint())
+        if tag == TAG_LIST:
+            return [self.value() for _ in range(self.varint())]
+        if tag == TAG_TABLE:
+            return self.table()
+        if tag == TAG_FLOAT:
+            value = FLOAT.unpack_from(self.data, self.pos)[0]
+            self.pos += 8
+            return value
+        raise ValueError(f"Unknown snapshot tag 0x{tag:02X}")
+
+    def dict(self, count: int) -> Dict:
+        result = {}
+        for _ in range(count):
+            key = self.value()
+            result[key] = self.value()
+        return result
+
+    def table(self) -> List[Dict[str, Any]]:
+        """Rebuild records; rows without a stored value keep the key absent"""
+        count = self.varint()
+        rows = [{} for _ in range(count)]
+
+        for _ in range(self.varint()):
+            key = self.value()
+            kind = self.data[self.pos]
+            self.pos += 1
+
+            if kind == COLUMN_SPARSE:
+                row = 0
+                for _ in range(self.varint()):
+                    row += self.varint()
+                    rows[row][key] = self.value()
+                continue
+
+            if kind == COLUMN_STRINGS:
+                strings = self.strings
+                values = [strings[index] for index in self._array('I', count)]
+            elif kind == COLUMN_INTS:
+                values = self._array('i', count).tolist()
+            elif kind == COLUMN_TABLE:
+                values = self.table()
+            elif kind == COLUMN_VALUES:
+                values = [self.value() for _ in range(count)]
+            else:
+                raise ValueError(f"Unknown snapshot column kind {kind}")
+
+            for row, value in zip(rows, values):
+                row[key] = value
+        return rows
+
+    def _array(self, typecode: str, count: int) -> array:
+        """Read 32-bit little-endian integers"""
+        values = array(typecode)
+        end = self.pos + count * 4
+        values.frombytes(self.data[self.pos:end])
+        if BIG_ENDIAN:
+            values.byteswap()
+        self.pos = end
+        return values
+
+
+def load_snapshot(blob: bytes) -> Any:
+    """
+    Decode snapshot bytes (tables come back as lists of dicts)
+
+    Args:
+        blob: Bytes from dump_snapshot()
+
+    Returns:
+        Decoded value
+
+    Raises:
+        ValueError: Not a snapshot, written by a newer version, or corrupt
+    """
+    if len(blob) < 6 or not is_snapshot(blob):
+        raise ValueError("Not a TaSched snapshot")
+    version, flags = blob[4], blob[5]
+    if version > SNAPSHOT_VERSION:
+        raise ValueError(f"Snapshot version {version} is newer than supported ({SNAPSHOT_VERSION})")
+
+    try:
+        body = bytes(blob[6:])
+        if flags & FLAG_ZLIB:
+            body = zlib.decompress(body)
+        reader = _Reader(body)
+        reader.string_table()
+        return reader.value()
+    except (zlib.error, IndexError, struct.error) as e:
+        raise ValueError(f"Corrupt snapshot: {e}") from e
+
+
+# ========== Schedules ==========
+
+_defaults: Dict[type, Dict[str, Any]] = {}
+
+
+def _model_defaults(cls: type) -> Dict[str, Any]:
+    """
+    Field values of a model that can be left out of a snapshot
+
+    Only static defaults and empty containers qualify: other factories
+    (ids, today's date, creation time) give a different value whenever
+    they run, so those fields are always stored.
+    """
+    defaults = _defaults.get(cls)
+    if defaults is None:
+        defaults = {}
+        for f in fields(cls):
+            if f.default is not MISSING:
+                defaults[f.name] = f.default
+            elif f.default_factory in (list, dict):
+                defaults[f.name] = f.default_factory()
+        _defaults[cls] = defaults
+    return defaults
+
+
+def _nested_models(cls: type) -> Dict[str, type]:
+    """Nested model (sound profile, display) by field"""
+    return {f.name: f.type for f in fields(cls) if is_dataclass(f.type)}
+
+
+def schedule_to_snapshot(schedule: Schedule, compress: bool = True) -> bytes:
+    """
+    Encode a schedule, keeping only non-default fields
+
+    Args:
+        schedule: Schedule to encode
+        compress: zlib-compress the body
+
+    Returns:
+        Snapshot bytes
+    """
+    data = schedule.to_dict()
+    schedule_defaults = _model_defaults(Schedule)
+    tasks = data.pop('tasks')
+    data = {key: value for key, value in data.items() if value != schedule_defaults.get(key, _ABSENT)}
+
+    if tasks:
+        for task in tasks:
+            if task['remaining_seconds'] == task['duration_seconds']:
+                task['remaining_seconds'] = None  # the default; restored from the duration on load
+        nested = {key: _model_defaults(model) for key, model in _nested_models(Task).items()}
+        data['tasks'] = Table(tasks, _model_defaults(Task), nested)
+        if data.get('task_ids') == [task.id for task in schedule.tasks]:
+            del data['task_ids']  # rebuilt from the tasks on load
+    return dump_snapshot(data, compress)
+
+
+def schedule_from_snapshot(blob: bytes) -> Schedule:
+    """
+    Decode a schedule written by schedule_to_snapshot()
+
+    Raises:
+        ValueError: Not a snapshot, written by a newer version, or corrupt
+    """
+    data = load_snapshot(blob)
+    tasks = data.get('tasks')
+    if tasks:
+        # Complete records take the decoders' fast path
+        tasks = data['tasks'] = _fill(tasks, _model_defaults(Task))
+        for key, model in _nested_models(Task).items():
+            defaults = _model_defaults(model)
+            for task in tasks:
+                value = task.get(key)
+                if value is not None:
+                    task[key] = {**defaults, **value} if value else model()
+        if 'task_ids' not in data:
+            data['task_ids'] = [task['id'] for task in tasks]
+    return Schedule.from_dict(data)
+
+
+def _fill(rows: List[Dict[str, Any]], defaults: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Records with the omitted default values put back (fresh empty containers)"""
+    static = {key: value for key, value in defaults.items() if value.__class__ not in (list, dict)}
+    empty = [key for key, value in defaults.items() if value.__class__ in (list, dict)]
+    rows = [{**static, **row} for row in rows]
+    for key in empty:
+        make = defaults[key].__class__
+        for row in rows:
+            if key not in row:
+                row[key] = make()
+    return rows
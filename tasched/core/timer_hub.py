@@ -0,0 +1,264 @@
+"""
+TaSched - Timer Hub
+One heartbeat for every periodic UI job
+All jobs (scheduler tick, wall clock, ticker frames, auto-dismiss
+timers) are driven from a single after() loop. Aligned jobs fire on
+wall-clock boundaries, so the clock and the countdown change in the
+same frame. Widget updates requested during a frame are coalesced into
+one idle pass. Time spent in each job is recorded for reporting.
+"""
+
+import math
+import time
+import tkinter as tk
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from tasched.constants import TIMER_HUB_FRAME_MS
+
+
+@dataclass
+class TimerJob:
+    """A scheduled callback"""
+    name: str
+    callback: Callable
+    interval_ms: float
+    due: float  # wall-clock time (time.time())
+    periodic: bool
+    aligned: bool
+
+
+class JobStats:
+    """Timing for one job name"""
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def record(self, duration: float):
+        self.calls += 1
+        self.total += duration
+        self.last = duration
+        if duration > self.max:
+            self.max = duration
+
+    def as_dict(self) -> Dict[str, float]:
+        average = (self.total / self.calls) if self.calls else 0.0
+        return {
+            'calls': self.calls,
+            'avg_ms': average * 1000,
+            'max_ms': self.max * 1000,
+            'last_ms': self.last * 1000
+        }
+
+
+class TimerHub:
+    """
+    Central scheduler for periodic and one-shot UI jobs (Tk thread only)
+    """
+
+    def __init__(self, root: tk.Misc, frame_ms: int = TIMER_HUB_FRAME_MS):
+        self.root = root
+        self.frame_ms = frame_ms
+
+        self._jobs: Dict[str, TimerJob] = {}
+        self._heartbeat_id = None
+        self._heartbeat_due = None
+
+        self._redraws: Dict[str, Callable] = {}
+        self._idle_id = None
+
+        self._stats: Dict[str, JobStats] = {}
+        self.frames = 0
+        self._frame_stats = JobStats()
+
+    # ========== Scheduling ==========
+
+    def schedule(self, name: str, callback: Callable, delay_ms: float, aligned: bool = False):
+        """
+        Run a callback once (replaces any job with the same name)
+
+        Args:
+            name: Job name (also the key for cancel() and stats)
+            callback: Function to call
+            delay_ms: Delay in milliseconds
+            aligned: Snap to the nearest wall-clock multiple of delay_ms
+                     (between half and one and a half delays from now)
+        """
+        now = time.time()
+        due = self._aligned_due(now, delay_ms, minimum=delay_ms / 2) if aligned else now + delay_ms / 1000
+        self._add(TimerJob(name, callback, delay_ms, due, periodic=False, aligned=aligned))
+
+    def add_periodic(self, name: str, callback: Callable, interval_ms: float, aligned: bool = True):
+        """
+        Run a callback repeatedly (replaces any job with the same name)
+
+        Args:
+            name: Job name
+            callback: Function to call
+            interval_ms: Interval in milliseconds
+            aligned: Fire on wall-clock multiples of the interval
+        """
+        now = time.time()
+        due = self._aligned_due(now, interval_ms) if aligned else now + interval_ms / 1000
+        self._add(TimerJob(name, callback, interval_ms, due, periodic=True, aligned=aligned))
+
+    def cancel(self, name: str):
+        """Cancel a job by name (no-op if it is not scheduled)"""
+        self._jobs.pop(name, None)
+        self._redraws.pop(name, None)
+
+    def is_scheduled(self, name: str) -> bool:
+        """Check if a job is pending"""
+        return name in self._jobs
+
+    def request_redraw(self, name: str, callback: Callable):
+        """
+        Queue a widget update for the next idle pass
+        Several requests under one name in the same frame run once
+
+        Args:
+            name: Redraw name
+            callback: Function doing the widget updates
+        """
+        self._redraws[name] = callback
+        if self._idle_id is None:
+            self._idle_id = self.root.after_idle(self._flush_redraws)
+
+    def shutdown(self):
+        """Cancel every job and the heartbeat"""
+        self._jobs.clear()
+        self._redraws.clear()
+        for timer_id in (self._heartbeat_id, self._idle_id):
+            if timer_id:
+                try:
+                    self.root.after_cancel(timer_id)
+                except tk.TclError:
+                    pass
+        self._heartbeat_id = None
+        self._heartbeat_due = None
+        self._idle_id = None
+
+    # ========== Instrumentation ==========
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-job timing, plus 'frame' for whole heartbeat frames"""
+        stats = {name: job_stats.as_dict() for name, job_stats in self._stats.items()}
+        stats['frame'] = self._frame_stats.as_dict()
+        return stats
+
+    def report(self) -> str:
+        """Timing table for every job seen so far"""
+        lines = [f"{'job':<32}{'calls':>8}{'avg ms':>10}{'max ms':>10}"]
+        for name, values in sorted(self.get_stats().items()):
+            lines.append(f"{name:<32}{values['calls']:>8}{values['avg_ms']:>10.3f}{values['max_ms']:>10.3f}")
+        return "\n".join(lines)
+
+    # ========== Heartbeat ==========
+
+    def _add(self, job: TimerJob):
+        """Register a job and make sure the heartbeat wakes up for it"""
+        self._jobs[job.name] = job
+        self._arm()
+
+    def _aligned_due(self, now: float, interval_ms: float, minimum: float = 0.0) -> float:
+        """Next wall-clock multiple of the interval at least `minimum` ms away"""
+        interval = interval_ms / 1000
+        return math.floor((now + minimum / 1000) / interval + 1) * interval
+
+    def _arm(self):
+        """Schedule the heartbeat for the earliest due job"""
+        if not self._jobs:
+            return
+
+        next_due = min(job.due for job in self._jobs.values())
+        if self._heartbeat_id is not None and self._heartbeat_due is not None \
+                and self._heartbeat_due <= next_due:
+            return
+
+        if self._heartbeat_id is not None:
+            self.root.after_cancel(self._heartbeat_id)
+
+        delay_ms = max(0, int(math.ceil((next_due - time.time()) * 1000)))
+        self._heartbeat_due = next_due
+        self._heartbeat_id = self.root.after(delay_ms, self._heartbeat)
+
+    def _heartbeat(self):
+        """Run every job due in this frame"""
+        self._heartbeat_id = None
+        self._heartbeat_due = None
+
+        frame_start = time.perf_counter()
+        now = time.time()
+        # Jobs due within half a frame run together
+        horizon = now + self.frame_ms / 2000
+
+        due_jobs: List[TimerJob] = sorted(
+            (job for job in self._jobs.values() if job.due <= horizon),
+            key=lambda job: job.due
+        )
+        for job in due_jobs:
+            # A previous job in this frame may have cancelled or replaced it
+            if self._jobs.get(job.name) is not job:
+                continue
+
+            if job.periodic:
+                if job.aligned:
+                    # From the boundary it ran for, not from now: a job run
+                    # up to half a frame early must not get that boundary again
+                    interval = job.interval_ms / 1000
+                    job.due = self._aligned_due(max(now, job.due + interval / 2), job.interval_ms)
+                else:
+                    job.due = max(job.due + job.interval_ms / 1000, now)
+            else:
+                del self._jobs[job.name]
+
+            self._run(job.name, job.callback)
+
+        self.frames += 1
+        self._frame_stats.record(time.perf_counter() - frame_start)
+        self._arm()
+
+    def _flush_redraws(self):
+        """Run every queued widget update in one idle pass"""
+        self._idle_id = None
+        redraws, self._redraws = self._redraws, {}
+        for name, callback in redraws.items():
+            self._run(f"redraw:{name}", callback)
+
+    def _run(self, name: str, callback: Callable):
+        """Run a callback, timing it and isolating its errors"""
+        started = time.perf_counter()
+        try:
+            callback()
+        except Exception as e:
+            print(f"[TimerHub] Job '{name}' failed: {e}")
+        finally:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = JobStats()
+            stats.record(time.perf_counter() - started)
+
+
+# Global timer hub instance
+_timer_hub = None
+
+
+def get_timer_hub(root: tk.Misc = None) -> TimerHub:
+    """
+    Get or create the global timer hub
+
+    Args:
+        root: Tk root (required on the first call)
+
+    Returns:
+        TimerHub instance
+    """
+    global _timer_hub
+    if _timer_hub is None:
+        if root is None:
+            raise RuntimeError("Timer hub needs a Tk root on first use")
+        _timer_hub = TimerHub(root)
+    return _timer_hub
@@ -90,6 +90,21 @@ class WarningEngine:
 
         return False
 
+    @staticmethod
+    def get_warning_level(task: Task, remaining_seconds: int) -> int:
+        """
+        Get which warning a remaining time corresponds to
+
+        Args:
+            task: The task
+            remaining_seconds: Seconds remaining when the warning fired
+
+        Returns:
+            0 for the first (largest) threshold, 1 for the next, and so on
+        """
+        return sum(1 for threshold in task.get_warning_thresholds()
+                   if threshold > remaining_seconds)
+
     def should_show_warning(self, task: Task, threshold: int) -> bool:
         """
         Check if a warning should be shown for a specific threshold
@@ -0,0 +1,278 @@
+"""
+TaSched - Asset Bundle
+Single indexed archive of images and tones for frozen builds
+The bundle is memory-mapped once; assets are served as memoryview slices
+of the mapping (no per-asset file, no extraction to a temp directory).
+
+Layout (little-endian):
+    header   magic "TSAB", u16 version, u16 reserved, u32 entry count,
+             u64 index offset
+    data     asset bytes, each aligned to 16 bytes
+    index    per entry: u16 name length, u8 asset type, u64 offset,
+             u64 length, then the UTF-8 name
+
+Build with:
+    python -m tasched.services.asset_bundle build [--output PATH]
+"""
+
+import argparse
+import io
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from tasched.constants import (
+    ASSET_BUNDLE_FILE,
+    IMAGES_DIR,
+    SOUNDS_DIR,
+    SOUND_EXTENSIONS,
+    IMAGE_EXTENSIONS
+)
+
+
+BUNDLE_MAGIC = b"TSAB"
+BUNDLE_VERSION = 1
+BUNDLE_ALIGN = 16
+
+_HEADER = struct.Struct("<4sHHIQ")
+_ENTRY = struct.Struct("<HBQQ")
+
+# Asset type codes stored in the index
+ASSET_TYPES = {'image': 1, 'sound': 2}
+_TYPE_NAMES = {code: name for name, code in ASSET_TYPES.items()}
+
+
+class BundleError(Exception):
+    """Raised when a bundle file is missing or malformed"""
+    pass
+
+
+class MemoryviewReader(io.RawIOBase):
+    """
+    Read-only, seekable file object over a memoryview
+    Lets PIL and pygame read bundled assets without extracting them
+    """
+
+    def __init__(self, view: memoryview, name: str = None):
+        self._view = view
+        self._pos = 0
+        self.name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), len(self._view) - self._pos)
+        if size <= 0:
+            return 0
+        buffer[:size] = self._view[self._pos:self._pos + size]
+        self._pos += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._pos + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._pos = position
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class AssetBundle:
+    """
+    Memory-mapped, read-only view of a bundle file
+    """
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        try:
+            stat = os.stat(self.path)
+            self.mtime_ns = stat.st_mtime_ns
+            self._file = open(self.path, 'rb')
+        except OSError as e:
+            raise BundleError(f"Cannot open asset bundle {self.path}: {e}")
+
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            self._file.close()
+            raise BundleError(f"Cannot map asset bundle {self.path}: {e}")
+
+        self._view = memoryview(self._map)
+        # asset type -> normcased name -> (name, offset, length)
+        self._entries: Dict[str, Dict[str, Tuple[str, int, int]]] = {
+            name: {} for name in ASSET_TYPES
+        }
+        try:
+            self._read_index()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_index(self):
+        """Parse the entry index"""
+        if len(self._view) < _HEADER.size:
+            raise BundleError(f"Asset bundle too small: {self.path}")
+
+        magic, version, _, count, index_offset = _HEADER.unpack_from(self._view, 0)
+        if magic != BUNDLE_MAGIC:
+            raise BundleError(f"Not an asset bundle: {self.path}")
+        if version != BUNDLE_VERSION:
+            raise BundleError(f"Unsupported asset bundle version {version}: {self.path}")
+
+        position = index_offset
+        for _ in range(count):
+            name_length, type_code, offset, length = _ENTRY.unpack_from(self._view, position)
+            position += _ENTRY.size
+            name = bytes(self._view[position:position + name_length]).decode('utf-8')
+            position += name_length
+
+            if offset + length > index_offset:
+                raise BundleError(f"Corrupt entry '{name}' in {self.path}")
+            asset_type = _TYPE_NAMES.get(type_code)
+            if asset_type:
+                self._entries[asset_type][os.path.normcase(name)] = (name, offset, length)
+
+    def find(self, filename: str, asset_type: str) -> Optional[str]:
+        """
+        Look up an asset
+
+        Returns:
+            Stored asset name, or None if the bundle does not contain it
+        """
+        entry = self._entries.get(asset_type, {}).get(os.path.normcase(filename))
+        return entry[0] if entry else None
+
+    def names(self, asset_type: str) -> List[str]:
+        """Sorted asset names of one type"""
+        return sorted(entry[0] for entry in self._entries.get(asset_type, {}).values())
+
+    def get_view(self, filename: str, asset_type: str) -> memoryview:
+        """
+        Get an asset's bytes as a zero-copy slice of the mapping
+
+        Raises:
+            KeyError: If the asset is not in the bundle
+        """
+        _, offset, length = self._entries[asset_type][os.path.normcase(filename)]
+        return self._view[offset:offset + length]
+
+    def open(self, filename: str, asset_type: str) -> MemoryviewReader:
+        """Open an asset as a read-only file object"""
+        return MemoryviewReader(self.get_view(filename, asset_type), name=filename)
+
+    def get_size(self, filename: str, asset_type: str) -> int:
+        """Get an asset's size in bytes"""
+        return self._entries[asset_type][os.path.normcase(filename)][2]
+
+    def close(self):
+        """Release the mapping"""
+        try:
+            self._view.release()
+            self._map.close()
+        except (BufferError, ValueError):
+            # Readers still hold slices; the mapping is freed with them
+            pass
+        self._file.close()
+
+
+def build_bundle(output_path: str, sources: Dict[str, str]) -> int:
+    """
+    Write a bundle from asset directories
+
+    Args:
+        output_path: Bundle file to write
+        sources: asset type ('image' or 'sound') -> directory
+
+    Returns:
+        Number of assets written
+    """
+    extensions = {'image': IMAGE_EXTENSIONS, 'sound': SOUND_EXTENSIONS}
+    files: List[Tuple[str, Path]] = []
+    for asset_type, directory in sources.items():
+        directory = Path(directory)
+        if not directory.is_dir():
+            continue
+        for file_path in sorted(directory.iterdir()):
+            if file_path.is_file() and file_path.suffix.lower() in extensions[asset_type]:
+                files.append((asset_type, file_path))
+
+    output_path = Path(output_path)
+    tmp_path = output_path.with_suffix(".tmp")
+    entries = []
+    with open(tmp_path, 'wb') as out:
+        out.write(b"\0" * _HEADER.size)
+        for asset_type, file_path in files:
+            padding = -out.tell() % BUNDLE_ALIGN
+            out.write(b"\0" * padding)
+            offset = out.tell()
+            data = file_path.read_bytes()
+            out.write(data)
+            entries.append((file_path.name, ASSET_TYPES[asset_type], offset, len(data)))
+
+        index_offset = out.tell()
+        for name, type_code, offset, length in entries:
+            encoded = name.encode('utf-8')
+            out.write(_ENTRY.pack(len(encoded), type_code, offset, length))
+            out.write(encoded)
+
+        out.seek(0)
+        out.write(_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, 0, len(entries), index_offset))
+    os.replace(tmp_path, output_path)
+
+    return len(entries)
+
+
+def main(argv: List[str] = None) -> int:
+    """Command line entry point"""
+    from tasched.services.resource_service import get_resource_service
+
+    resource = get_resource_service()
+    parser = argparse.ArgumentParser(description="TaSched asset bundle tool")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="pack images and tones into one bundle")
+    build.add_argument("--output", default=str(resource.base_path / ASSET_BUNDLE_FILE))
+    build.add_argument("--images", default=str(resource.base_path / IMAGES_DIR))
+    build.add_argument("--sounds", default=str(resource.base_path / SOUNDS_DIR))
+
+    listing = commands.add_parser("list", help="show the contents of a bundle")
+    listing.add_argument("bundle", nargs="?", default=str(resource.base_path / ASSET_BUNDLE_FILE))
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        count = build_bundle(args.output, {'image': args.images, 'sound': args.sounds})
+        size = os.path.getsize(args.output)
+        print(f"Wrote {count} assets ({size:,} bytes) to {args.output}")
+        return 0
+
+    try:
+        bundle = AssetBundle(args.bundle)
+    except BundleError as e:
+        print(e)
+        return 1
+    for asset_type in ASSET_TYPES:
+        for name in bundle.names(asset_type):
+            print(f"{asset_type:<6} {bundle.get_size(name, asset_type):>12,}  {name}")
+    bundle.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
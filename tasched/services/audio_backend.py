@@ -0,0 +1,436 @@
+"""
+TaSched - Audio Backends
+Thin mixer interface used by the audio worker, sound cache and tone cache
+PygameBackend drives pygame.mixer (optionally through SDL's dummy driver);
+NullBackend is an in-process sink that records every mixer call with a
+timestamp, so audio paths can run and be timed without a sound card.
+Select with the TASCHED_AUDIO_BACKEND environment variable.
+"""
+
+import os
+import threading
+import time
+import wave
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from tasched.constants import (
+    AUDIO_FREQUENCY,
+    AUDIO_SIZE,
+    AUDIO_CHANNELS,
+    AUDIO_BACKEND_ENV,
+    AUDIO_BACKEND_PYGAME,
+    AUDIO_BACKEND_DUMMY,
+    AUDIO_BACKEND_NULL
+)
+from tasched.services.resource_service import get_resource_service
+
+
+class AudioBackend:
+    """
+    Base class for mixer backends
+    All methods are called from the audio worker thread, except the
+    decoding helpers which the tone cache may call from its own thread
+    """
+
+    name = "base"
+
+    @staticmethod
+    def _open_source(path: str):
+        """File path for loose files, file object for bundled assets"""
+        resource = get_resource_service()
+        return resource.open_asset(path) if resource.is_bundled(path) else path
+
+    # ========== Lifecycle ==========
+
+    def init(self, frequency: int, size: int, channels: int, buffer: int, reserved_channels: int):
+        """Open the output device (raise on failure)"""
+        raise NotImplementedError
+
+    def get_format(self) -> Optional[Tuple[int, int, int]]:
+        """Get the (frequency, size, channels) the mixer runs at, or None if closed"""
+        raise NotImplementedError
+
+    def quit(self):
+        """Close the output device"""
+        raise NotImplementedError
+
+    # ========== Sounds ==========
+
+    def load_sound(self, path: str) -> Any:
+        """Decode a sound file (raise on failure)"""
+        raise NotImplementedError
+
+    def sound_from_buffer(self, raw: bytes) -> Any:
+        """Build a sound from raw PCM in mixer format"""
+        raise NotImplementedError
+
+    def sound_length(self, sound: Any) -> float:
+        """Get a sound's length in seconds"""
+        raise NotImplementedError
+
+    def sound_raw(self, sound: Any) -> bytes:
+        """Get a sound's raw PCM in mixer format"""
+        raise NotImplementedError
+
+    # ========== Alert Channels ==========
+
+    def play_channel(self, channel_id: int, sound: Any, volume: float):
+        """Play a sound on a reserved channel"""
+        raise NotImplementedError
+
+    def set_channel_volume(self, channel_id: int, volume: float):
+        """Set a channel's volume"""
+        raise NotImplementedError
+
+    def stop_channel(self, channel_id: int):
+        """Stop a channel"""
+        raise NotImplementedError
+
+    def fadeout_channel(self, channel_id: int, duration_ms: int):
+        """Fade a channel out"""
+        raise NotImplementedError
+
+    def channel_busy(self, channel_id: int) -> bool:
+        """Check if a channel is playing"""
+        raise NotImplementedError
+
+    # ========== Music Stream ==========
+
+    def play_music(self, path: str, volume: float, loop: bool):
+        """Load and stream a file"""
+        raise NotImplementedError
+
+    def set_music_volume(self, volume: float):
+        """Set the stream volume"""
+        raise NotImplementedError
+
+    def stop_music(self):
+        """Stop and unload the stream"""
+        raise NotImplementedError
+
+    def fadeout_music(self, duration_ms: int):
+        """Fade the stream out"""
+        raise NotImplementedError
+
+    def music_busy(self) -> bool:
+        """Check if the stream is playing"""
+        raise NotImplementedError
+
+    # ========== Global ==========
+
+    def pause(self):
+        """Pause all output"""
+        raise NotImplementedError
+
+    def unpause(self):
+        """Resume all output"""
+        raise NotImplementedError
+
+
+class PygameBackend(AudioBackend):
+    """
+    pygame.mixer backend
+    pygame is imported on first use so the null backend never needs it
+    """
+
+    name = AUDIO_BACKEND_PYGAME
+
+    def __init__(self, driver: str = None):
+        self.driver = driver
+        self._pygame = None
+        self._music_source = None
+
+    @property
+    def pygame(self):
+        """The pygame module (imported lazily)"""
+        if self._pygame is None:
+            import pygame
+            self._pygame = pygame
+        return self._pygame
+
+    def init(self, frequency: int, size: int, channels: int, buffer: int, reserved_channels: int):
+        if self.driver:
+            # Must be set before SDL opens the audio subsystem
+            os.environ['SDL_AUDIODRIVER'] = self.driver
+        self.pygame.mixer.init(frequency=frequency, size=size, channels=channels, buffer=buffer)
+        # Keep alert channels out of pygame's automatic channel allocation
+        self.pygame.mixer.set_reserved_channels(reserved_channels)
+
+    def get_format(self) -> Optional[Tuple[int, int, int]]:
+        return self.pygame.mixer.get_init()
+
+    def quit(self):
+        self.pygame.mixer.quit()
+
+    def load_sound(self, path: str):
+        return self.pygame.mixer.Sound(self._open_source(path))
+
+    def sound_from_buffer(self, raw: bytes):
+        return self.pygame.mixer.Sound(buffer=raw)
+
+    def sound_length(self, sound) -> float:
+        return sound.get_length()
+
+    def sound_raw(self, sound) -> bytes:
+        return sound.get_raw()
+
+    def play_channel(self, channel_id: int, sound, volume: float):
+        channel = self.pygame.mixer.Channel(channel_id)
+        channel.set_volume(volume)
+        channel.play(sound)
+
+    def set_channel_volume(self, channel_id: int, volume: float):
+        self.pygame.mixer.Channel(channel_id).set_volume(volume)
+
+    def stop_channel(self, channel_id: int):
+        self.pygame.mixer.Channel(channel_id).stop()
+
+    def fadeout_channel(self, channel_id: int, duration_ms: int):
+        self.pygame.mixer.Channel(channel_id).fadeout(duration_ms)
+
+    def channel_busy(self, channel_id: int) -> bool:
+        return self.pygame.mixer.Channel(channel_id).get_busy()
+
+    def play_music(self, path: str, volume: float, loop: bool):
+        music = self.pygame.mixer.music
+        source = self._open_source(path)
+        if isinstance(source, str):
+            music.load(source)
+        else:
+            # The stream reads from the file object while playing
+            music.load(source, os.path.splitext(path)[1].lstrip('.'))
+        self._music_source = source
+        music.set_volume(volume)
+        music.play(loops=-1 if loop else 0)
+
+    def set_music_volume(self, volume: float):
+        self.pygame.mixer.music.set_volume(volume)
+
+    def stop_music(self):
+        self.pygame.mixer.music.stop()
+        self.pygame.mixer.music.unload()
+        self._music_source = None
+
+    def fadeout_music(self, duration_ms: int):
+        self.pygame.mixer.music.fadeout(duration_ms)
+
+    def music_busy(self) -> bool:
+        return self.pygame.mixer.music.get_busy()
+
+    def pause(self):
+        self.pygame.mixer.pause()
+        self.pygame.mixer.music.pause()
+
+    def unpause(self):
+        self.pygame.mixer.unpause()
+        self.pygame.mixer.music.unpause()
+
+
+@dataclass
+class NullSound:
+    """Sound held by the null backend"""
+    source: str
+    raw: bytes = b""
+    length: float = 0.0
+
+
+@dataclass
+class BackendEvent:
+    """One recorded mixer call"""
+    timestamp: float  # time.perf_counter()
+    action: str
+    detail: Dict[str, Any] = field(default_factory=dict)
+
+
+class NullBackend(AudioBackend):
+    """
+    In-process sink that records mixer calls instead of producing sound
+    Sounds "play" for their real length so busy checks and ducking behave
+    as they would on hardware. WAV files are read for their samples;
+    other formats are accepted with an unknown (zero) length.
+    """
+
+    name = AUDIO_BACKEND_NULL
+
+    def __init__(self):
+        self.events: List[BackendEvent] = []
+        self._format: Optional[Tuple[int, int, int]] = None
+        self._channel_ends: Dict[int, float] = {}
+        self._music_playing = False
+        self._played = threading.Event()
+        self._lock = threading.Lock()
+
+    # ========== Recording ==========
+
+    def _record(self, action: str, **detail):
+        with self._lock:
+            self.events.append(BackendEvent(time.perf_counter(), action, detail))
+
+    def get_events(self, action: str = None) -> List[BackendEvent]:
+        """Get recorded events, optionally only one action"""
+        with self._lock:
+            return [e for e in self.events if action is None or e.action == action]
+
+    def reset(self):
+        """Forget recorded events"""
+        with self._lock:
+            self.events.clear()
+            self._played.clear()
+
+    def wait_for_play(self, timeout: float = None) -> Optional[BackendEvent]:
+        """
+        Block until a sound has been queued for output
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            The first play event since the last reset, or None on timeout
+        """
+        if not self._played.wait(timeout):
+            return None
+        plays = [e for e in self.get_events() if e.action in ("play_channel", "play_music")]
+        return plays[0] if plays else None
+
+    # ========== Lifecycle ==========
+
+    def init(self, frequency: int, size: int, channels: int, buffer: int, reserved_channels: int):
+        self._format = (frequency, size, channels)
+        self._record("init", frequency=frequency, size=size, channels=channels, buffer=buffer)
+
+    def get_format(self) -> Optional[Tuple[int, int, int]]:
+        return self._format
+
+    def quit(self):
+        self._format = None
+        self._channel_ends.clear()
+        self._music_playing = False
+        self._record("quit")
+
+    # ========== Sounds ==========
+
+    def load_sound(self, path: str) -> NullSound:
+        if not get_resource_service().asset_available(path):
+            raise FileNotFoundError(path)
+
+        raw = b""
+        if path.lower().endswith(".wav"):
+            with wave.open(self._open_source(path), 'rb') as wav:
+                raw = wav.readframes(wav.getnframes())
+        self._record("load_sound", path=path)
+        return NullSound(source=path, raw=raw, length=self._length(raw))
+
+    def sound_from_buffer(self, raw: bytes) -> NullSound:
+        return NullSound(source="<buffer>", raw=bytes(raw), length=self._length(raw))
+
+    def sound_length(self, sound: NullSound) -> float:
+        return sound.length
+
+    def sound_raw(self, sound: NullSound) -> bytes:
+        return sound.raw
+
+    def _length(self, raw: bytes) -> float:
+        frequency, size, channels = self._format or (AUDIO_FREQUENCY, AUDIO_SIZE, AUDIO_CHANNELS)
+        bytes_per_second = frequency * channels * (abs(size) // 8)
+        return len(raw) / bytes_per_second
+
+    # ========== Alert Channels ==========
+
+    def play_channel(self, channel_id: int, sound: NullSound, volume: float):
+        self._channel_ends[channel_id] = time.monotonic() + sound.length
+        self._record("play_channel", channel=channel_id, source=sound.source, volume=volume)
+        self._played.set()
+
+    def set_channel_volume(self, channel_id: int, volume: float):
+        self._record("set_channel_volume", channel=channel_id, volume=volume)
+
+    def stop_channel(self, channel_id: int):
+        self._channel_ends.pop(channel_id, None)
+
+    def fadeout_channel(self, channel_id: int, duration_ms: int):
+        if self.channel_busy(channel_id):
+            self._channel_ends[channel_id] = time.monotonic() + duration_ms / 1000.0
+
+    def channel_busy(self, channel_id: int) -> bool:
+        return self._channel_ends.get(channel_id, 0.0) > time.monotonic()
+
+    # ========== Music Stream ==========
+
+    def play_music(self, path: str, volume: float, loop: bool):
+        if not get_resource_service().asset_available(path):
+            raise FileNotFoundError(path)
+        self._music_playing = True
+        self._record("play_music", source=path, volume=volume, loop=loop)
+        self._played.set()
+
+    def set_music_volume(self, volume: float):
+        self._record("set_music_volume", volume=volume)
+
+    def stop_music(self):
+        self._music_playing = False
+
+    def fadeout_music(self, duration_ms: int):
+        self._music_playing = False
+
+    def music_busy(self) -> bool:
+        return self._music_playing
+
+    # ========== Global ==========
+
+    def pause(self):
+        self._record("pause")
+
+    def unpause(self):
+        self._record("unpause")
+
+
+def create_audio_backend(name: str = None) -> AudioBackend:
+    """
+    Create a backend by name
+
+    Args:
+        name: "pygame", "dummy" (pygame on SDL's dummy driver) or "null";
+              defaults to the TASCHED_AUDIO_BACKEND environment variable,
+              then "pygame"
+
+    Returns:
+        AudioBackend instance
+    """
+    name = (name or os.environ.get(AUDIO_BACKEND_ENV) or AUDIO_BACKEND_PYGAME).lower()
+
+    if name == AUDIO_BACKEND_NULL:
+        return NullBackend()
+    if name == AUDIO_BACKEND_DUMMY:
+        return PygameBackend(driver="dummy")
+    if name != AUDIO_BACKEND_PYGAME:
+        print(f"[AudioBackend] Unknown backend '{name}', using pygame")
+    return PygameBackend()
+
+
+# Global audio backend instance
+_audio_backend = None
+
+
+def get_audio_backend() -> AudioBackend:
+    """
+    Get or create the global audio backend instance
+
+    Returns:
+        AudioBackend instance
+    """
+    global _audio_backend
+    if _audio_backend is None:
+        _audio_backend = create_audio_backend()
+    return _audio_backend
+
+
+def set_audio_backend(backend: AudioBackend):
+    """
+    Replace the global audio backend (call before the audio service starts)
+
+    Args:
+        backend: Backend instance
+    """
+    global _audio_backend
+    _audio_backend = backend
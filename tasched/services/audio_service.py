@@ -1,48 +1,279 @@
 """
 TaSched - Audio Service
-Sound playback using pygame.mixer with proper overlap prevention
+Sound playback with proper overlap prevention
+Alert tones play from pre-decoded sounds on reserved channels;
+pygame.mixer.music streaming is kept for long background tracks and
+is ducked under alerts with a gain envelope instead of being stopped.
+All mixer work runs on a dedicated audio worker thread fed by a
+command queue, so file loads and mixer errors never stall the UI.
+Mixer calls go through an AudioBackend (pygame by default, or a
+recording null backend for headless runs and benchmarks).
 """
 
-import pygame
 import os
-from typing import Optional
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional, Tuple
 from tasched.constants import (
     AUDIO_FREQUENCY,
     AUDIO_SIZE,
     AUDIO_CHANNELS,
-    AUDIO_BUFFER
+    AUDIO_BUFFER,
+    AUDIO_CHANNEL_WARNING,
+    AUDIO_CHANNEL_TIMEUP,
+    AUDIO_RESERVED_CHANNELS,
+    AUDIO_DUCK_LEVEL,
+    AUDIO_DUCK_ATTACK_MS,
+    AUDIO_DUCK_RELEASE_MS,
+    AUDIO_DUCK_POLL_MS,
+    AUDIO_ENVELOPE_STEP_MS
 )
+from tasched.services.audio_backend import AudioBackend, get_audio_backend
+from tasched.services.resource_service import get_resource_service
+from tasched.services.sound_cache import SoundCache
+from tasched.services.tone_cache import get_tone_cache
+from tasched.services.tone_synth import (
+    TIMEUP_TONE_KEY,
+    is_synth_tone,
+    warning_tone_key,
+    render_tone
+)
+
+
+# Audio command actions
+CMD_PLAY_ALERT = "play_alert"
+CMD_PLAY_MUSIC = "play_music"
+CMD_STOP = "stop"
+CMD_STOP_ALERTS = "stop_alerts"
+CMD_STOP_MUSIC = "stop_music"
+CMD_FADEOUT = "fadeout"
+CMD_VOLUME = "volume"
+CMD_PAUSE = "pause"
+CMD_UNPAUSE = "unpause"
+CMD_PRELOAD = "preload"
+CMD_SHUTDOWN = "shutdown"
+
+# Reserved mixer channels used for alert tones
+ALERT_CHANNELS = (AUDIO_CHANNEL_WARNING, AUDIO_CHANNEL_TIMEUP)
+
+# State events reported to listeners
+AUDIO_EVENT_READY = "ready"
+AUDIO_EVENT_UNAVAILABLE = "unavailable"
+AUDIO_EVENT_PLAYING = "playing"
+AUDIO_EVENT_STOPPED = "stopped"
+AUDIO_EVENT_ERROR = "error"
+
+
+@dataclass
+class AudioCommand:
+    """A single request for the audio worker"""
+    action: str
+    sound_path: Optional[str] = None
+    channel_id: Optional[int] = None
+    loop: bool = False
+    value: Optional[float] = None
+    paths: Tuple[str, ...] = ()
+
+
+class GainEnvelope:
+    """
+    Linear gain ramp evaluated against a monotonic clock
+    Used to duck the background stream smoothly under alerts
+    """
+
+    def __init__(self, gain: float = 1.0):
+        self.gain = gain
+        self.target = gain
+        self._start_gain = gain
+        self._start_time = 0.0
+        self._duration = 0.0
+
+    @property
+    def active(self) -> bool:
+        """True while the envelope is still ramping"""
+        return self.gain != self.target
+
+    def ramp_to(self, target: float, duration_ms: int, now: float = None):
+        """
+        Start a ramp from the current gain to a new target
+
+        Args:
+            target: Target gain (0.0 to 1.0)
+            duration_ms: Ramp duration in milliseconds
+            now: Current monotonic time (defaults to time.monotonic())
+        """
+        now = time.monotonic() if now is None else now
+        self._start_gain = self.gain
+        self._start_time = now
+        self._duration = max(0.0, duration_ms / 1000.0)
+        self.target = target
+        if self._duration == 0.0:
+            self.gain = target
+
+    def step(self, now: float = None) -> float:
+        """
+        Advance the envelope to the given time
+
+        Args:
+            now: Current monotonic time (defaults to time.monotonic())
+
+        Returns:
+            Current gain
+        """
+        if not self.active:
+            return self.gain
+
+        now = time.monotonic() if now is None else now
+        progress = (now - self._start_time) / self._duration
+        if progress >= 1.0:
+            self.gain = self.target
+        else:
+            self.gain = self._start_gain + (self.target - self._start_gain) * progress
+        return self.gain
+
+
+def coalesce_commands(commands: List[AudioCommand]) -> List[AudioCommand]:
+    """
+    Drop commands made redundant by later ones in the same batch
+
+    Rules:
+        - Only the last volume change is applied
+        - A stop cancels any earlier play/fade/stop still pending
+        - A later alert replaces an earlier pending alert (alerts never overlap)
+        - A later music request replaces earlier pending music requests
+        - stop immediately followed by a play keeps only the part of the stop
+          that the play does not already do itself
+
+    Args:
+        commands: Commands in the order they were queued
+
+    Returns:
+        Reduced command list, still in queue order
+    """
+    output: List[AudioCommand] = []
+
+    def drop(*actions):
+        output[:] = [c for c in output if c.action not in actions]
+
+    for command in commands:
+        action = command.action
+
+        if action == CMD_VOLUME:
+            drop(CMD_VOLUME)
+        elif action == CMD_STOP:
+            drop(CMD_PLAY_ALERT, CMD_PLAY_MUSIC, CMD_FADEOUT,
+                 CMD_STOP, CMD_STOP_ALERTS, CMD_STOP_MUSIC)
+        elif action in (CMD_PLAY_ALERT, CMD_STOP_ALERTS):
+            drop(CMD_PLAY_ALERT, CMD_STOP_ALERTS)
+            if action == CMD_PLAY_ALERT and output and output[-1].action == CMD_STOP:
+                # The alert stops the alert channels itself
+                output[-1] = AudioCommand(CMD_STOP_MUSIC)
+        elif action in (CMD_PLAY_MUSIC, CMD_STOP_MUSIC):
+            drop(CMD_PLAY_MUSIC, CMD_STOP_MUSIC)
+            if action == CMD_PLAY_MUSIC and output and output[-1].action == CMD_STOP:
+                # Loading new music stops the old track itself
+                output[-1] = AudioCommand(CMD_STOP_ALERTS)
+        elif action in (CMD_PAUSE, CMD_UNPAUSE):
+            drop(CMD_PAUSE, CMD_UNPAUSE)
+
+        output.append(command)
+
+    return output
 
 
 class AudioService:
     """
-    Manages audio playback with pygame.mixer
+    Manages audio playback through an audio backend
     Prevents sound overlap and handles graceful failures
+
+    Public methods only queue commands and return immediately; the
+    audio worker thread executes them and reports state changes to
+    listeners registered with add_state_listener().
     """
 
-    def __init__(self):
+    def __init__(self, backend: AudioBackend = None):
+        self.backend = backend or get_audio_backend()
         self.initialized = False
         self.enabled = True
         self.volume = 0.7
         self.current_sound = None
-        self._initialize()
+        self.sound_cache = SoundCache(backend=self.backend)
+        self.tone_cache = get_tone_cache()
+
+        self.duck_envelope = GainEnvelope()
+        self._channel_gain = {}
+        self._ducked = False
+
+        self._commands: "queue.Queue[AudioCommand]" = queue.Queue()
+        self._listeners: List[Callable] = []
+        self._ready = threading.Event()
+        self._worker = threading.Thread(target=self._run, name="AudioWorker", daemon=True)
+        self._worker.start()
 
     def _initialize(self):
-        """Initialize pygame mixer"""
+        """Initialize the mixer backend (runs on the audio worker)"""
         try:
-            # Initialize pygame mixer
-            pygame.mixer.init(
+            self.backend.init(
                 frequency=AUDIO_FREQUENCY,
                 size=AUDIO_SIZE,
                 channels=AUDIO_CHANNELS,
-                buffer=AUDIO_BUFFER
+                buffer=AUDIO_BUFFER,
+                reserved_channels=AUDIO_RESERVED_CHANNELS
             )
             self.initialized = True
-            print("[AudioService] Pygame mixer initialized successfully")
+            print(f"[AudioService] Mixer initialized successfully ({self.backend.name} backend)")
+            self._notify(AUDIO_EVENT_READY)
         except Exception as e:
             print(f"[AudioService] Failed to initialize mixer: {e}")
             self.initialized = False
             self.enabled = False
+            self._notify(AUDIO_EVENT_UNAVAILABLE, message=str(e))
+        finally:
+            self._ready.set()
+
+    # ========== State Listeners ==========
+
+    def add_state_listener(self, callback: Callable):
+        """
+        Register a state listener
+
+        Listeners are called on the audio worker thread; UI code must
+        marshal back to Tk with root.after() before touching widgets.
+
+        Args:
+            callback: Signature: callback(event, sound_path=None, message=None)
+        """
+        self._listeners.append(callback)
+
+    def remove_state_listener(self, callback: Callable):
+        """Unregister a state listener"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def wait_until_ready(self, timeout: float = None) -> bool:
+        """
+        Block until the mixer has finished initializing (or failed to)
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the mixer is initialized
+        """
+        self._ready.wait(timeout)
+        return self.initialized
+
+    def _notify(self, event: str, sound_path: str = None, message: str = None):
+        """Report a state change to listeners"""
+        for callback in list(self._listeners):
+            try:
+                callback(event, sound_path=sound_path, message=message)
+            except Exception as e:
+                print(f"[AudioService] State listener failed: {e}")
+
+    # ========== Public API (queues commands) ==========
 
     def set_volume(self, volume: float):
         """
@@ -52,8 +283,7 @@ class AudioService:
             volume: Volume level (0.0 to 1.0)
         """
         self.volume = max(0.0, min(1.0, volume))
-        if self.initialized:
-            pygame.mixer.music.set_volume(self.volume)
+        self._submit(AudioCommand(CMD_VOLUME, value=self.volume))
 
     def enable(self):
         """Enable audio playback"""
@@ -64,44 +294,30 @@ class AudioService:
         self.enabled = False
         self.stop()
 
+    def preload_sounds(self, sound_paths: Iterable[str]):
+        """
+        Decode sounds ahead of time so the first alert plays instantly
+
+        Args:
+            sound_paths: Paths to the sound files
+        """
+        self._submit(AudioCommand(CMD_PRELOAD, paths=tuple(sound_paths)))
+
     def play_sound(self, sound_path: str, loop: bool = False) -> bool:
         """
-        Play a sound file
+        Stream a sound file on the background music stream
 
         Args:
             sound_path: Path to the sound file
             loop: If True, loop the sound indefinitely
 
         Returns:
-            True if sound started playing, False otherwise
+            True if the request was queued, False if audio is off
         """
-        if not self.enabled or not self.initialized:
-            return False
-
-        if not sound_path or not os.path.exists(sound_path):
-            print(f"[AudioService] Sound file not found: {sound_path}")
-            return False
-
-        try:
-            # Stop any currently playing sound
-            self.stop()
-
-            # Load and play the new sound
-            pygame.mixer.music.load(sound_path)
-            pygame.mixer.music.set_volume(self.volume)
-
-            if loop:
-                pygame.mixer.music.play(loops=-1)  # Loop indefinitely
-            else:
-                pygame.mixer.music.play()
-
-            self.current_sound = sound_path
-            print(f"[AudioService] Playing: {os.path.basename(sound_path)}")
-            return True
-
-        except Exception as e:
-            print(f"[AudioService] Error playing sound: {e}")
+        if not self.enabled:
             return False
+        self._submit(AudioCommand(CMD_PLAY_MUSIC, sound_path=sound_path, loop=loop))
+        return True
 
     def play_warning_sound(self, sound_path: str) -> bool:
         """
@@ -111,9 +327,9 @@ class AudioService:
             sound_path: Path to the warning sound
 
         Returns:
-            True if sound started playing, False otherwise
+            True if the request was queued, False if audio is off
         """
-        return self.play_sound(sound_path, loop=False)
+        return self._queue_alert(sound_path, AUDIO_CHANNEL_WARNING)
 
     def play_timeup_sound(self, sound_path: str) -> bool:
         """
@@ -123,9 +339,30 @@ class AudioService:
             sound_path: Path to the time-up sound
 
         Returns:
-            True if sound started playing, False otherwise
+            True if the request was queued, False if audio is off
+        """
+        return self._queue_alert(sound_path, AUDIO_CHANNEL_TIMEUP)
+
+    def play_synth_warning(self, level: int = 0) -> bool:
+        """
+        Play the synthesised warning pattern for a warning level
+
+        Args:
+            level: 0 for the first (earliest) warning, increasing towards time-up
+
+        Returns:
+            True if the request was queued, False if audio is off
+        """
+        return self._queue_alert(warning_tone_key(level), AUDIO_CHANNEL_WARNING)
+
+    def play_synth_timeup(self) -> bool:
+        """
+        Play the synthesised time-up pattern
+
+        Returns:
+            True if the request was queued, False if audio is off
         """
-        return self.play_sound(sound_path, loop=False)
+        return self._queue_alert(TIMEUP_TONE_KEY, AUDIO_CHANNEL_TIMEUP)
 
     def play_background_music(self, sound_path: str) -> bool:
         """
@@ -135,35 +372,38 @@ class AudioService:
             sound_path: Path to the background music
 
         Returns:
-            True if music started playing, False otherwise
+            True if the request was queued, False if audio is off
         """
         return self.play_sound(sound_path, loop=True)
 
     def stop(self):
         """Stop currently playing sound"""
-        if self.initialized:
-            try:
-                pygame.mixer.music.stop()
-                pygame.mixer.music.unload()
-                self.current_sound = None
-            except Exception as e:
-                print(f"[AudioService] Error stopping sound: {e}")
+        self._submit(AudioCommand(CMD_STOP))
+
+    def stop_alerts(self):
+        """Stop alert tones, leaving background music playing"""
+        self._submit(AudioCommand(CMD_STOP_ALERTS))
+
+    def stop_background_music(self):
+        """Stop background music, leaving alert tones playing"""
+        self._submit(AudioCommand(CMD_STOP_MUSIC))
 
     def pause(self):
         """Pause currently playing sound"""
-        if self.initialized:
-            try:
-                pygame.mixer.music.pause()
-            except Exception as e:
-                print(f"[AudioService] Error pausing sound: {e}")
+        self._submit(AudioCommand(CMD_PAUSE))
 
     def unpause(self):
         """Resume paused sound"""
-        if self.initialized:
-            try:
-                pygame.mixer.music.unpause()
-            except Exception as e:
-                print(f"[AudioService] Error resuming sound: {e}")
+        self._submit(AudioCommand(CMD_UNPAUSE))
+
+    def fadeout(self, duration_ms: int = 1000):
+        """
+        Fade out current sound
+
+        Args:
+            duration_ms: Fade out duration in milliseconds
+        """
+        self._submit(AudioCommand(CMD_FADEOUT, value=duration_ms))
 
     def is_playing(self) -> bool:
         """
@@ -175,29 +415,214 @@ class AudioService:
         if not self.initialized:
             return False
         try:
-            return pygame.mixer.music.get_busy()
+            if self.backend.music_busy():
+                return True
+            return self._alerts_busy()
         except Exception:
             return False
 
-    def fadeout(self, duration_ms: int = 1000):
+    def cleanup(self):
+        """Clean up audio resources"""
+        if self._worker.is_alive():
+            self._commands.put(AudioCommand(CMD_SHUTDOWN))
+            self._worker.join(timeout=2.0)
+
+    def _queue_alert(self, sound_path: str, channel_id: int) -> bool:
+        """Queue a one-shot alert on a reserved channel"""
+        if not self.enabled:
+            return False
+        self._submit(AudioCommand(CMD_PLAY_ALERT, sound_path=sound_path, channel_id=channel_id))
+        return True
+
+    def _submit(self, command: AudioCommand):
+        """Hand a command to the audio worker"""
+        self._commands.put(command)
+
+    # ========== Audio Worker ==========
+
+    def _run(self):
+        """Audio worker loop - initializes the mixer, then executes commands"""
+        self._initialize()
+
+        running = True
+        while running:
+            try:
+                batch = [self._commands.get(timeout=self._envelope_wait())]
+            except queue.Empty:
+                self._service_envelope()
+                continue
+
+            while True:
+                try:
+                    batch.append(self._commands.get_nowait())
+                except queue.Empty:
+                    break
+
+            for command in coalesce_commands(batch):
+                if command.action == CMD_SHUTDOWN:
+                    running = False
+                    break
+                if self.initialized:
+                    self._execute(command)
+
+            self._service_envelope()
+
+        self._shutdown_mixer()
+
+    def _execute(self, command: AudioCommand):
+        """Execute one command on the worker thread"""
+        action = command.action
+        try:
+            if action == CMD_PLAY_ALERT:
+                self._play_alert(command.sound_path, command.channel_id)
+            elif action == CMD_PLAY_MUSIC:
+                self._play_music(command.sound_path, command.loop)
+            elif action == CMD_STOP:
+                self._stop_alerts()
+                self._stop_music()
+                self.current_sound = None
+                self._notify(AUDIO_EVENT_STOPPED)
+            elif action == CMD_STOP_ALERTS:
+                self._stop_alerts()
+            elif action == CMD_STOP_MUSIC:
+                self._stop_music()
+            elif action == CMD_FADEOUT:
+                self.backend.fadeout_music(int(command.value))
+                for channel_id in ALERT_CHANNELS:
+                    self.backend.fadeout_channel(channel_id, int(command.value))
+            elif action == CMD_VOLUME:
+                self.backend.set_music_volume(command.value * self.duck_envelope.gain)
+                for channel_id in ALERT_CHANNELS:
+                    self.backend.set_channel_volume(channel_id, self._alert_volume(channel_id))
+            elif action == CMD_PAUSE:
+                self.backend.pause()
+            elif action == CMD_UNPAUSE:
+                self.backend.unpause()
+            elif action == CMD_PRELOAD:
+                self.sound_cache.preload(self.tone_cache.resolve(path) for path in command.paths)
+        except Exception as e:
+            print(f"[AudioService] Error during {action}: {e}")
+            self._notify(AUDIO_EVENT_ERROR, sound_path=command.sound_path, message=str(e))
+
+    def _play_music(self, sound_path: str, loop: bool):
+        """Stream a file on the background music stream"""
+        if not self.enabled:
+            return
+
+        if not get_resource_service().asset_available(sound_path):
+            print(f"[AudioService] Sound file not found: {sound_path}")
+            self._notify(AUDIO_EVENT_ERROR, sound_path=sound_path, message="Sound file not found")
+            return
+
+        # Stop any currently streaming sound
+        self._stop_music()
+
+        # Load and play the new sound
+        self.backend.play_music(sound_path, self.volume * self.duck_envelope.gain, loop)
+
+        self.current_sound = sound_path
+        print(f"[AudioService] Playing: {os.path.basename(sound_path)}")
+        self._notify(AUDIO_EVENT_PLAYING, sound_path=sound_path)
+
+    def _play_alert(self, sound_path: str, channel_id: int):
+        """Play a cached alert tone on a reserved channel"""
+        if not self.enabled:
+            return
+
+        sound = self._get_alert_sound(sound_path)
+        if sound is None:
+            self._notify(AUDIO_EVENT_ERROR, sound_path=sound_path, message="Sound could not be loaded")
+            return
+
+        # Alerts never overlap each other
+        self._stop_alerts()
+
+        # Duck background music instead of cutting it
+        if self.backend.music_busy():
+            self.duck_envelope.ramp_to(AUDIO_DUCK_LEVEL, AUDIO_DUCK_ATTACK_MS)
+            self._ducked = True
+
+        # Per-tone gain keeps every alert at the same perceived level
+        self._channel_gain[channel_id] = self.tone_cache.get_playback_gain(sound_path)
+
+        self.backend.play_channel(channel_id, sound, self._alert_volume(channel_id))
+
+        self.current_sound = sound_path
+        print(f"[AudioService] Playing: {os.path.basename(sound_path)}")
+        self._notify(AUDIO_EVENT_PLAYING, sound_path=sound_path)
+
+    def _get_alert_sound(self, sound_path: str) -> Optional[Any]:
+        """Get a decoded alert sound, synthesising or loading it on a miss"""
+        if is_synth_tone(sound_path):
+            sound = self.sound_cache.peek(sound_path)
+            if sound is None:
+                frequency, _, channels = self.backend.get_format()
+                sound = self.backend.sound_from_buffer(render_tone(sound_path, frequency, channels))
+                self.sound_cache.put(sound_path, sound)
+            return sound
+
+        # Prefer the transcoded PCM copy over the original file
+        return self.sound_cache.get(self.tone_cache.resolve(sound_path))
+
+    def _alert_volume(self, channel_id: int) -> float:
+        """Effective volume for an alert channel including tone gain"""
+        return min(1.0, self.volume * self._channel_gain.get(channel_id, 1.0))
+
+    def _envelope_wait(self) -> Optional[float]:
         """
-        Fade out current sound
+        How long the worker may block waiting for commands
 
-        Args:
-            duration_ms: Fade out duration in milliseconds
+        Returns:
+            Seconds: the step interval while the envelope ramps, the
+            alert poll interval while music is held ducked, else None
+            (block until the next command)
         """
-        if self.initialized and self.is_playing():
-            try:
-                pygame.mixer.music.fadeout(duration_ms)
-            except Exception as e:
-                print(f"[AudioService] Error fading out sound: {e}")
+        if not self.initialized:
+            return None
+        if self.duck_envelope.active:
+            return AUDIO_ENVELOPE_STEP_MS / 1000.0
+        if self._ducked:
+            return AUDIO_DUCK_POLL_MS / 1000.0
+        return None
+
+    def _service_envelope(self):
+        """Step the duck envelope and release it once alerts finish"""
+        if self._envelope_wait() is None:
+            return
 
-    def cleanup(self):
-        """Clean up audio resources"""
+        try:
+            if self._ducked and not self.duck_envelope.active:
+                if not self._alerts_busy():
+                    self.duck_envelope.ramp_to(1.0, AUDIO_DUCK_RELEASE_MS)
+                    self._ducked = False
+
+            if self.duck_envelope.active:
+                gain = self.duck_envelope.step()
+                self.backend.set_music_volume(self.volume * gain)
+        except Exception as e:
+            print(f"[AudioService] Error updating music envelope: {e}")
+
+    def _alerts_busy(self) -> bool:
+        """Check if any reserved alert channel is playing"""
+        return any(self.backend.channel_busy(channel_id) for channel_id in ALERT_CHANNELS)
+
+    def _stop_alerts(self):
+        """Stop alert channels"""
+        for channel_id in ALERT_CHANNELS:
+            self.backend.stop_channel(channel_id)
+
+    def _stop_music(self):
+        """Stop and unload streamed music"""
+        self.backend.stop_music()
+
+    def _shutdown_mixer(self):
+        """Release the mixer when the worker exits"""
         if self.initialized:
             try:
-                self.stop()
-                pygame.mixer.quit()
+                self._stop_alerts()
+                self._stop_music()
+                self.sound_cache.clear()
+                self.backend.quit()
                 self.initialized = False
             except Exception as e:
                 print(f"[AudioService] Error during cleanup: {e}")
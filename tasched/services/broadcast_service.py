@@ -0,0 +1,442 @@
+"""
+TaSched - Broadcast Service
+Embedded HTTP / Server-Sent Events / WebSocket server for remote displays
+Runs an asyncio event loop on its own thread. The Tk thread only hands a
+plain state dict to publish(); diffing, encoding and fan-out happen on
+the server thread. Each message is encoded once and shared by every
+client. New clients get a full snapshot, then one small delta per tick.
+
+Endpoints:
+    GET /         static client page (tasched/assets/web/index.html)
+    GET /state    current snapshot as JSON
+    GET /events   Server-Sent Events stream
+    GET /ws       WebSocket stream (text frames, same JSON messages)
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+import threading
+import time
+from typing import Any, Dict, Optional, Set
+
+from tasched.core.models import Schedule, Task
+from tasched.core.time_service import TimeService
+from tasched.services.resource_service import get_resource_service
+from tasched.ui.render_model import build_ticker_message
+from tasched.constants import (
+    BROADCAST_CLIENT_QUEUE,
+    BROADCAST_KEEPALIVE_SECONDS,
+    SCHEDULE_STATE_IDLE,
+    WEB_CLIENT_FILE
+)
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# Formats [TIME_REMAINING] in ticker messages
+_time_service = TimeService()
+
+
+def build_state(schedule: Optional[Schedule], task: Optional[Task] = None,
+                next_task: Optional[Task] = None) -> Dict[str, Any]:
+    """
+    Flatten the scheduler state into the broadcast payload
+    The ticker text has its placeholders filled in, as on the RunWindow.
+
+    Args:
+        schedule: Running schedule (None when idle)
+        task: Current task
+        next_task: Following task, if any
+
+    Returns:
+        JSON-serialisable state dict
+    """
+    if schedule is None:
+        return {'schedule': None, 'state': SCHEDULE_STATE_IDLE}
+
+    state = {
+        'schedule': schedule.name,
+        'state': schedule.state,
+        'task_index': schedule.current_task_index,
+        'task_count': len(schedule.tasks),
+        'task_id': None,
+        'title': None,
+        'remaining': None,
+        'duration': None,
+        'next_title': next_task.title if next_task else None,
+        'ticker': None
+    }
+    if task is not None:
+        state.update({
+            'task_id': task.id,
+            'title': task.title,
+            'remaining': task.remaining_seconds,
+            'duration': task.duration_seconds,
+            'ticker': (build_ticker_message(task, next_task, _time_service)
+                       if task.display.ticker_enabled else None)
+        })
+    return state
+
+
+def encode_ws_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    """Build an unmasked server-to-client WebSocket frame"""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 65536:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+class Message:
+    """One broadcast message, encoded once for every transport"""
+
+    __slots__ = ('text', 'sse', 'ws')
+
+    def __init__(self, kind: str, seq: int, body: Dict[str, Any]):
+        self.text = json.dumps({'type': kind, 'seq': seq, **body}, separators=(',', ':'))
+        data = self.text.encode('utf-8')
+        self.sse = b"event: " + kind.encode('ascii') + b"\ndata: " + data + b"\n\n"
+        self.ws = encode_ws_frame(data)
+
+
+class BroadcastClient:
+    """A connected SSE or WebSocket client"""
+
+    def __init__(self, transport: str):
+        self.transport = transport
+        self.queue: "asyncio.Queue[Optional[Message]]" = asyncio.Queue(maxsize=BROADCAST_CLIENT_QUEUE)
+        self.needs_snapshot = False
+
+
+class BroadcastService:
+    """
+    Publishes scheduler state to LAN clients from a background thread
+    """
+
+    def __init__(self):
+        self.resource = get_resource_service()
+        self.host = None
+        self.port = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._clients: Set[BroadcastClient] = set()
+
+        # Server-thread state
+        self._state: Dict[str, Any] = build_state(None)
+        self._seq = 0
+        self._snapshot: Optional[Message] = None
+
+        self.messages_sent = 0
+        self.clients_dropped = 0
+
+    # ========== Lifecycle (any thread) ==========
+
+    def start(self, host: str, port: int, timeout: float = 5.0) -> bool:
+        """
+        Start the server thread
+
+        Args:
+            host: Interface to bind ("0.0.0.0" for the whole LAN)
+            port: TCP port (0 picks a free port; see self.port)
+            timeout: Seconds to wait for the socket to be listening
+
+        Returns:
+            True if the server is listening
+        """
+        if self._thread and self._thread.is_alive():
+            return True
+
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, args=(host, port),
+                                        name="BroadcastServer", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout)
+        return self._server is not None
+
+    def stop(self):
+        """Close every client and stop the server thread"""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._shutdown)
+        except RuntimeError:
+            pass  # loop already closed
+        if self._thread:
+            self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def publish(self, state: Dict[str, Any]):
+        """
+        Publish the latest state (cheap; safe to call from the Tk thread)
+
+        Args:
+            state: Payload from build_state()
+        """
+        loop = self._loop
+        if loop is None or self._server is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._apply_state, dict(state))
+        except RuntimeError:
+            pass
+
+    @property
+    def client_count(self) -> int:
+        """Number of connected streaming clients"""
+        return len(self._clients)
+
+    # ========== Server Thread ==========
+
+    def _run(self, host: str, port: int):
+        """Event loop thread body"""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        try:
+            self._server = loop.run_until_complete(
+                asyncio.start_server(self._handle_connection, host, port, backlog=512)
+            )
+            self.host = host
+            self.port = self._server.sockets[0].getsockname()[1]
+            print(f"[BroadcastService] Listening on http://{host}:{self.port}/")
+        except OSError as e:
+            print(f"[BroadcastService] Could not listen on {host}:{port}: {e}")
+            self._server = None
+            self._loop = None
+            self._ready.set()
+            loop.close()
+            return
+
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            self._server = None
+            self._loop = None
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def _shutdown(self):
+        """Close the listener and clients, then stop the loop (server thread)"""
+        if self._server is not None:
+            self._server.close()
+        for client in list(self._clients):
+            self._close_client(client)
+        self._loop.call_later(0.1, self._loop.stop)
+
+    def _apply_state(self, state: Dict[str, Any]):
+        """Diff against the previous state and fan the delta out (server thread)"""
+        changes = {key: value for key, value in state.items() if self._state.get(key) != value}
+        changes.update({key: None for key in self._state if key not in state})
+        if not changes:
+            return
+
+        self._state = state
+        self._seq += 1
+        self._snapshot = None
+
+        if not self._clients:
+            return
+
+        message = Message('delta', self._seq, {'changes': changes, 'time': time.time()})
+        for client in list(self._clients):
+            self._deliver(client, message)
+
+    def _snapshot_message(self) -> Message:
+        """Full-state message, encoded once per state version"""
+        if self._snapshot is None:
+            self._snapshot = Message('snapshot', self._seq, {'state': self._state, 'time': time.time()})
+        return self._snapshot
+
+    def _deliver(self, client: BroadcastClient, message: Message):
+        """Queue a message; a client that falls behind is resynced with a snapshot"""
+        if client.needs_snapshot:
+            message = self._snapshot_message()
+        try:
+            client.queue.put_nowait(message)
+            client.needs_snapshot = False
+        except asyncio.QueueFull:
+            # Drop the backlog; the next message it gets is a full snapshot
+            while not client.queue.empty():
+                client.queue.get_nowait()
+            client.needs_snapshot = True
+            self.clients_dropped += 1
+
+    def _close_client(self, client: BroadcastClient):
+        """Ask a client's writer loop to finish"""
+        self._clients.discard(client)
+        try:
+            client.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            while not client.queue.empty():
+                client.queue.get_nowait()
+            client.queue.put_nowait(None)
+
+    # ========== HTTP ==========
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Parse one HTTP request and dispatch it"""
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=10)
+            headers = {}
+            while True:
+                line = await asyncio.wait_for(reader.readline(), timeout=10)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            parts = request_line.decode('latin-1').split()
+            if len(parts) < 2 or parts[0] != 'GET':
+                await self._send_response(writer, 405, b"Method Not Allowed", "text/plain")
+                return
+
+            path = parts[1].split('?', 1)[0]
+            if path == '/ws' and headers.get('upgrade', '').lower() == 'websocket':
+                await self._serve_websocket(reader, writer, headers)
+            elif path == '/events':
+                await self._serve_sse(writer)
+            elif path == '/state':
+                body = self._snapshot_message().text.encode('utf-8')
+                await self._send_response(writer, 200, body, "application/json")
+            elif path in ('/', '/index.html'):
+                await self._send_response(writer, 200, self._client_page(), "text/html; charset=utf-8")
+            else:
+                await self._send_response(writer, 404, b"Not Found", "text/plain")
+        except (asyncio.TimeoutError, ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            print(f"[BroadcastService] Connection error: {e}")
+        finally:
+            try:
+                writer.close()
+            except Exception:
+                pass
+
+    async def _send_response(self, writer: asyncio.StreamWriter, status: int, body: bytes, content_type: str):
+        """Write a complete HTTP response"""
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}.get(status, "OK")
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Cache-Control: no-cache\r\n"
+            "Access-Control-Allow-Origin: *\r\n"
+            "Connection: close\r\n\r\n".encode('latin-1') + body
+        )
+        await writer.drain()
+
+    def _client_page(self) -> bytes:
+        """Static client page"""
+        try:
+            with open(self.resource.resource_path(WEB_CLIENT_FILE), 'rb') as f:
+                return f.read()
+        except OSError:
+            return b"<!doctype html><title>TaSched</title><p>Client page missing. Use /events or /ws.</p>"
+
+    # ========== Streams ==========
+
+    async def _stream(self, writer: asyncio.StreamWriter, client: BroadcastClient, keepalive: bytes):
+        """Write queued messages until the client disconnects or is closed"""
+        self._clients.add(client)
+        client.queue.put_nowait(self._snapshot_message())
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(client.queue.get(), timeout=BROADCAST_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    writer.write(keepalive)
+                    await writer.drain()
+                    continue
+                if message is None:
+                    break
+                writer.write(message.sse if client.transport == 'sse' else message.ws)
+                await writer.drain()
+                self.messages_sent += 1
+        finally:
+            self._clients.discard(client)
+
+    async def _serve_sse(self, writer: asyncio.StreamWriter):
+        """Server-Sent Events: snapshot, then deltas"""
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Access-Control-Allow-Origin: *\r\n"
+            b"Connection: keep-alive\r\n\r\n"
+            b"retry: 2000\n\n"
+        )
+        await writer.drain()
+        await self._stream(writer, BroadcastClient('sse'), b": keepalive\n\n")
+
+    async def _serve_websocket(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                               headers: Dict[str, str]):
+        """WebSocket: handshake, then snapshot and deltas; client frames are only read for close"""
+        key = headers.get('sec-websocket-key')
+        if not key:
+            await self._send_response(writer, 400, b"Bad WebSocket request", "text/plain")
+            return
+
+        accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode('ascii')).digest())
+        writer.write(
+            b"HTTP/1.1 101 Switching Protocols\r\n"
+            b"Upgrade: websocket\r\n"
+            b"Connection: Upgrade\r\n"
+            b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n"
+        )
+        await writer.drain()
+
+        client = BroadcastClient('ws')
+        stream_task = asyncio.ensure_future(self._stream(writer, client, encode_ws_frame(b"", opcode=0x9)))
+        read_task = asyncio.ensure_future(self._read_ws_until_close(reader))
+        done, pending = await asyncio.wait({stream_task, read_task}, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        if read_task in done:
+            try:
+                writer.write(encode_ws_frame(b"", opcode=0x8))
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    async def _read_ws_until_close(self, reader: asyncio.StreamReader):
+        """Discard client frames until a close frame or disconnect"""
+        while True:
+            header = await reader.readexactly(2)
+            opcode = header[0] & 0x0F
+            length = header[1] & 0x7F
+            if length == 126:
+                length = struct.unpack("!H", await reader.readexactly(2))[0]
+            elif length == 127:
+                length = struct.unpack("!Q", await reader.readexactly(8))[0]
+            if header[1] & 0x80:
+                await reader.readexactly(4)  # mask
+            await reader.readexactly(length)
+            if opcode == 0x8:
+                return
+
+
+# Global broadcast service instance
+_broadcast_service = None
+
+
+def get_broadcast_service() -> BroadcastService:
+    """
+    Get or create the global broadcast service instance
+
+    Returns:
+        BroadcastService instance
+    """
+    global _broadcast_service
+    if _broadcast_service is None:
+        _broadcast_service = BroadcastService()
+    return _broadcast_service
@@ -0,0 +1,394 @@
+"""
+TaSched - Hall Sync Service
+Keeps the countdown on several PCs in step over UDP multicast
+The master multicasts a 65-byte state frame on every tick (and again
+every second while nothing changes): schedule and task ids, task index,
+state, remaining seconds and the wall-clock deadline of the task. Followers
+estimate their clock offset to the master NTP-style from periodic
+ping/echo exchanges and count down locally from the deadline, so every
+hall flips the second together regardless of network jitter.
+
+Frames (network byte order):
+    state  !2sBBI16s16sHHBidd  magic, version, type, seq, schedule key,
+                               task key, task index, task count, state,
+                               remaining, deadline, master send time
+    ping   !2sBBId             magic, version, type, nonce, t0
+    pong   !2sBBIddd           magic, version, type, nonce, t0, t1, t2
+"""
+
+import hashlib
+import math
+import select
+import socket
+import struct
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Deque, NamedTuple, Optional, Tuple
+
+from tasched.core.models import Schedule, Task
+from tasched.constants import (
+    HALL_SYNC_PING_SECONDS,
+    HALL_SYNC_RESEND_SECONDS,
+    HALL_SYNC_ROLE_FOLLOWER,
+    HALL_SYNC_ROLE_MASTER,
+    HALL_SYNC_SAMPLES,
+    HALL_SYNC_TTL,
+    SCHEDULE_STATE_CANCELLED,
+    SCHEDULE_STATE_COMPLETED,
+    SCHEDULE_STATE_IDLE,
+    SCHEDULE_STATE_PAUSED,
+    SCHEDULE_STATE_READY,
+    SCHEDULE_STATE_RUNNING
+)
+
+FRAME_MAGIC = b"TH"
+FRAME_VERSION = 1
+FRAME_STATE = 1
+FRAME_PING = 2
+FRAME_PONG = 3
+
+STATE_FORMAT = struct.Struct("!2sBBI16s16sHHBidd")
+PING_FORMAT = struct.Struct("!2sBBId")
+PONG_FORMAT = struct.Struct("!2sBBIddd")
+
+# Schedule states on the wire
+STATE_CODES = {
+    SCHEDULE_STATE_IDLE: 0,
+    SCHEDULE_STATE_READY: 1,
+    SCHEDULE_STATE_RUNNING: 2,
+    SCHEDULE_STATE_PAUSED: 3,
+    SCHEDULE_STATE_COMPLETED: 4,
+    SCHEDULE_STATE_CANCELLED: 5
+}
+STATE_NAMES = {code: name for name, code in STATE_CODES.items()}
+
+
+def id_key(item_id: Optional[str]) -> bytes:
+    """
+    16-byte wire key for a schedule or task id
+
+    Args:
+        item_id: UUID string (other ids are hashed)
+
+    Returns:
+        16 bytes (zeros for None)
+    """
+    if not item_id:
+        return bytes(16)
+    try:
+        return uuid.UUID(item_id).bytes
+    except ValueError:
+        return hashlib.md5(item_id.encode('utf-8')).digest()
+
+
+class HallState(NamedTuple):
+    """Latest master state as seen by a follower"""
+    seq: int
+    schedule_key: bytes
+    task_key: bytes
+    task_index: int
+    task_count: int
+    state: str
+    remaining: int
+    deadline: float  # master clock
+    received_at: float  # local clock
+
+
+class HallSyncService:
+    """
+    Master/follower schedule sync between hall PCs
+    """
+
+    def __init__(self):
+        self.role: Optional[str] = None
+        self.group = None
+        self.port = None
+
+        self._sock: Optional[socket.socket] = None
+        self._ping_sock: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._lock = threading.Lock()
+
+        # Master
+        self._seq = 0
+        self._frame: Optional[bytes] = None
+        self._frame_sent_at = 0.0
+
+        # Follower
+        self.master_address: Optional[Tuple[str, int]] = None
+        self.offset = 0.0  # master clock minus local clock
+        self.delay = None  # round-trip delay of the sample the offset came from
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=HALL_SYNC_SAMPLES)
+        self._state: Optional[HallState] = None
+        self._nonce = 0
+        self._next_ping = 0.0
+
+    # ========== Lifecycle ==========
+
+    def start_master(self, group: str, port: int, interface: str = "0.0.0.0") -> bool:
+        """
+        Start multicasting this PC's schedule
+
+        Args:
+            group: Multicast group (or a unicast/broadcast address)
+            port: Port the followers listen on
+            interface: Local interface address for multicast traffic
+
+        Returns:
+            True if the socket was opened
+        """
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, HALL_SYNC_TTL)
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+            if interface != "0.0.0.0":
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(interface))
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            # Pings come back to this socket's port
+            sock.bind((interface, 0))
+        except OSError as e:
+            print(f"[HallSyncService] Could not open master socket: {e}")
+            return False
+
+        return self._start(HALL_SYNC_ROLE_MASTER, sock, group, port, self._master_loop)
+
+    def start_follower(self, group: str, port: int, interface: str = "0.0.0.0") -> bool:
+        """
+        Start following a master PC
+
+        Args:
+            group: Multicast group the master sends to
+            port: Port to listen on
+            interface: Local interface address to join the group on
+
+        Returns:
+            True if the socket was opened
+        """
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, 'SO_REUSEPORT'):
+                # Several followers on one PC (and loopback testing)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            sock.bind(("", port))
+            if socket.inet_aton(group)[0] & 0xF0 == 0xE0:
+                membership = struct.pack("4s4s", socket.inet_aton(group), socket.inet_aton(interface))
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership)
+
+            # Pongs are unicast, so they need a port of their own when
+            # several followers share the group port
+            ping_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+            ping_sock.bind((interface, 0))
+        except OSError as e:
+            print(f"[HallSyncService] Could not join {group}:{port}: {e}")
+            return False
+
+        return self._start(HALL_SYNC_ROLE_FOLLOWER, sock, group, port, self._follower_loop, ping_sock)
+
+    def _start(self, role: str, sock: socket.socket, group: str, port: int, loop,
+               ping_sock: socket.socket = None) -> bool:
+        """Common start-up for both roles"""
+        self.stop()
+        sock.settimeout(HALL_SYNC_RESEND_SECONDS / 4)
+        self.role = role
+        self.group = group
+        self.port = port
+        self._sock = sock
+        self._ping_sock = ping_sock
+        self._running = True
+        self._thread = threading.Thread(target=loop, name=f"HallSync-{role}", daemon=True)
+        self._thread.start()
+        print(f"[HallSyncService] {role.capitalize()} on {group}:{port}")
+        return True
+
+    def stop(self):
+        """Stop the network thread and close the socket"""
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        for sock in (self._sock, self._ping_sock):
+            if sock:
+                sock.close()
+        self._sock = None
+        self._ping_sock = None
+        self.role = None
+
+    # ========== Master ==========
+
+    def publish(self, schedule: Optional[Schedule], task: Optional[Task] = None):
+        """
+        Multicast the master's state (called on each tick and state change)
+
+        Args:
+            schedule: Running schedule (None when idle)
+            task: Current task
+        """
+        if self.role != HALL_SYNC_ROLE_MASTER:
+            return
+
+        now = time.time()
+        remaining = task.remaining_seconds if task else 0
+        with self._lock:
+            self._seq += 1
+            self._frame = STATE_FORMAT.pack(
+                FRAME_MAGIC, FRAME_VERSION, FRAME_STATE, self._seq,
+                id_key(schedule.id if schedule else None),
+                id_key(task.id if task else None),
+                schedule.current_task_index if schedule else 0,
+                len(schedule.tasks) if schedule else 0,
+                STATE_CODES.get(schedule.state if schedule else SCHEDULE_STATE_IDLE, 0),
+                remaining,
+                # Ticks land on wall-clock seconds, so this is the moment the task hits zero
+                now + remaining,
+                now
+            )
+        self._send_frame()
+
+    def _send_frame(self):
+        """Send the current state frame to the group"""
+        with self._lock:
+            frame = self._frame
+        if frame is None or self._sock is None:
+            return
+        try:
+            self._sock.sendto(frame, (self.group, self.port))
+            self._frame_sent_at = time.monotonic()
+        except OSError as e:
+            print(f"[HallSyncService] Send failed: {e}")
+
+    def _master_loop(self):
+        """Answer pings and resend the state frame while nothing changes"""
+        sock = self._sock
+        while self._running:
+            if time.monotonic() - self._frame_sent_at >= HALL_SYNC_RESEND_SECONDS:
+                self._send_frame()
+            try:
+                data, address = sock.recvfrom(64)
+            except socket.timeout:
+                continue
+            except ConnectionResetError:
+                # Windows reports a pong sent to a closed follower port here
+                continue
+            except OSError:
+                if not self._running:
+                    break
+                continue
+            received = time.time()
+            if len(data) != PING_FORMAT.size:
+                continue
+            magic, version, kind, nonce, t0 = PING_FORMAT.unpack(data)
+            if magic != FRAME_MAGIC or version != FRAME_VERSION or kind != FRAME_PING:
+                continue
+            try:
+                sock.sendto(PONG_FORMAT.pack(FRAME_MAGIC, FRAME_VERSION, FRAME_PONG,
+                                             nonce, t0, received, time.time()), address)
+            except OSError:
+                pass
+
+    # ========== Follower ==========
+
+    def latest(self) -> Optional[HallState]:
+        """Most recent master state (None until the first frame arrives)"""
+        return self._state
+
+    def now(self) -> float:
+        """Current time on the master's clock"""
+        return time.time() + self.offset
+
+    def remaining_seconds(self, state: HallState) -> int:
+        """
+        Seconds left on the master's current task, counted down locally
+
+        Args:
+            state: State from latest()
+
+        Returns:
+            Whole seconds remaining (the value the master is showing now)
+        """
+        if state.state != SCHEDULE_STATE_RUNNING:
+            return state.remaining
+        left = state.deadline - self.now()
+        return max(0, min(state.remaining, int(math.ceil(left - 1e-3))))
+
+    def _follower_loop(self):
+        """Receive state frames and pongs; ping the master for the clock offset"""
+        sockets = [self._sock, self._ping_sock]
+        while self._running:
+            self._maybe_ping()
+            try:
+                readable, _, _ = select.select(sockets, [], [], HALL_SYNC_RESEND_SECONDS / 4)
+                for sock in readable:
+                    data, address = sock.recvfrom(128)
+                    received = time.time()
+                    if len(data) == STATE_FORMAT.size:
+                        self._handle_state(data, address, received)
+                    elif len(data) == PONG_FORMAT.size:
+                        self._handle_pong(data, received)
+            except OSError:
+                if not self._running:
+                    break
+
+    def _handle_state(self, data: bytes, address: Tuple[str, int], received: float):
+        """Store a state frame if it is newer than the last one"""
+        (magic, version, kind, seq, schedule_key, task_key, task_index, task_count,
+         state_code, remaining, deadline, _sent) = STATE_FORMAT.unpack(data)
+        if magic != FRAME_MAGIC or version != FRAME_VERSION or kind != FRAME_STATE:
+            return
+
+        if address != self.master_address:
+            # New (or restarted) master: start the offset estimate afresh
+            self.master_address = address
+            self._samples.clear()
+            self._next_ping = 0.0
+        elif self._state is not None and seq <= self._state.seq and self._state.seq - seq < 1000:
+            return  # duplicate or reordered
+
+        self._state = HallState(seq, schedule_key, task_key, task_index, task_count,
+                                STATE_NAMES.get(state_code, SCHEDULE_STATE_IDLE),
+                                remaining, deadline, received)
+
+    def _maybe_ping(self):
+        """Send a ping when one is due (quickly at first, then every few seconds)"""
+        if self.master_address is None or time.monotonic() < self._next_ping:
+            return
+        self._nonce = (self._nonce + 1) & 0xFFFFFFFF
+        try:
+            self._ping_sock.sendto(PING_FORMAT.pack(FRAME_MAGIC, FRAME_VERSION, FRAME_PING,
+                                               self._nonce, time.time()), self.master_address)
+        except OSError:
+            pass
+        settling = len(self._samples) < HALL_SYNC_SAMPLES // 2
+        self._next_ping = time.monotonic() + (HALL_SYNC_PING_SECONDS / 8 if settling else HALL_SYNC_PING_SECONDS)
+
+    def _handle_pong(self, data: bytes, t3: float):
+        """Add an offset sample; the lowest-delay sample in the window wins"""
+        magic, version, kind, nonce, t0, t1, t2 = PONG_FORMAT.unpack(data)
+        if magic != FRAME_MAGIC or version != FRAME_VERSION or kind != FRAME_PONG:
+            return
+        delay = (t3 - t0) - (t2 - t1)
+        offset = ((t1 - t0) + (t2 - t3)) / 2
+        if delay < 0:
+            return
+        self._samples.append((delay, offset))
+        self.delay, self.offset = min(self._samples)
+
+
+# Global hall sync service instance
+_hall_sync_service = None
+
+
+def get_hall_sync_service() -> HallSyncService:
+    """
+    Get or create the global hall sync service instance
+
+    Returns:
+        HallSyncService instance
+    """
+    global _hall_sync_service
+    if _hall_sync_service is None:
+        _hall_sync_service = HallSyncService()
+    return _hall_sync_service
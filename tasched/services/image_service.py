@@ -0,0 +1,331 @@
+"""
+TaSched - Image Service
+Scaled image cache for logos and backgrounds
+Ready PhotoImages are kept in memory keyed by (path, size, resample);
+scaled copies are also written as PNGs in the data directory, one per
+target size, so a screen-sized background is only resampled once per
+screen resolution.
+prerender() decodes and scales images on worker threads (or a spawned
+worker process for screen-sized images); only the final PhotoImage
+creation runs on the Tk thread.
+PIL is imported on first use; PNGs already in the disk cache are loaded
+straight into Tk without it.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import queue
+import threading
+import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from PIL import Image, ImageTk
+
+from tasched.constants import (
+    IMAGE_CACHE_DIR,
+    PRERENDER_WORKERS,
+    PRERENDER_PROCESS_PIXELS,
+    PRERENDER_POLL_MS
+)
+from tasched.services.resource_service import get_resource_service
+
+
+# PIL's Image.Resampling.LANCZOS, kept numeric so PIL is only imported to scale
+LANCZOS = 1
+
+Photo = Union["ImageTk.PhotoImage", tk.PhotoImage]
+
+
+def _write_png(image: "Image.Image", cache_path: Path):
+    """Write a scaled image to the disk cache atomically"""
+    tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        image.save(tmp_path, format="PNG")
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"[ImageService] Error caching {cache_path.name}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _scale_to_file(image_path: str, size: Tuple[int, int], resample: int, cache_path: str) -> str:
+    """Decode, scale and cache an image (runs in a worker process)"""
+    from PIL import Image
+    with Image.open(get_resource_service().open_asset(image_path)) as source:
+        image = source.resize(tuple(size), resample)
+    _write_png(image, Path(cache_path))
+    return cache_path
+
+
+class ImageService:
+    """
+    Loads, scales and caches images for Tk
+    PhotoImage creation must happen on the Tk thread; get_scaled() is
+    safe to call from any thread.
+    """
+
+    def __init__(self, cache_dir: str = None):
+        self.resource = get_resource_service()
+        if cache_dir:
+            self.cache_dir = Path(cache_dir)
+        else:
+            self.cache_dir = self.resource.get_data_path() / IMAGE_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._photos: Dict[Tuple, Photo] = {}
+
+        # Prerender state (only touched on the Tk thread, except _finished)
+        self._in_flight: Dict[Tuple, Future] = {}
+        self._finished: "queue.Queue[Tuple]" = queue.Queue()
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._processes_lock = threading.Lock()
+        self._root = None
+        self._poll_id = None
+
+    def get_photo(self, image_path: str, size: Tuple[int, int],
+                  resample: int = LANCZOS) -> Optional[Photo]:
+        """
+        Get a PhotoImage of an image scaled to a size (Tk thread only)
+
+        Args:
+            image_path: Path to the source image
+            size: Target (width, height)
+            resample: PIL resampling filter
+
+        Returns:
+            PhotoImage, or None if the image could not be loaded
+        """
+        if not image_path:
+            return None
+
+        key = (image_path, tuple(size), int(resample))
+        photo = self._photos.get(key)
+        if photo is not None:
+            return photo
+
+        # Being prerendered: take its result rather than scaling twice
+        if key in self._in_flight:
+            self._await_prerender(key)
+            photo = self._photos.get(key)
+            if photo is not None:
+                return photo
+
+        # Already scaled on an earlier run: Tk reads the PNG without PIL
+        photo = self._load_cached_png(image_path, size, resample)
+        if photo is None:
+            image = self.get_scaled(image_path, size, resample)
+            if image is None:
+                return None
+
+            from PIL import ImageTk
+            photo = ImageTk.PhotoImage(image)
+
+        self._photos[key] = photo
+        return photo
+
+    def get_scaled(self, image_path: str, size: Tuple[int, int],
+                   resample: int = LANCZOS) -> Optional["Image.Image"]:
+        """
+        Get an image scaled to a size, from the disk cache when possible
+
+        Args:
+            image_path: Path to the source image
+            size: Target (width, height)
+            resample: PIL resampling filter
+
+        Returns:
+            Loaded PIL image, or None if the image could not be loaded
+        """
+        try:
+            cache_path = self._cache_path(image_path, size, resample)
+        except OSError as e:
+            print(f"[ImageService] Cannot read {image_path}: {e}")
+            return None
+
+        from PIL import Image
+
+        if cache_path.exists():
+            try:
+                with Image.open(cache_path) as cached:
+                    cached.load()
+                    return cached.copy()
+            except Exception as e:
+                print(f"[ImageService] Discarding unreadable cache file {cache_path.name}: {e}")
+
+        try:
+            with Image.open(self.resource.open_asset(image_path)) as source:
+                image = source.resize(tuple(size), resample)
+        except Exception as e:
+            print(f"[ImageService] Error loading {os.path.basename(image_path)}: {e}")
+            return None
+
+        _write_png(image, cache_path)
+        return image
+
+    def contains(self, image_path: str, size: Tuple[int, int],
+                 resample: int = LANCZOS) -> bool:
+        """Check if a PhotoImage is already cached in memory"""
+        return (image_path, tuple(size), int(resample)) in self._photos
+
+    def clear(self):
+        """Drop every cached PhotoImage (the disk cache is kept)"""
+        self._photos.clear()
+
+    # ========== Prerendering ==========
+
+    def prerender(self, root, requests: Iterable[Tuple[str, Tuple[int, int]]],
+                  resample: int = LANCZOS):
+        """
+        Decode and scale images off the Tk thread so later get_photo()
+        calls are memory hits (call on the Tk thread)
+
+        Args:
+            root: Tk widget used to schedule PhotoImage creation
+            requests: (image_path, (width, height)) pairs
+            resample: PIL resampling filter
+        """
+        self._root = root
+        for image_path, size in requests:
+            key = (image_path, tuple(size), int(resample))
+            if not image_path or key in self._photos or key in self._in_flight:
+                continue
+            self._in_flight[key] = self._get_threads().submit(self._prerender_job, key)
+
+        if self._in_flight and self._poll_id is None:
+            self._poll_id = root.after(PRERENDER_POLL_MS, self._poll)
+
+    def shutdown(self):
+        """Stop prerender workers"""
+        if self._poll_id and self._root:
+            try:
+                self._root.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+
+        if self._threads:
+            self._threads.shutdown(wait=False, cancel_futures=True)
+            self._threads = None
+        if self._processes:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+            self._processes = None
+
+    def _prerender_job(self, key: Tuple):
+        """Scale one image (runs on a prerender thread)"""
+        image_path, size, resample = key
+        image = None
+        try:
+            if size[0] * size[1] >= PRERENDER_PROCESS_PIXELS:
+                # Keep large resamples from competing with the Tk thread for the GIL
+                cache_path = self._cache_path(image_path, size, resample)
+                if not cache_path.exists():
+                    try:
+                        self._get_processes().submit(
+                            _scale_to_file, image_path, size, resample, str(cache_path)
+                        ).result()
+                    except Exception as e:
+                        print(f"[ImageService] Worker process failed, scaling in thread: {e}")
+            image = self.get_scaled(image_path, size, resample)
+        except Exception as e:
+            print(f"[ImageService] Error prerendering {os.path.basename(image_path)}: {e}")
+        self._finished.put((key, image))
+
+    def _poll(self):
+        """Collect finished prerenders while any are outstanding (Tk thread)"""
+        self._poll_id = None
+        self._collect()
+        if self._in_flight and self._root:
+            self._poll_id = self._root.after(PRERENDER_POLL_MS, self._poll)
+
+    def _collect(self):
+        """Turn finished prerenders into PhotoImages (Tk thread)"""
+        from PIL import ImageTk
+        while True:
+            try:
+                key, image = self._finished.get_nowait()
+            except queue.Empty:
+                break
+            self._in_flight.pop(key, None)
+            if image is not None and key not in self._photos:
+                self._photos[key] = ImageTk.PhotoImage(image)
+
+    def _await_prerender(self, key: Tuple):
+        """
+        Wait for an in-flight prerender of key and collect it (Tk thread)
+        A job that has not started yet is cancelled instead, so the caller
+        scales the image itself without queueing behind other prerenders.
+        """
+        future = self._in_flight[key]
+        if future.cancel():
+            del self._in_flight[key]
+            return
+        try:
+            future.result()
+        except Exception:
+            pass  # _prerender_job reports its own errors
+        self._collect()
+
+    def _load_cached_png(self, image_path: str, size: Tuple[int, int],
+                         resample: int) -> Optional[tk.PhotoImage]:
+        """Load an already scaled PNG from the disk cache with Tk's own PNG reader"""
+        try:
+            cache_path = self._cache_path(image_path, size, resample)
+            if cache_path.exists():
+                return tk.PhotoImage(file=str(cache_path))
+        except (OSError, tk.TclError):
+            pass
+        return None
+
+    def _get_threads(self) -> ThreadPoolExecutor:
+        """Get the prerender thread pool, creating it on first use"""
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=PRERENDER_WORKERS,
+                                               thread_name_prefix="ImagePrerender")
+        return self._threads
+
+    def _get_processes(self) -> ProcessPoolExecutor:
+        """
+        Get the process pool for large images, creating it on first use
+        Workers are spawned, not forked: forking this process (Tk, audio and
+        journal threads) could leave the child blocked on an inherited lock.
+        """
+        with self._processes_lock:  # called from several prerender threads
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._processes
+
+    def _cache_path(self, image_path: str, size: Tuple[int, int], resample: int) -> Path:
+        """Disk cache file for a source image, its current version and a target size"""
+        mtime_ns, size_bytes = self.resource.asset_stamp(image_path)
+        location = image_path if self.resource.is_bundled(image_path) else os.path.abspath(image_path)
+        source_key = f"{location}|{mtime_ns}|{size_bytes}"
+        digest = hashlib.sha1(source_key.encode('utf-8')).hexdigest()[:16]
+        stem = Path(image_path).stem
+        width, height = size
+        return self.cache_dir / f"{stem}_{digest}_{width}x{height}_{int(resample)}.png"
+
+
+# Global image service instance
+_image_service = None
+
+
+def get_image_service() -> ImageService:
+    """
+    Get or create the global image service instance
+
+    Returns:
+        ImageService instance
+    """
+    global _image_service
+    if _image_service is None:
+        _image_service = ImageService()
+    return _image_service
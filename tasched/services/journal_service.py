@@ -0,0 +1,218 @@
+"""
+TaSched - Journal Service
+Single in-process event journal for schedule transitions.
+Events are timestamped once and written to pluggable sinks (text log,
+SQLite run_history, ...) in batches from a background thread.
+"""
+
+import queue
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from tasched.constants import JOURNAL_BATCH_SIZE, JOURNAL_FLUSH_INTERVAL
+
+
+@dataclass
+class JournalEvent:
+    """A single schedule transition"""
+    event_type: str
+    message: str
+    level: str = "INFO"
+    schedule_id: Optional[str] = None
+    schedule_name: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+    timestamp: datetime = field(default_factory=datetime.now)
+
+
+class JournalSink:
+    """
+    Base class for journal sinks
+    Sinks receive events in batches on the journal worker thread
+    """
+
+    def write_batch(self, events: List[JournalEvent]):
+        """
+        Persist a batch of events
+
+        Args:
+            events: Events in the order they were recorded
+        """
+        raise NotImplementedError
+
+
+class TextLogSink(JournalSink):
+    """Writes journal events to the text log file"""
+
+    def __init__(self, log_service):
+        self.log_service = log_service
+
+    def write_batch(self, events: List[JournalEvent]):
+        self.log_service.write_entries(
+            [(event.timestamp, event.level, event.message) for event in events]
+        )
+
+
+class RunHistorySink(JournalSink):
+    """Writes journal events to the SQLite run_history table"""
+
+    def __init__(self, storage_service):
+        self.storage_service = storage_service
+
+    def write_batch(self, events: List[JournalEvent]):
+        rows = [
+            (event.schedule_id, event.schedule_name, event.event_type, event.data, event.timestamp)
+            for event in events
+            if event.schedule_id is not None
+        ]
+        if rows:
+            self.storage_service.log_events(rows)
+
+
+class EventJournal:
+    """
+    Collects typed events and fans them out to sinks off the main thread
+    """
+
+    def __init__(self, flush_interval: float = JOURNAL_FLUSH_INTERVAL,
+                 batch_size: int = JOURNAL_BATCH_SIZE):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.sinks: List[JournalSink] = []
+        self._queue: "queue.Queue[Optional[JournalEvent]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def add_sink(self, sink: JournalSink):
+        """Register a sink to receive journal batches"""
+        with self._lock:
+            self.sinks.append(sink)
+
+    def remove_sink(self, sink: JournalSink):
+        """Unregister a sink"""
+        with self._lock:
+            if sink in self.sinks:
+                self.sinks.remove(sink)
+
+    def record(self, event_type: str, message: str, level: str = "INFO",
+               schedule_id: str = None, schedule_name: str = None,
+               data: Dict[str, Any] = None) -> JournalEvent:
+        """
+        Record a transition
+
+        Args:
+            event_type: Machine-readable event type (e.g., "task_started")
+            message: Human-readable log line
+            level: Log level (INFO, WARNING, ERROR, DEBUG)
+            schedule_id: Owning schedule ID (events without one skip run_history)
+            schedule_name: Owning schedule name
+            data: Optional structured payload
+
+        Returns:
+            The recorded event
+        """
+        event = JournalEvent(
+            event_type=event_type,
+            message=message,
+            level=level,
+            schedule_id=schedule_id,
+            schedule_name=schedule_name,
+            data=data
+        )
+        self._ensure_worker()
+        self._queue.put(event)
+        return event
+
+    def flush(self):
+        """Block until all recorded events have been written"""
+        if self._worker and self._worker.is_alive():
+            self._queue.join()
+
+    def close(self):
+        """Drain pending events and stop the worker thread"""
+        worker = self._worker
+        if worker and worker.is_alive():
+            self._queue.put(None)
+            worker.join()
+        self._worker = None
+
+    def _ensure_worker(self):
+        """Start the worker thread on first use"""
+        if self._worker and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(
+                target=self._run, name="EventJournal", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self):
+        """Worker loop - gathers events into batches and dispatches them"""
+        running = True
+        while running:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch = []
+            taken = 1
+            if first is None:
+                running = False
+            else:
+                batch.append(first)
+
+            # Drain whatever else is already waiting
+            while running and len(batch) < self.batch_size:
+                try:
+                    event = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+                if event is None:
+                    running = False
+                else:
+                    batch.append(event)
+
+            if batch:
+                self._dispatch(batch)
+
+            for _ in range(taken):
+                self._queue.task_done()
+
+    def _dispatch(self, batch: List[JournalEvent]):
+        """Write a batch to every sink, isolating sink failures"""
+        with self._lock:
+            sinks = list(self.sinks)
+
+        for sink in sinks:
+            try:
+                sink.write_batch(batch)
+            except Exception as e:
+                print(f"[EventJournal] Sink {type(sink).__name__} failed: {e}")
+
+
+# Global journal instance
+_event_journal = None
+
+
+def get_event_journal() -> EventJournal:
+    """
+    Get or create the global event journal
+    The default journal writes to the text log and the run_history table
+
+    Returns:
+        EventJournal instance
+    """
+    global _event_journal
+    if _event_journal is None:
+        from tasched.services.log_service import get_log_service
+        from tasched.services.storage_service import get_storage_service
+
+        _event_journal = EventJournal()
+        _event_journal.add_sink(TextLogSink(get_log_service()))
+        _event_journal.add_sink(RunHistorySink(get_storage_service()))
+    return _event_journal
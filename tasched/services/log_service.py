@@ -6,6 +6,7 @@ Append-only text logging for debugging and audit trail
 import os
 from datetime import datetime
 from pathlib import Path
+from typing import List, Tuple
 from tasched.services.resource_service import get_resource_service
 
 
@@ -42,6 +43,27 @@ class LogService:
         except Exception as e:
             print(f"Error writing to log file: {e}")
 
+    def write_entries(self, entries: List[Tuple[datetime, str, str]]):
+        """
+        Write several pre-timestamped log entries with a single file open
+
+        Args:
+            entries: List of (timestamp, level, message) tuples
+        """
+        if not entries:
+            return
+
+        lines = [
+            f"[{timestamp.strftime('%Y-%m-%d %H:%M:%S')}] [{level}] {message}\n"
+            for timestamp, level, message in entries
+        ]
+
+        try:
+            with open(self.log_file, 'a', encoding='utf-8') as f:
+                f.writelines(lines)
+        except Exception as e:
+            print(f"Error writing to log file: {e}")
+
     def info(self, message: str):
         """Log info message"""
         self.log(message, "INFO")
@@ -0,0 +1,90 @@
+"""
+TaSched - Loudness Analysis
+RMS/peak measurement and gain calculation for 16-bit PCM tones
+Uses numpy when available (imported on first use), otherwise the stdlib array module
+"""
+
+import math
+import operator
+from array import array
+from typing import Tuple
+
+from tasched.core.lazy_import import optional_module
+from tasched.constants import (
+    LOUDNESS_TARGET_RMS,
+    LOUDNESS_PEAK_CEILING,
+    LOUDNESS_MAX_GAIN
+)
+
+
+FULL_SCALE = 32768.0
+
+
+def measure_loudness(raw: bytes) -> Tuple[float, float]:
+    """
+    Measure RMS and peak level of signed 16-bit PCM
+
+    Args:
+        raw: Interleaved signed 16-bit native-endian samples
+
+    Returns:
+        Tuple of (rms, peak), both relative to full scale (0.0 to 1.0)
+    """
+    np = optional_module("numpy")
+    if np is not None:
+        samples = np.frombuffer(raw, dtype=np.int16)
+        if samples.size == 0:
+            return 0.0, 0.0
+        wide = samples.astype(np.float64)
+        rms = float(np.sqrt(np.mean(wide * wide)))
+        peak = float(np.max(np.abs(wide)))
+    else:
+        samples = array('h')
+        samples.frombytes(raw[:len(raw) - len(raw) % 2])
+        if not samples:
+            return 0.0, 0.0
+        rms = math.sqrt(sum(map(operator.mul, samples, samples)) / len(samples))
+        peak = float(max(max(samples), -min(samples)))
+
+    return rms / FULL_SCALE, min(1.0, peak / FULL_SCALE)
+
+
+def compute_gain(rms: float, peak: float) -> float:
+    """
+    Gain that brings a tone to the target RMS without clipping
+
+    Args:
+        rms: Measured RMS (0.0 to 1.0)
+        peak: Measured peak (0.0 to 1.0)
+
+    Returns:
+        Linear gain factor
+    """
+    if rms <= 0.0 or peak <= 0.0:
+        return 1.0
+
+    gain = LOUDNESS_TARGET_RMS / rms
+    gain = min(gain, LOUDNESS_PEAK_CEILING / peak, LOUDNESS_MAX_GAIN)
+    return gain
+
+
+def apply_gain(raw: bytes, gain: float) -> bytes:
+    """
+    Scale signed 16-bit PCM by a gain factor, saturating at full scale
+
+    Args:
+        raw: Interleaved signed 16-bit native-endian samples
+        gain: Linear gain factor
+
+    Returns:
+        Scaled samples
+    """
+    np = optional_module("numpy")
+    if np is not None:
+        samples = np.frombuffer(raw, dtype=np.int16).astype(np.float64) * gain
+        return np.clip(samples, -32768, 32767).astype(np.int16).tobytes()
+
+    samples = array('h')
+    samples.frombytes(raw[:len(raw) - len(raw) % 2])
+    scaled = array('h', [max(-32768, min(32767, int(value * gain))) for value in samples])
+    return scaled.tobytes()
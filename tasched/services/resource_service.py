@@ -1,13 +1,78 @@
 """
 TaSched - Resource Service
 Asset discovery and loading (PyInstaller compatible)
+Asset directories are indexed once (name -> path) and re-scanned only
+when a directory's mtime changes, so lookups are dictionary hits.
+Frozen builds can ship images and tones in one memory-mapped asset
+bundle; bundled assets get "bundle:<type>/<name>" paths, which
+open_asset() and the other asset helpers accept alongside file paths.
 """
 
+import io
 import os
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Optional, List
-from tasched.constants import ASSETS_DIR, IMAGES_DIR, SOUNDS_DIR
+from typing import BinaryIO, Dict, Optional, List, Tuple
+from tasched.constants import (
+    ASSETS_DIR,
+    IMAGES_DIR,
+    SOUNDS_DIR,
+    SOUND_EXTENSIONS,
+    IMAGE_EXTENSIONS,
+    ASSET_INDEX_CHECK_INTERVAL,
+    ASSET_BUNDLE_FILE,
+    ASSET_BUNDLE_ENV,
+    BUNDLE_PATH_PREFIX,
+    BUNDLE_EXTRACT_DIR
+)
+from tasched.services.asset_bundle import AssetBundle, BundleError
+
+
+class DirectoryIndex:
+    """
+    Name -> path index of the files directly inside one directory
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.mtime_ns = None
+        self.files: Dict[str, str] = {}
+        self.sorted_names: List[str] = []
+        self.scan()
+
+    def scan(self):
+        """Re-read the directory"""
+        files = {}
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+            with os.scandir(self.path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        files[os.path.normcase(entry.name)] = entry.path
+        except OSError:
+            mtime_ns = None
+
+        self.files = files
+        self.sorted_names = sorted(os.path.basename(path) for path in files.values())
+        self.mtime_ns = mtime_ns
+
+    def is_stale(self) -> bool:
+        """Check the directory mtime against the last scan"""
+        try:
+            return os.stat(self.path).st_mtime_ns != self.mtime_ns
+        except OSError:
+            return self.mtime_ns is not None
+
+    def get(self, filename: str) -> Optional[str]:
+        """Look up a file by name"""
+        return self.files.get(os.path.normcase(filename))
+
+    def list_names(self, extensions) -> List[str]:
+        """Sorted file names with one of the given extensions"""
+        return [name for name in self.sorted_names
+                if os.path.splitext(name)[1].lower() in extensions]
 
 
 class ResourceService:
@@ -21,6 +86,16 @@ class ResourceService:
         self.images_path = self._get_images_path()
         self.sounds_path = self._get_sounds_path()
 
+        self._index_lock = threading.Lock()
+        self._last_index_check = 0.0
+        self._indexes: Dict[str, DirectoryIndex] = {
+            'image': DirectoryIndex(self.images_path),
+            'sound': DirectoryIndex(self.sounds_path),
+            'asset': DirectoryIndex(self.assets_path)
+        }
+
+        self.bundle = self._load_bundle()
+
     def _get_base_path(self) -> Path:
         """
         Get the base path of the application
@@ -46,6 +121,28 @@ class ResourceService:
         """Get sounds directory path"""
         return self.base_path / SOUNDS_DIR
 
+    def _load_bundle(self) -> Optional[AssetBundle]:
+        """Open the asset bundle if one is configured or shipped with a frozen build"""
+        candidates = []
+        forced = os.environ.get(ASSET_BUNDLE_ENV)
+        if forced:
+            candidates.append(Path(forced))
+        elif getattr(sys, 'frozen', False):
+            candidates.append(Path(sys.executable).parent / ASSET_BUNDLE_FILE)
+            candidates.append(self.base_path / ASSET_BUNDLE_FILE)
+
+        for candidate in candidates:
+            if candidate.is_file():
+                try:
+                    bundle = AssetBundle(candidate)
+                    print(f"[ResourceService] Using asset bundle {candidate}")
+                    return bundle
+                except BundleError as e:
+                    print(f"[ResourceService] {e}")
+
+        # Development (or no bundle shipped): plain files
+        return None
+
     def resource_path(self, relative_path: str) -> str:
         """
         Get absolute path to resource
@@ -59,6 +156,27 @@ class ResourceService:
         full_path = self.base_path / relative_path
         return str(full_path)
 
+    # ========== Asset Index ==========
+
+    def refresh_index(self, force: bool = False):
+        """
+        Re-scan asset directories whose mtime changed
+
+        Args:
+            force: Re-scan every directory regardless of mtime
+        """
+        with self._index_lock:
+            for index in self._indexes.values():
+                if force or index.is_stale():
+                    index.scan()
+            self._last_index_check = time.monotonic()
+
+    def _get_index(self, asset_type: str) -> DirectoryIndex:
+        """Get a directory index, checking for changes at most once per interval"""
+        if time.monotonic() - self._last_index_check >= ASSET_INDEX_CHECK_INTERVAL:
+            self.refresh_index()
+        return self._indexes[asset_type]
+
     def find_asset(self, filename: str, asset_type: str = None) -> Optional[str]:
         """
         Find an asset file by name
@@ -70,25 +188,45 @@ class ResourceService:
         Returns:
             Absolute path to asset if found, None otherwise
         """
-        search_paths = []
+        if not filename:
+            return None
+
+        # Paths (absolute or with subdirectories) are not in the name index
+        if os.path.basename(filename) != filename:
+            return self._find_asset_path(filename, asset_type)
+
+        if asset_type in ('image', 'sound'):
+            index_types = [asset_type]
+        else:
+            # Search in all asset directories
+            index_types = ['image', 'sound', 'asset']
+
+        for index_type in index_types:
+            asset_path = self._get_index(index_type).get(filename)
+            if asset_path:
+                return asset_path
 
+        if self.bundle:
+            for index_type in index_types:
+                name = self.bundle.find(filename, index_type)
+                if name:
+                    return f"{BUNDLE_PATH_PREFIX}{index_type}/{name}"
+
+        return None
+
+    def _find_asset_path(self, filename: str, asset_type: str = None) -> Optional[str]:
+        """Resolve a filename containing a path with stat calls"""
         if asset_type == 'image':
             search_paths = [self.images_path]
         elif asset_type == 'sound':
             search_paths = [self.sounds_path]
         else:
-            # Search in all asset directories
-            search_paths = [
-                self.images_path,
-                self.sounds_path,
-                self.assets_path
-            ]
+            search_paths = [self.images_path, self.sounds_path, self.assets_path]
 
         for search_path in search_paths:
-            if search_path.exists():
-                asset_path = search_path / filename
-                if asset_path.exists() and asset_path.is_file():
-                    return str(asset_path)
+            asset_path = search_path / filename
+            if asset_path.is_file():
+                return str(asset_path)
 
         return None
 
@@ -105,42 +243,39 @@ class ResourceService:
         List all available sound files
 
         Returns:
-            List of sound file paths
+            List of sound file paths (sorted)
         """
-        sounds = []
-        if self.sounds_path.exists():
-            for file_path in self.sounds_path.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in ['.mp3', '.wav', '.ogg']:
-                    sounds.append(str(file_path))
-        return sorted(sounds)
+        return self._list_paths('sound', SOUND_EXTENSIONS)
 
     def list_sound_names(self) -> List[str]:
         """
         List all available sound file names (without path)
 
         Returns:
-            List of sound filenames
+            List of sound filenames (sorted)
         """
-        sounds = []
-        if self.sounds_path.exists():
-            for file_path in self.sounds_path.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in ['.mp3', '.wav', '.ogg']:
-                    sounds.append(file_path.name)
-        return sorted(sounds)
+        names = self._get_index('sound').list_names(SOUND_EXTENSIONS)
+        if self.bundle:
+            names = sorted(set(names).union(self.bundle.names('sound')))
+        return names
 
     def list_images(self) -> List[str]:
         """
         List all available image files
 
         Returns:
-            List of image file paths
+            List of image file paths (sorted)
         """
-        images = []
-        if self.images_path.exists():
-            for file_path in self.images_path.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.webp', '.ico']:
-                    images.append(str(file_path))
-        return sorted(images)
+        return self._list_paths('image', IMAGE_EXTENSIONS)
+
+    def _list_paths(self, asset_type: str, extensions) -> List[str]:
+        """Sorted paths of one asset type, loose files taking precedence over the bundle"""
+        index = self._get_index(asset_type)
+        paths = {name: index.get(name) for name in index.list_names(extensions)}
+        if self.bundle:
+            for name in self.bundle.names(asset_type):
+                paths.setdefault(name, f"{BUNDLE_PATH_PREFIX}{asset_type}/{name}")
+        return [paths[name] for name in sorted(paths)]
 
     def asset_exists(self, filename: str, asset_type: str = None) -> bool:
         """
@@ -155,6 +290,85 @@ class ResourceService:
         """
         return self.find_asset(filename, asset_type) is not None
 
+    # ========== Asset Access (files and bundle) ==========
+
+    def _split_bundle_path(self, path: str) -> Optional[Tuple[str, str]]:
+        """Get (asset_type, name) for a bundle path, or None for file paths"""
+        if not path or not path.startswith(BUNDLE_PATH_PREFIX):
+            return None
+        asset_type, _, name = path[len(BUNDLE_PATH_PREFIX):].partition('/')
+        return asset_type, name
+
+    def is_bundled(self, path: str) -> bool:
+        """Check if a path refers to an asset inside the bundle"""
+        return self._split_bundle_path(path) is not None
+
+    def asset_available(self, path: str) -> bool:
+        """Check if a file or bundle path can be opened"""
+        parts = self._split_bundle_path(path)
+        if parts is None:
+            return bool(path) and os.path.isfile(path)
+        return bool(self.bundle) and self.bundle.find(parts[1], parts[0]) is not None
+
+    def open_asset(self, path: str) -> BinaryIO:
+        """
+        Open a file or bundle path for binary reading
+
+        Raises:
+            FileNotFoundError: If the asset does not exist
+        """
+        parts = self._split_bundle_path(path)
+        if parts is None:
+            return open(path, 'rb')
+        try:
+            return io.BufferedReader(self.bundle.open(parts[1], parts[0]))
+        except (AttributeError, KeyError):
+            raise FileNotFoundError(path)
+
+    def get_asset_view(self, path: str) -> Optional[memoryview]:
+        """Get a bundled asset's bytes without copying (None for file paths)"""
+        parts = self._split_bundle_path(path)
+        if parts is None or not self.bundle:
+            return None
+        return self.bundle.get_view(parts[1], parts[0])
+
+    def asset_stamp(self, path: str) -> Tuple[int, int]:
+        """
+        Get (mtime_ns, size) identifying the current version of an asset
+        Bundled assets carry the bundle file's mtime
+
+        Raises:
+            OSError: If the asset does not exist
+        """
+        parts = self._split_bundle_path(path)
+        if parts is None:
+            stat = os.stat(path)
+            return stat.st_mtime_ns, stat.st_size
+        try:
+            return self.bundle.mtime_ns, self.bundle.get_size(parts[1], parts[0])
+        except (AttributeError, KeyError):
+            raise FileNotFoundError(path)
+
+    def materialize(self, path: str) -> str:
+        """
+        Get a real file path for an asset, extracting it from the bundle
+        if needed (for APIs such as iconbitmap that only take file names)
+        """
+        parts = self._split_bundle_path(path)
+        if parts is None:
+            return path
+
+        asset_type, name = parts
+        view = self.get_asset_view(path)
+        target = self.get_data_path() / BUNDLE_EXTRACT_DIR / asset_type / name
+        if not target.is_file() or target.stat().st_size != len(view):
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_suffix(target.suffix + ".tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(view)
+            os.replace(tmp_path, target)
+        return str(target)
+
     def get_data_path(self) -> Path:
         """Get data directory path"""
         data_path = self.base_path / "tasched" / "data"
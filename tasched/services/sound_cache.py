@@ -0,0 +1,153 @@
+"""
+TaSched - Sound Cache
+Decoded sounds kept in memory for low-latency alerts
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+
+from tasched.constants import (
+    AUDIO_FREQUENCY,
+    AUDIO_SIZE,
+    AUDIO_CHANNELS,
+    AUDIO_SOUND_CACHE_MAX_BYTES
+)
+from tasched.services.audio_backend import AudioBackend, get_audio_backend
+from tasched.services.resource_service import get_resource_service
+
+
+class SoundCache:
+    """
+    LRU cache of decoded sounds, capped by approximate PCM size
+    Each file is decoded once; later plays reuse the decoded buffer
+    """
+
+    def __init__(self, max_bytes: int = AUDIO_SOUND_CACHE_MAX_BYTES, backend: AudioBackend = None):
+        self.backend = backend or get_audio_backend()
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._sounds: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sound_path: str) -> Optional[Any]:
+        """
+        Get a decoded sound, decoding and caching it on a miss
+
+        Args:
+            sound_path: Path to the sound file
+
+        Returns:
+            Backend sound, or None if the file could not be decoded
+        """
+        with self._lock:
+            entry = self._sounds.get(sound_path)
+            if entry:
+                self._sounds.move_to_end(sound_path)
+                return entry[0]
+
+        return self.load(sound_path)
+
+    def load(self, sound_path: str) -> Optional[Any]:
+        """
+        Decode a sound file into the cache
+
+        Args:
+            sound_path: Path to the sound file
+
+        Returns:
+            Backend sound, or None if the file could not be decoded
+        """
+        if not get_resource_service().asset_available(sound_path):
+            print(f"[SoundCache] Sound file not found: {sound_path}")
+            return None
+
+        try:
+            sound = self.backend.load_sound(sound_path)
+        except Exception as e:
+            print(f"[SoundCache] Error decoding {os.path.basename(sound_path)}: {e}")
+            return None
+
+        size = self._estimate_size(sound)
+
+        with self._lock:
+            previous = self._sounds.pop(sound_path, None)
+            if previous:
+                self.total_bytes -= previous[1]
+
+            self._sounds[sound_path] = (sound, size)
+            self.total_bytes += size
+            self._evict()
+
+        return sound
+
+    def put(self, key: str, sound: Any):
+        """
+        Cache a sound built in memory (e.g. a synthesised tone)
+
+        Args:
+            key: Cache key
+            sound: Decoded sound
+        """
+        size = self._estimate_size(sound)
+        with self._lock:
+            previous = self._sounds.pop(key, None)
+            if previous:
+                self.total_bytes -= previous[1]
+
+            self._sounds[key] = (sound, size)
+            self.total_bytes += size
+            self._evict()
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Get a cached sound without loading it on a miss"""
+        with self._lock:
+            entry = self._sounds.get(key)
+            if entry:
+                self._sounds.move_to_end(key)
+                return entry[0]
+        return None
+
+    def preload(self, sound_paths: Iterable[str]):
+        """
+        Decode several sounds ahead of time
+
+        Args:
+            sound_paths: Paths to decode
+        """
+        for sound_path in sound_paths:
+            with self._lock:
+                cached = sound_path in self._sounds
+            if not cached:
+                self.load(sound_path)
+
+    def contains(self, sound_path: str) -> bool:
+        """Check if a sound is already decoded"""
+        with self._lock:
+            return sound_path in self._sounds
+
+    def discard(self, sound_path: str):
+        """Drop a sound from the cache"""
+        with self._lock:
+            entry = self._sounds.pop(sound_path, None)
+            if entry:
+                self.total_bytes -= entry[1]
+
+    def clear(self):
+        """Drop every cached sound"""
+        with self._lock:
+            self._sounds.clear()
+            self.total_bytes = 0
+
+    def _evict(self):
+        """Evict least recently used sounds until under the memory cap"""
+        # Always keep the most recent entry, even if it alone exceeds the cap
+        while self.total_bytes > self.max_bytes and len(self._sounds) > 1:
+            _, (_, size) = self._sounds.popitem(last=False)
+            self.total_bytes -= size
+
+    def _estimate_size(self, sound: Any) -> int:
+        """Estimate decoded PCM size in bytes from the sound length"""
+        bytes_per_frame = AUDIO_CHANNELS * (abs(AUDIO_SIZE) // 8)
+        return int(self.backend.sound_length(sound) * AUDIO_FREQUENCY * bytes_per_frame)
@@ -0,0 +1,123 @@
+"""
+TaSched - Startup Profile
+Time-to-first-window report
+With TASCHED_PROFILE_STARTUP=1 every module imported during startup is
+timed, and the startup phases plus the slowest imports are printed once
+the setup window is on screen.
+"""
+
+import builtins
+import os
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from tasched.constants import STARTUP_PROFILE_ENV, STARTUP_TARGET_MS
+
+
+class StartupProfiler:
+    """
+    Records startup phase marks and per-module import times
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self.marks: List[Tuple[str, float]] = []
+        self.imports: Dict[str, float] = {}
+        self._original_import = None
+
+    # ========== Import Timing ==========
+
+    def install_import_hook(self):
+        """Start timing first-time imports (no-op unless profiling is enabled)"""
+        if not self.enabled or self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def remove_import_hook(self):
+        """Stop timing imports"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """builtins.__import__ replacement recording each module's first import"""
+        original = self._original_import
+        if level or name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+
+        started = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            # Inclusive of anything the module imports itself
+            self.imports.setdefault(name, time.perf_counter() - started)
+
+    # ========== Phases ==========
+
+    def mark(self, label: str):
+        """Record a startup phase"""
+        self.marks.append((label, time.perf_counter()))
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the profiler was created"""
+        return (time.perf_counter() - self.started) * 1000
+
+    def finish(self):
+        """Stop import timing and print the report (if profiling is enabled)"""
+        self.remove_import_hook()
+        if self.enabled:
+            print(self.report())
+
+    def report(self, top: int = 15) -> str:
+        """
+        Startup phases and the slowest imports
+
+        Args:
+            top: Number of imports to list
+
+        Returns:
+            Report text
+        """
+        lines = ["[StartupProfile] Phases (ms since start):"]
+        previous = self.started
+        for label, when in self.marks:
+            lines.append(f"  {label:<36}{(when - self.started) * 1000:>9.1f}  (+{(when - previous) * 1000:.1f})")
+            previous = when
+
+        shown = next((when for label, when in self.marks if label == SETUP_SHOWN_MARK), None)
+        if shown is not None:
+            shown_ms = (shown - self.started) * 1000
+            verdict = "within" if shown_ms <= STARTUP_TARGET_MS else "over"
+            lines.append(f"  Setup window shown at {shown_ms:.1f} ms ({verdict} the {STARTUP_TARGET_MS} ms target)")
+
+        if self.imports:
+            lines.append(f"[StartupProfile] Slowest imports (inclusive ms, {len(self.imports)} modules):")
+            slowest = sorted(self.imports.items(), key=lambda item: item[1], reverse=True)[:top]
+            for name, duration in slowest:
+                lines.append(f"  {name:<36}{duration * 1000:>9.1f}")
+
+        return "\n".join(lines)
+
+
+SETUP_SHOWN_MARK = "setup window shown"
+
+# Global startup profiler instance
+_startup_profiler = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """
+    Get or create the global startup profiler
+    Profiling is enabled by the TASCHED_PROFILE_STARTUP environment variable
+
+    Returns:
+        StartupProfiler instance
+    """
+    global _startup_profiler
+    if _startup_profiler is None:
+        enabled = os.environ.get(STARTUP_PROFILE_ENV, "").strip() not in ("", "0")
+        _startup_profiler = StartupProfiler(enabled)
+    return _startup_profiler
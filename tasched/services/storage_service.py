@@ -4,13 +4,15 @@ SQLite database management for schedules, tasks, and run history
 JSON for settings and templates
 """
 
-import sqlite3
 import json
+import threading
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 from tasched.core.models import Task, Schedule, Settings
+from tasched.core.serializers import dumps, loads
+from tasched.core.snapshot import is_snapshot, schedule_from_snapshot, schedule_to_snapshot
 from tasched.services.resource_service import get_resource_service
 
 
@@ -32,11 +34,38 @@ class StorageService:
         self.settings_path = resource_service.get_data_file("settings.json")
         self.templates_path = resource_service.get_data_file("templates.json")
 
-        # Initialize database
-        self._initialize_database()
+        # Database tables are created on first use (or by warm_up())
+        self._db_ready = False
+        self._db_lock = threading.Lock()
+
+    def warm_up(self):
+        """Import sqlite3 and create the database tables on a background thread"""
+        if self._db_ready:
+            return
+        threading.Thread(target=self._ensure_database, name="StorageWarmUp", daemon=True).start()
+
+    def _connect(self):
+        """Open a database connection (sqlite3 is imported on first use)"""
+        import sqlite3
+        self._ensure_database()
+        return sqlite3.connect(self.db_path)
+
+    def _ensure_database(self):
+        """Create the database tables once per process"""
+        if self._db_ready:
+            return
+        with self._db_lock:
+            if self._db_ready:
+                return
+            try:
+                self._initialize_database()
+                self._db_ready = True
+            except Exception as e:
+                print(f"[StorageService] Error initializing database: {e}")
 
     def _initialize_database(self):
         """Create database tables if they don't exist"""
+        import sqlite3
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
@@ -104,10 +133,9 @@ class StorageService:
 
     def save_task(self, task: Task):
         """Save or update a task"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
-        task_dict = task.to_dict()
         now = datetime.now().isoformat()
 
         cursor.execute('''
@@ -124,10 +152,10 @@ class StorageService:
             task.mode,
             task.absolute_start_time,
             task.repeat,
-            json.dumps(task.repeat_days),
-            json.dumps(task.warning_points_seconds),
-            json.dumps(task.sound_profile.to_dict()),
-            json.dumps(task.display.to_dict()),
+            dumps(task.repeat_days),
+            dumps(task.warning_points_seconds),
+            dumps(task.sound_profile.to_dict()),
+            dumps(task.display.to_dict()),
             task.id,  # For COALESCE
             now,      # If new
             now       # updated_at
@@ -138,7 +166,7 @@ class StorageService:
 
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute('SELECT * FROM tasks WHERE id = ?', (task_id,))
@@ -152,7 +180,7 @@ class StorageService:
 
     def get_all_tasks(self) -> List[Task]:
         """Get all tasks"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute('SELECT * FROM tasks ORDER BY created_at DESC')
@@ -163,7 +191,7 @@ class StorageService:
 
     def delete_task(self, task_id: str):
         """Delete a task"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute('DELETE FROM tasks WHERE id = ?', (task_id,))
         conn.commit()
@@ -178,10 +206,10 @@ class StorageService:
             mode=row[3],
             absolute_start_time=row[4],
             repeat=row[5],
-            repeat_days=json.loads(row[6]) if row[6] else [],
-            warning_points_seconds=json.loads(row[7]) if row[7] else [],
-            sound_profile=json.loads(row[8]) if row[8] else {},
-            display=json.loads(row[9]) if row[9] else {}
+            repeat_days=loads(row[6]) if row[6] else [],
+            warning_points_seconds=loads(row[7]) if row[7] else [],
+            sound_profile=loads(row[8]) if row[8] else {},
+            display=loads(row[9]) if row[9] else {}
         )
 
     # ========== Schedule Operations ==========
@@ -193,7 +221,7 @@ class StorageService:
             self.save_task(task)
 
         # Save schedule
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         now = datetime.now().isoformat()
@@ -208,7 +236,7 @@ class StorageService:
             schedule.id,
             schedule.name,
             schedule.date,
-            json.dumps(schedule.task_ids),
+            dumps(schedule.task_ids),
             1 if schedule.auto_start else 0,
             1 if schedule.auto_advance else 0,
             schedule.gap_between_tasks,
@@ -222,7 +250,7 @@ class StorageService:
 
     def get_schedule(self, schedule_id: str) -> Optional[Schedule]:
         """Get a schedule by ID (with tasks)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute('SELECT * FROM schedules WHERE id = ?', (schedule_id,))
@@ -236,7 +264,7 @@ class StorageService:
 
     def get_all_schedules(self) -> List[Schedule]:
         """Get all schedules"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute('SELECT * FROM schedules ORDER BY created_at DESC')
@@ -247,7 +275,7 @@ class StorageService:
 
     def delete_schedule(self, schedule_id: str):
         """Delete a schedule"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute('DELETE FROM schedules WHERE id = ?', (schedule_id,))
         conn.commit()
@@ -255,7 +283,7 @@ class StorageService:
 
     def _row_to_schedule(self, row) -> Schedule:
         """Convert database row to Schedule object"""
-        task_ids = json.loads(row[3]) if row[3] else []
+        task_ids = loads(row[3]) if row[3] else []
         tasks = [self.get_task(tid) for tid in task_ids]
         tasks = [t for t in tasks if t is not None]  # Filter out None values
 
@@ -274,8 +302,8 @@ class StorageService:
     # ========== Template Operations ==========
 
     def save_template(self, name: str, description: str, schedule: Schedule):
-        """Save a schedule as a template"""
-        conn = sqlite3.connect(self.db_path)
+        """Save a schedule as a template (JSON: faster to save and load than a snapshot)"""
+        conn = self._connect()
         cursor = conn.cursor()
 
         template_id = f"template_{name.lower().replace(' ', '_')}"
@@ -290,7 +318,7 @@ class StorageService:
             template_id,
             name,
             description,
-            json.dumps(schedule.to_dict()),
+            dumps(schedule.to_dict()),
             template_id,  # For COALESCE
             now,          # If new
             now           # updated_at
@@ -301,7 +329,7 @@ class StorageService:
 
     def get_template(self, template_id: str) -> Optional[Schedule]:
         """Get a template by ID"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute('SELECT schedule_data FROM templates WHERE id = ?', (template_id,))
@@ -311,12 +339,13 @@ class StorageService:
         if not row or not row[0]:
             return None
 
-        schedule_data = json.loads(row[0])
-        return Schedule.from_dict(schedule_data)
+        if is_snapshot(row[0]):
+            return schedule_from_snapshot(row[0])  # saved by an earlier version
+        return Schedule.from_dict(loads(row[0]))
 
     def get_all_templates(self) -> List[Dict[str, Any]]:
         """Get all templates"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute('SELECT id, name, description FROM templates ORDER BY name')
@@ -330,17 +359,50 @@ class StorageService:
 
     def delete_template(self, template_id: str):
         """Delete a template"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute('DELETE FROM templates WHERE id = ?', (template_id,))
         conn.commit()
         conn.close()
 
+    # ========== Export / Import ==========
+
+    def export_schedule(self, schedule: Schedule, path: str, compress: bool = True):
+        """
+        Write a schedule to a snapshot file (a few percent of the JSON size,
+        for copying schedules between hall PCs)
+
+        Args:
+            schedule: Schedule to export
+            path: Destination file
+            compress: zlib-compress the snapshot
+        """
+        Path(path).write_bytes(schedule_to_snapshot(schedule, compress))
+
+    def import_schedule(self, path: str) -> Optional[Schedule]:
+        """
+        Read a schedule from a snapshot or JSON export
+
+        Args:
+            path: Source file
+
+        Returns:
+            Schedule, or None if the file cannot be read
+        """
+        try:
+            data = Path(path).read_bytes()
+            if is_snapshot(data):
+                return schedule_from_snapshot(data)
+            return Schedule.from_dict(loads(data))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Error importing schedule: {e}")
+            return None
+
     # ========== Run History ==========
 
     def log_event(self, schedule_id: str, schedule_name: str, event_type: str, event_data: Dict[str, Any] = None):
         """Log a schedule run event"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -357,9 +419,39 @@ class StorageService:
         conn.commit()
         conn.close()
 
+    def log_events(self, events: List[Tuple[str, str, str, Optional[Dict[str, Any]], datetime]]):
+        """
+        Log several run events in one transaction
+
+        Args:
+            events: List of (schedule_id, schedule_name, event_type, event_data, timestamp)
+        """
+        if not events:
+            return
+
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.executemany('''
+            INSERT INTO run_history (schedule_id, schedule_name, event_type, event_data, timestamp)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [
+            (
+                schedule_id,
+                schedule_name,
+                event_type,
+                json.dumps(event_data) if event_data else None,
+                timestamp.isoformat()
+            )
+            for schedule_id, schedule_name, event_type, event_data, timestamp in events
+        ])
+
+        conn.commit()
+        conn.close()
+
     def get_run_history(self, schedule_id: str = None, limit: int = 100) -> List[Dict[str, Any]]:
         """Get run history"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         if schedule_id:
@@ -0,0 +1,323 @@
+"""
+TaSched - Tone Cache
+Background transcoding of alert tones into cached PCM WAV files
+Cached copies live in the data directory, keyed by the source file's
+content hash and checked against its mtime/size on every lookup.
+Each tone's loudness is analysed once per content hash so alerts can be
+played at a consistent perceived level.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import wave
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from tasched.constants import TONE_CACHE_DIR
+from tasched.services.audio_backend import get_audio_backend
+from tasched.services.resource_service import get_resource_service
+from tasched.services.loudness import measure_loudness, compute_gain, apply_gain
+
+
+class ToneCache:
+    """
+    Maintains decoded WAV copies of tones so playback never pays codec cost
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir: str = None):
+        self.resource = get_resource_service()
+        if cache_dir:
+            self.cache_dir = Path(cache_dir)
+        else:
+            self.cache_dir = self.resource.get_data_path() / TONE_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.index_path = self.cache_dir / self.INDEX_FILE
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict] = self._load_index()
+
+    # ========== Lookup ==========
+
+    def resolve(self, source_path: str) -> str:
+        """
+        Get the path playback should use for a tone
+
+        Args:
+            source_path: Original tone path
+
+        Returns:
+            Cached WAV path if fresh, otherwise the original path
+        """
+        cached = self.cached_path(source_path)
+        return cached if cached else source_path
+
+    def cached_path(self, source_path: str) -> Optional[str]:
+        """
+        Get the cached WAV for a tone if it is still up to date
+
+        Args:
+            source_path: Original tone path
+
+        Returns:
+            Cached WAV path, or None if missing or stale
+        """
+        with self._lock:
+            entry = self._index.get(source_path)
+        if not entry:
+            return None
+
+        try:
+            mtime_ns, size = self.resource.asset_stamp(source_path)
+        except OSError:
+            return None
+
+        if entry['mtime'] != mtime_ns or entry['size'] != size:
+            return None
+
+        cached = self.cache_dir / entry['file']
+        return str(cached) if cached.exists() else None
+
+    def get_entry(self, source_path: str) -> Optional[Dict]:
+        """Get the raw index entry for a tone"""
+        with self._lock:
+            entry = self._index.get(source_path)
+            return dict(entry) if entry else None
+
+    def get_playback_gain(self, source_path: str) -> float:
+        """
+        Get the gain to apply at playback for a consistent alert level
+        Boosts are baked into the cached WAV, so this is at most 1.0
+        for cached tones
+
+        Args:
+            source_path: Original tone path
+
+        Returns:
+            Linear gain (1.0 if the tone has not been analysed)
+        """
+        if not self.cached_path(source_path):
+            return 1.0
+
+        entry = self.get_entry(source_path)
+        if not entry or 'gain' not in entry:
+            return 1.0
+        return entry['gain'] / entry.get('baked_gain', 1.0)
+
+    # ========== Transcoding ==========
+
+    def transcode(self, source_path: str) -> Optional[str]:
+        """
+        Transcode a tone into the cache if it is missing or stale
+        Requires an initialized audio backend
+
+        Args:
+            source_path: Original tone path
+
+        Returns:
+            Cached WAV path, or None if the tone could not be decoded
+        """
+        cached = self.cached_path(source_path)
+        if cached:
+            entry = self.get_entry(source_path)
+            if 'gain' not in entry:
+                self._analyse_cached(source_path, Path(cached))
+            return cached
+
+        try:
+            mtime_ns, size = self.resource.asset_stamp(source_path)
+            file_hash = self._hash_file(source_path)
+        except OSError as e:
+            print(f"[ToneCache] Cannot read {source_path}: {e}")
+            return None
+
+        cache_name = f"{file_hash[:20]}.wav"
+        cache_path = self.cache_dir / cache_name
+
+        # Identical content under another name is already cached and analysed
+        loudness = self._find_loudness(file_hash)
+        if not cache_path.exists() or loudness is None:
+            try:
+                loudness = self._write_wav(source_path, cache_path)
+            except Exception as e:
+                print(f"[ToneCache] Error transcoding {os.path.basename(source_path)}: {e}")
+                return None
+
+        with self._lock:
+            self._index[source_path] = {
+                'mtime': mtime_ns,
+                'size': size,
+                'hash': file_hash,
+                'file': cache_name,
+                **loudness
+            }
+        self._save_index()
+
+        return str(cache_path)
+
+    def prewarm(self, source_paths: Iterable[str],
+                on_complete: Callable[[List[str]], None] = None) -> threading.Thread:
+        """
+        Transcode tones on a background thread
+
+        Args:
+            source_paths: Tones to transcode
+            on_complete: Optional callback receiving the source paths once done
+                         (called on the background thread)
+
+        Returns:
+            The started thread
+        """
+        paths = list(source_paths)
+
+        def run():
+            from tasched.services.audio_service import get_audio_service
+
+            # Decoding needs the mixer the audio worker initializes
+            if get_audio_service().wait_until_ready(timeout=10.0):
+                for path in paths:
+                    self.transcode(path)
+
+            if on_complete:
+                on_complete(paths)
+
+        thread = threading.Thread(target=run, name="TonePrewarm", daemon=True)
+        thread.start()
+        return thread
+
+    # ========== Internals ==========
+
+    def _write_wav(self, source_path: str, cache_path: Path) -> Dict:
+        """
+        Decode a tone with the audio backend, analyse it and write it as
+        PCM WAV in mixer format, with any loudness boost baked in
+
+        Returns:
+            Loudness fields for the index entry
+        """
+        backend = get_audio_backend()
+        frequency, size, channels = backend.get_format()
+        raw = backend.sound_raw(backend.load_sound(source_path))
+        sample_width = abs(size) // 8
+
+        raw, loudness = self._normalise(raw, sample_width)
+        self._save_wav(cache_path, raw, channels, sample_width, frequency)
+        return loudness
+
+    def _analyse_cached(self, source_path: str, cache_path: Path):
+        """Analyse a tone cached before loudness analysis existed"""
+        try:
+            with wave.open(str(cache_path), 'rb') as wav:
+                channels = wav.getnchannels()
+                sample_width = wav.getsampwidth()
+                frequency = wav.getframerate()
+                raw = wav.readframes(wav.getnframes())
+
+            normalised, loudness = self._normalise(raw, sample_width)
+            if normalised is not raw:
+                self._save_wav(cache_path, normalised, channels, sample_width, frequency)
+        except Exception as e:
+            print(f"[ToneCache] Error analysing {os.path.basename(source_path)}: {e}")
+            return
+
+        with self._lock:
+            entry = self._index.get(source_path)
+            if entry:
+                entry.update(loudness)
+        self._save_index()
+
+    @staticmethod
+    def _normalise(raw: bytes, sample_width: int):
+        """
+        Measure loudness and bake in any boost (attenuation is left to playback)
+
+        Returns:
+            Tuple of (samples to write, loudness fields)
+        """
+        if sample_width != 2:
+            return raw, {'rms': None, 'peak': None, 'gain': 1.0, 'baked_gain': 1.0}
+
+        rms, peak = measure_loudness(raw)
+        gain = compute_gain(rms, peak)
+        baked_gain = 1.0
+        if gain > 1.0:
+            # Mixer volume cannot exceed 1.0, so boosts go into the samples
+            raw = apply_gain(raw, gain)
+            baked_gain = gain
+
+        return raw, {'rms': rms, 'peak': peak, 'gain': gain, 'baked_gain': baked_gain}
+
+    @staticmethod
+    def _save_wav(cache_path: Path, raw: bytes, channels: int, sample_width: int, frequency: int):
+        """Write PCM frames to a WAV file atomically"""
+        tmp_path = cache_path.with_suffix(".tmp")
+        with wave.open(str(tmp_path), 'wb') as wav:
+            wav.setnchannels(channels)
+            wav.setsampwidth(sample_width)
+            wav.setframerate(frequency)
+            wav.writeframes(raw)
+        os.replace(tmp_path, cache_path)
+
+    def _find_loudness(self, file_hash: str) -> Optional[Dict]:
+        """Reuse loudness analysis from any entry with the same content"""
+        with self._lock:
+            for entry in self._index.values():
+                if entry.get('hash') == file_hash and 'gain' in entry:
+                    return {key: entry[key] for key in ('rms', 'peak', 'gain', 'baked_gain')}
+        return None
+
+    def _hash_file(self, path: str) -> str:
+        """Hash file content (bundled tones are hashed straight from the mapping)"""
+        digest = hashlib.sha1()
+        view = self.resource.get_asset_view(path)
+        if view is not None:
+            digest.update(view)
+            return digest.hexdigest()
+
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        """Load the cache index"""
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[ToneCache] Error loading index: {e}")
+            return {}
+
+    def _save_index(self):
+        """Write the cache index atomically"""
+        with self._lock:
+            data = json.dumps(self._index, indent=2)
+        tmp_path = self.index_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.index_path)
+        except Exception as e:
+            print(f"[ToneCache] Error saving index: {e}")
+
+
+# Global tone cache instance
+_tone_cache = None
+
+
+def get_tone_cache() -> ToneCache:
+    """
+    Get or create the global tone cache instance
+
+    Returns:
+        ToneCache instance
+    """
+    global _tone_cache
+    if _tone_cache is None:
+        _tone_cache = ToneCache()
+    return _tone_cache
@@ -0,0 +1,154 @@
+"""
+TaSched - Tone Synthesiser
+Builds alert beep patterns directly into 16-bit PCM sample buffers
+Buffers feed the audio backend directly, with no disk I/O or decoding.
+Uses numpy when available (imported on first use), otherwise the stdlib array module.
+"""
+
+import math
+from array import array
+from dataclasses import dataclass
+from typing import List, Optional
+
+from tasched.core.lazy_import import optional_module
+from tasched.constants import (
+    AUDIO_FREQUENCY,
+    AUDIO_CHANNELS,
+    SYNTH_TONE_PREFIX
+)
+
+
+@dataclass(frozen=True)
+class BeepPattern:
+    """A repeated sine beep"""
+    frequency: float  # Hz
+    duration_ms: int  # length of each beep
+    repeat: int = 1  # number of beeps
+    gap_ms: int = 100  # silence between beeps
+    amplitude: float = 0.6  # peak level relative to full scale
+    ramp_ms: int = 5  # fade in/out per beep to avoid clicks
+
+
+# One pattern per warning threshold, earliest (largest) threshold first.
+# Later warnings beep more often and higher so they are told apart by ear.
+WARNING_PATTERNS: List[BeepPattern] = [
+    BeepPattern(frequency=660, duration_ms=220, repeat=1),
+    BeepPattern(frequency=784, duration_ms=180, repeat=2, gap_ms=120),
+    BeepPattern(frequency=988, duration_ms=140, repeat=3, gap_ms=90),
+]
+
+TIMEUP_PATTERN = BeepPattern(frequency=880, duration_ms=450, repeat=3, gap_ms=200, amplitude=0.7)
+
+TIMEUP_TONE_KEY = f"{SYNTH_TONE_PREFIX}timeup"
+
+
+def is_synth_tone(name: Optional[str]) -> bool:
+    """Check if a sound name refers to a synthesised tone"""
+    return bool(name) and name.startswith(SYNTH_TONE_PREFIX)
+
+
+def warning_tone_key(level: int) -> str:
+    """
+    Get the synth tone key for a warning level
+
+    Args:
+        level: 0 for the first (earliest) warning, increasing towards time-up
+    """
+    level = max(0, min(level, len(WARNING_PATTERNS) - 1))
+    return f"{SYNTH_TONE_PREFIX}warning:{level}"
+
+
+def pattern_for_key(key: str) -> BeepPattern:
+    """
+    Look up the beep pattern behind a synth tone key
+
+    Args:
+        key: Key from warning_tone_key() or TIMEUP_TONE_KEY
+
+    Returns:
+        BeepPattern (the first warning pattern for unknown keys)
+    """
+    if key == TIMEUP_TONE_KEY:
+        return TIMEUP_PATTERN
+
+    prefix = f"{SYNTH_TONE_PREFIX}warning:"
+    if key.startswith(prefix):
+        try:
+            return WARNING_PATTERNS[int(key[len(prefix):])]
+        except (ValueError, IndexError):
+            pass
+    return WARNING_PATTERNS[0]
+
+
+def render_pattern(pattern: BeepPattern, sample_rate: int = AUDIO_FREQUENCY,
+                   channels: int = AUDIO_CHANNELS) -> bytes:
+    """
+    Render a beep pattern into interleaved signed 16-bit PCM
+
+    Args:
+        pattern: Beep pattern to render
+        sample_rate: Output sample rate in Hz
+        channels: Output channel count (samples are duplicated per channel)
+
+    Returns:
+        Raw sample buffer in native byte order
+    """
+    beep_frames = max(1, int(sample_rate * pattern.duration_ms / 1000))
+    gap_frames = int(sample_rate * pattern.gap_ms / 1000)
+    ramp_frames = min(beep_frames // 2, int(sample_rate * pattern.ramp_ms / 1000))
+    peak = 32767 * max(0.0, min(1.0, pattern.amplitude))
+    step = 2.0 * math.pi * pattern.frequency / sample_rate
+
+    np = optional_module("numpy")
+    if np is not None:
+        index = np.arange(beep_frames)
+        beep = np.sin(index * step) * peak
+        if ramp_frames:
+            ramp = np.linspace(0.0, 1.0, ramp_frames)
+            beep[:ramp_frames] *= ramp
+            beep[-ramp_frames:] *= ramp[::-1]
+        gap = np.zeros(gap_frames)
+        parts = []
+        for i in range(pattern.repeat):
+            parts.append(beep)
+            if i < pattern.repeat - 1:
+                parts.append(gap)
+        mono = np.concatenate(parts).astype(np.int16)
+        return np.repeat(mono, channels).tobytes()
+
+    def envelope(i):
+        if ramp_frames and i < ramp_frames:
+            return i / ramp_frames
+        if ramp_frames and i >= beep_frames - ramp_frames:
+            return (beep_frames - 1 - i) / ramp_frames
+        return 1.0
+
+    beep = array('h', [
+        int(math.sin(i * step) * peak * envelope(i))
+        for i in range(beep_frames)
+        for _ in range(channels)
+    ])
+    gap = array('h', [0]) * (gap_frames * channels)
+
+    samples = array('h')
+    for i in range(pattern.repeat):
+        samples.extend(beep)
+        if i < pattern.repeat - 1:
+            samples.extend(gap)
+    return samples.tobytes()
+
+
+def render_tone(key: str, sample_rate: int = AUDIO_FREQUENCY,
+                channels: int = AUDIO_CHANNELS) -> bytes:
+    """
+    Render the tone behind a synth key
+
+    Args:
+        key: Synth tone key
+        sample_rate: Output sample rate in Hz
+        channels: Output channel count
+
+    Returns:
+        Raw sample buffer
+    """
+    return render_pattern(pattern_for_key(key), sample_rate, channels)
@@ -1,350 +1,420 @@
 """
 TaSched - Alert Windows
 Warning popup and Time-Up windows
+Each window is built once, kept withdrawn, and only has its text,
+colours and images updated before it is shown. In dual display they
+open on the audience monitor.
 """
 
 import tkinter as tk
-from PIL import Image, ImageTk
+from typing import Optional
 
 from tasched.core.models import Task
 from tasched.core.time_service import TimeService
+from tasched.core.timer_hub import get_timer_hub
+from tasched.core.warning_engine import WarningEngine
 from tasched.services.theme_service import get_theme_service
 from tasched.services.resource_service import get_resource_service
 from tasched.services.audio_service import get_audio_service
+from tasched.services.image_service import get_image_service
+from tasched.ui.render_model import RenderModel
 from tasched.constants import *
 
 
+WARNING_DISMISS_JOB = "warning_popup.dismiss"
+TIMEUP_CLOSE_JOB = "timeup_window.close"
+
+
+def _center_geometry(window: tk.Misc, width: int, height: int, monitor_x: Optional[int] = None) -> str:
+    """
+    Geometry string centring a width x height window on a monitor
+
+    Args:
+        window: Any widget (for the screen size)
+        width: Window width
+        height: Window height
+        monitor_x: Left edge of the monitor (None: the primary one)
+
+    Tk cannot list monitors, so another monitor is assumed to be the size
+    of the primary one.
+    """
+    left = 0 if monitor_x is None else monitor_x
+    x = left + (window.winfo_screenwidth() // 2) - (width // 2)
+    y = (window.winfo_screenheight() // 2) - (height // 2)
+    return f'{width}x{height}+{x}+{y}'
+
+
 class WarningPopup:
     """Warning popup shown at threshold points"""
 
-    def __init__(self, parent: tk.Tk):
+    def __init__(self, parent: tk.Tk, monitor_x: Optional[int] = None):
+        """
+        Args:
+            parent: Root window
+            monitor_x: Left edge of the monitor to show on (None: primary)
+        """
         self.parent = parent
+        self.monitor_x = monitor_x
         self.window = None
         self.theme = get_theme_service()
         self.time_service = TimeService()
         self.audio = get_audio_service()
-        self.auto_dismiss_id = None
+        self.timer_hub = get_timer_hub(parent)
+        self.render = RenderModel()
+        self.is_visible = False
 
-    def show(self, task: Task, remaining_seconds: int, next_task_title: str = None):
-        """Show warning popup"""
-        if self.window:
-            self.window.destroy()
+        self._build()
 
+    def _build(self):
+        """Create the (withdrawn) popup and its widgets once"""
         self.window = tk.Toplevel(self.parent)
+        self.window.withdraw()
         self.window.title("Warning")
-        self.window.geometry(f"{WARNING_POPUP_WIDTH}x{WARNING_POPUP_HEIGHT}")
-        self.window.configure(bg=self.theme.accent_2)  # Warning color
-
-        # Center on screen
-        self._center_window()
-
-        # Always on top
         self.window.attributes('-topmost', True)
+        self.window.protocol("WM_DELETE_WINDOW", self.dismiss)
+        self.render.invalidate()
 
         # Main frame
-        main_frame = tk.Frame(self.window, bg=self.theme.accent_2, padx=20, pady=20)
-        main_frame.pack(fill=tk.BOTH, expand=True)
+        self.main_frame = tk.Frame(self.window, padx=20, pady=20)
+        self.main_frame.pack(fill=tk.BOTH, expand=True)
 
         # Warning icon/title
-        warning_label = tk.Label(
-            main_frame,
+        self.warning_label = tk.Label(
+            self.main_frame,
             text="⚠ WARNING",
-            font=(FONT_FAMILY, FONT_SIZE_XLARGE, 'bold'),
-            bg=self.theme.accent_2,
-            fg=self.theme.primary_text
+            font=(FONT_FAMILY, FONT_SIZE_XLARGE, 'bold')
         )
-        warning_label.pack(pady=(10, 20))
+        self.warning_label.pack(pady=(10, 20))
 
         # Task name
-        task_label = tk.Label(
-            main_frame,
-            text=task.title,
+        self.task_label = tk.Label(
+            self.main_frame,
             font=(FONT_FAMILY, FONT_SIZE_LARGE, 'bold'),
-            bg=self.theme.accent_2,
-            fg=self.theme.primary_text,
             wraplength=350
         )
-        task_label.pack(pady=10)
+        self.task_label.pack(pady=10)
 
         # Time remaining
-        time_text = self.time_service.get_friendly_time_remaining(remaining_seconds)
-        time_label = tk.Label(
-            main_frame,
-            text=time_text,
-            font=(FONT_FAMILY, FONT_SIZE_XLARGE),
-            bg=self.theme.accent_2,
-            fg=self.theme.primary_text
-        )
-        time_label.pack(pady=10)
+        self.time_label = tk.Label(self.main_frame, font=(FONT_FAMILY, FONT_SIZE_XLARGE))
+        self.time_label.pack(pady=10)
 
-        # Next task info
-        if next_task_title:
-            next_label = tk.Label(
-                main_frame,
-                text=f"Next: {next_task_title}",
-                font=(FONT_FAMILY, FONT_SIZE_NORMAL),
-                bg=self.theme.accent_2,
-                fg=self.theme.primary_text
-            )
-            next_label.pack(pady=5)
+        # Next task info (packed only when there is a next task)
+        self.next_label = tk.Label(self.main_frame, font=(FONT_FAMILY, FONT_SIZE_NORMAL))
 
         # OK button
-        ok_button = tk.Button(
-            main_frame,
+        self.ok_button = tk.Button(
+            self.main_frame,
             text="OK",
             font=(FONT_FAMILY, FONT_SIZE_NORMAL, 'bold'),
             command=self.dismiss,
-            bg=self.theme.primary_text,
-            fg=self.theme.accent_2,
             relief='flat',
             bd=0,
             padx=30,
             pady=10
         )
-        ok_button.pack(pady=20)
+        self.ok_button.pack(pady=20)
 
         # Bind Enter/Escape to dismiss
         self.window.bind('<Return>', lambda e: self.dismiss())
         self.window.bind('<Escape>', lambda e: self.dismiss())
 
-        # Play warning sound
+    def show(self, task: Task, remaining_seconds: int, next_task_title: str = None):
+        """Show warning popup"""
+        if not self.window or not self.window.winfo_exists():
+            self._build()
+
+        self._apply_theme()
+
+        render = self.render
+        render.set(self.task_label, 'text', task.title)
+        render.set(self.time_label, 'text', self.time_service.get_friendly_time_remaining(remaining_seconds))
+
+        # Next task info
+        if next_task_title:
+            render.set(self.next_label, 'text', f"Next: {next_task_title}")
+            if not self.next_label.winfo_manager():
+                self.next_label.pack(pady=5, before=self.ok_button)
+        elif self.next_label.winfo_manager():
+            self.next_label.pack_forget()
+
+        # Center on screen and show
+        self.window.geometry(_center_geometry(self.window, WARNING_POPUP_WIDTH, WARNING_POPUP_HEIGHT,
+                                              self.monitor_x))
+        self.window.deiconify()
+        self.window.lift()
+        self.is_visible = True
+
+        # Play warning sound (synthesised beeps if no sound file is available)
         resource = get_resource_service()
         sound_path = resource.get_sound(task.sound_profile.warning_sound)
         if sound_path:
             self.audio.play_warning_sound(sound_path)
+        else:
+            self.audio.play_synth_warning(WarningEngine.get_warning_level(task, remaining_seconds))
 
         # Auto-dismiss after configured time
-        self.auto_dismiss_id = self.window.after(DEFAULT_WARNING_AUTO_DISMISS * 1000, self.dismiss)
-
-    def _center_window(self):
-        """Center window on screen"""
-        self.window.update_idletasks()
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
-        x = (self.window.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.window.winfo_screenheight() // 2) - (height // 2)
-        self.window.geometry(f'{width}x{height}+{x}+{y}')
+        self.timer_hub.schedule(WARNING_DISMISS_JOB, self.dismiss, DEFAULT_WARNING_AUTO_DISMISS * 1000)
+
+    def _apply_theme(self):
+        """Push the current theme colours (only changed options touch Tk)"""
+        render = self.render
+        background = self.theme.accent_2  # Warning color
+        text = self.theme.primary_text
+
+        render.set(self.window, 'bg', background)
+        render.set(self.main_frame, 'bg', background)
+        for label in (self.warning_label, self.task_label, self.time_label, self.next_label):
+            render.set(label, 'bg', background)
+            render.set(label, 'fg', text)
+        render.set(self.ok_button, 'bg', text)
+        render.set(self.ok_button, 'fg', background)
 
     def dismiss(self):
-        """Dismiss the popup"""
-        if self.auto_dismiss_id:
-            try:
-                self.window.after_cancel(self.auto_dismiss_id)
-            except Exception:
-                pass
+        """Hide the popup (it is reused for the next warning)"""
+        self.timer_hub.cancel(WARNING_DISMISS_JOB)
+        self.is_visible = False
 
-        if self.window:
-            self.window.destroy()
-            self.window = None
+        if self.window and self.window.winfo_exists():
+            self.window.withdraw()
 
 
 class TimeUpWindow:
     """Time-up alert window (fullscreen or popup)"""
 
-    def __init__(self, parent: tk.Tk):
+    LOGO_SIZE = (150, 150)
+
+    def __init__(self, parent: tk.Tk, monitor_x: Optional[int] = None):
+        """
+        Args:
+            parent: Root window
+            monitor_x: Left edge of the monitor to show on (None: primary)
+        """
         self.parent = parent
+        self.monitor_x = monitor_x
         self.window = None
         self.theme = get_theme_service()
         self.resource = get_resource_service()
         self.audio = get_audio_service()
-        self.auto_close_id = None
+        self.images = get_image_service()
+        self.timer_hub = get_timer_hub(parent)
+        self.render = RenderModel()
         self.is_muted = False
+        self.is_visible = False
         self.mute_button = None
 
-    def show(self, task: Task, fullscreen: bool = True, next_task_title: str = None):
-        """Show time-up window"""
-        if self.window:
-            self.window.destroy()
-
-        # Reset mute state for new window
-        self.is_muted = False
+        self._build()
 
+    def _build(self):
+        """Create the (withdrawn) window and its widgets once"""
         self.window = tk.Toplevel(self.parent)
+        self.window.withdraw()
         self.window.title("Time's Up!")
-
-        if fullscreen:
-            self.window.attributes('-fullscreen', True)
-        else:
-            self.window.geometry(f"{TIMEUP_WINDOW_WIDTH}x{TIMEUP_WINDOW_HEIGHT}")
-            self._center_window()
-
-        self.window.configure(bg=self.theme.background)
         self.window.attributes('-topmost', True)
+        self.window.protocol("WM_DELETE_WINDOW", self.dismiss)
+        self.render.invalidate()
 
-        # Try to load background image
-        bg_image_path = self.resource.get_image(WAEC_BACKGROUND)
-        if bg_image_path:
-            try:
-                # Load and display background image
-                self._create_background(bg_image_path)
-            except Exception as e:
-                print(f"Error loading background: {e}")
-                self._create_solid_background()
-        else:
-            self._create_solid_background()
+        # Background (image when available, otherwise the theme colour)
+        self.bg_label = tk.Label(self.window, bd=0)
+        self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
 
         # Main frame (overlay on background)
-        main_frame = tk.Frame(self.window, bg=self.theme.background)
-        main_frame.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        self.main_frame = tk.Frame(self.window)
+        self.main_frame.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
 
-        # Logo (if available)
-        logo_path = self.resource.get_image(WAEC_LOGO)
-        if logo_path:
-            try:
-                logo_img = Image.open(logo_path)
-                logo_img = logo_img.resize((150, 150), Image.Resampling.LANCZOS)
-                logo_photo = ImageTk.PhotoImage(logo_img)
-                logo_label = tk.Label(main_frame, image=logo_photo, bg=self.theme.background)
-                logo_label.image = logo_photo  # Keep reference
-                logo_label.pack(pady=20)
-            except Exception:
-                pass
+        # Logo (packed only when available)
+        self.logo_label = tk.Label(self.main_frame)
 
         # Time's up message
-        timeup_label = tk.Label(
-            main_frame,
+        self.timeup_label = tk.Label(
+            self.main_frame,
             text="⏰ TIME'S UP!",
-            font=(FONT_FAMILY, 64, 'bold'),
-            bg=self.theme.background,
-            fg=self.theme.accent_3
+            font=(FONT_FAMILY, 64, 'bold')
         )
-        timeup_label.pack(pady=20)
+        self.timeup_label.pack(pady=20)
 
         # Task name
-        task_label = tk.Label(
-            main_frame,
-            text=task.title,
+        self.task_label = tk.Label(
+            self.main_frame,
             font=(FONT_FAMILY, FONT_SIZE_TITLE, 'bold'),
-            bg=self.theme.background,
-            fg=self.theme.primary_text,
             wraplength=700
         )
-        task_label.pack(pady=20)
+        self.task_label.pack(pady=20)
 
-        # Next task info
-        if next_task_title:
-            next_frame = tk.Frame(main_frame, bg=self.theme.accent_1, padx=30, pady=15)
-            next_frame.pack(pady=30)
-
-            next_label = tk.Label(
-                next_frame,
-                text=f"Next Task: {next_task_title}",
-                font=(FONT_FAMILY, FONT_SIZE_LARGE, 'bold'),
-                bg=self.theme.accent_1,
-                fg=self.theme.background
-            )
-            next_label.pack()
+        # Next task info (packed only when there is a next task)
+        self.next_frame = tk.Frame(self.main_frame, padx=30, pady=15)
+        self.next_label = tk.Label(self.next_frame, font=(FONT_FAMILY, FONT_SIZE_LARGE, 'bold'))
+        self.next_label.pack()
 
         # Button frame for Continue and Mute
-        button_frame = tk.Frame(main_frame, bg=self.theme.background)
-        button_frame.pack(pady=30)
+        self.button_frame = tk.Frame(self.main_frame)
+        self.button_frame.pack(pady=30)
 
         # Dismiss button
-        dismiss_button = tk.Button(
-            button_frame,
+        self.dismiss_button = tk.Button(
+            self.button_frame,
             text="Continue",
             font=(FONT_FAMILY, FONT_SIZE_LARGE, 'bold'),
             command=self.dismiss,
-            bg=self.theme.accent_1,
-            fg=self.theme.background,
-            activebackground=self.theme.accent_3,
-            activeforeground=self.theme.background,
             relief='flat',
             bd=0,
             padx=50,
             pady=15
         )
-        dismiss_button.pack(side=tk.LEFT, padx=10)
+        self.dismiss_button.pack(side=tk.LEFT, padx=10)
 
         # Mute button
         self.mute_button = tk.Button(
-            button_frame,
-            text="🔇 Mute",
+            self.button_frame,
             font=(FONT_FAMILY, FONT_SIZE_NORMAL),
             command=self._toggle_mute,
-            bg=self.theme.accent_2,
-            fg=self.theme.primary_text,
             padx=20,
             pady=10
         )
         self.mute_button.pack(side=tk.LEFT, padx=10)
 
         # Help text
-        help_label = tk.Label(
-            main_frame,
+        self.help_label = tk.Label(
+            self.main_frame,
             text="Press ENTER or ESC to continue",
-            font=(FONT_FAMILY, FONT_SIZE_NORMAL),
-            bg=self.theme.background,
-            fg=self.theme.footer
+            font=(FONT_FAMILY, FONT_SIZE_NORMAL)
         )
-        help_label.pack(pady=10)
+        self.help_label.pack(pady=10)
 
         # Bind keys
         self.window.bind('<Return>', lambda e: self.dismiss())
         self.window.bind('<Escape>', lambda e: self.dismiss())
 
-        # Play time-up sound
+    def show(self, task: Task, fullscreen: bool = True, next_task_title: str = None):
+        """Show time-up window"""
+        if not self.window or not self.window.winfo_exists():
+            self._build()
+
+        # Reset mute state for this alert
+        self.is_muted = False
+
+        self._apply_theme()
+        self._update_images()
+
+        render = self.render
+        render.set(self.mute_button, 'text', "🔇 Mute")
+        render.set(self.task_label, 'text', task.title)
+
+        # Next task info
+        if next_task_title:
+            render.set(self.next_label, 'text', f"Next Task: {next_task_title}")
+            if not self.next_frame.winfo_manager():
+                self.next_frame.pack(pady=30, before=self.button_frame)
+        elif self.next_frame.winfo_manager():
+            self.next_frame.pack_forget()
+
+        # Size and show (full screen fills whichever monitor holds the window)
+        if fullscreen:
+            if self.monitor_x is not None:
+                self.window.attributes('-fullscreen', False)
+                self.window.geometry(f"+{self.monitor_x}+0")
+                self.window.update_idletasks()
+            self.window.attributes('-fullscreen', True)
+        else:
+            self.window.attributes('-fullscreen', False)
+            self.window.geometry(_center_geometry(self.window, TIMEUP_WINDOW_WIDTH, TIMEUP_WINDOW_HEIGHT,
+                                                  self.monitor_x))
+        self.window.deiconify()
+        self.window.lift()
+        self.is_visible = True
+
+        # Play time-up sound (synthesised beeps if no sound file is available)
         sound_path = self.resource.get_sound(task.sound_profile.timeup_sound)
         if sound_path:
             self.audio.play_timeup_sound(sound_path)
+        else:
+            self.audio.play_synth_timeup()
 
         # Auto-close after configured time
-        self.auto_close_id = self.window.after(DEFAULT_TIMEUP_AUTO_CLOSE * 1000, self.dismiss)
-
-    def _create_background(self, image_path: str):
-        """Create background with image"""
-        try:
-            img = Image.open(image_path)
-            # Get screen size
-            screen_width = self.window.winfo_screenwidth()
-            screen_height = self.window.winfo_screenheight()
-            # Resize image to screen size
-            img = img.resize((screen_width, screen_height), Image.Resampling.LANCZOS)
-            bg_photo = ImageTk.PhotoImage(img)
-
-            bg_label = tk.Label(self.window, image=bg_photo)
-            bg_label.image = bg_photo  # Keep reference
-            bg_label.place(x=0, y=0, relwidth=1, relheight=1)
-        except Exception as e:
-            print(f"Error creating background: {e}")
-            self._create_solid_background()
-
-    def _create_solid_background(self):
-        """Create solid color background"""
-        canvas = tk.Canvas(self.window, bg=self.theme.background, highlightthickness=0)
-        canvas.place(x=0, y=0, relwidth=1, relheight=1)
-
-    def _center_window(self):
-        """Center window on screen"""
-        self.window.update_idletasks()
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
-        x = (self.window.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.window.winfo_screenheight() // 2) - (height // 2)
-        self.window.geometry(f'{width}x{height}+{x}+{y}')
+        self.timer_hub.schedule(TIMEUP_CLOSE_JOB, self.dismiss, DEFAULT_TIMEUP_AUTO_CLOSE * 1000)
+
+    def prerender(self):
+        """Scale the background and logo ahead of time so time-up shows instantly"""
+        requests = []
+        bg_image_path = self.resource.get_image(WAEC_BACKGROUND)
+        if bg_image_path:
+            screen_size = (self.parent.winfo_screenwidth(), self.parent.winfo_screenheight())
+            requests.append((bg_image_path, screen_size))
+
+        logo_path = self.resource.get_image(WAEC_LOGO)
+        if logo_path:
+            requests.append((logo_path, self.LOGO_SIZE))
+
+        self.images.prerender(self.parent, requests)
+
+    def _apply_theme(self):
+        """Push the current theme colours (only changed options touch Tk)"""
+        render = self.render
+        theme = self.theme
+
+        for widget in (self.window, self.bg_label, self.main_frame, self.logo_label, self.button_frame):
+            render.set(widget, 'bg', theme.background)
+
+        render.set(self.timeup_label, 'bg', theme.background)
+        render.set(self.timeup_label, 'fg', theme.accent_3)
+        render.set(self.task_label, 'bg', theme.background)
+        render.set(self.task_label, 'fg', theme.primary_text)
+        render.set(self.next_frame, 'bg', theme.accent_1)
+        render.set(self.next_label, 'bg', theme.accent_1)
+        render.set(self.next_label, 'fg', theme.background)
+        render.set(self.help_label, 'bg', theme.background)
+        render.set(self.help_label, 'fg', theme.footer)
+
+        render.set(self.dismiss_button, 'bg', theme.accent_1)
+        render.set(self.dismiss_button, 'fg', theme.background)
+        render.set(self.dismiss_button, 'activebackground', theme.accent_3)
+        render.set(self.dismiss_button, 'activeforeground', theme.background)
+        render.set(self.mute_button, 'bg', theme.accent_2)
+        render.set(self.mute_button, 'fg', theme.primary_text)
+
+    def _update_images(self):
+        """Point the background and logo labels at the cached scaled images"""
+        # Scaled to screen size once per resolution by the image service,
+        # which also keeps the PhotoImages alive
+        bg_photo = None
+        bg_image_path = self.resource.get_image(WAEC_BACKGROUND)
+        if bg_image_path:
+            try:
+                screen_size = (self.window.winfo_screenwidth(), self.window.winfo_screenheight())
+                bg_photo = self.images.get_photo(bg_image_path, screen_size)
+            except Exception as e:
+                print(f"Error loading background: {e}")
+        self.render.set(self.bg_label, 'image', bg_photo or '')
+
+        logo_photo = None
+        logo_path = self.resource.get_image(WAEC_LOGO)
+        if logo_path:
+            try:
+                logo_photo = self.images.get_photo(logo_path, self.LOGO_SIZE)
+            except Exception:
+                pass
+
+        self.render.set(self.logo_label, 'image', logo_photo or '')
+        if logo_photo and not self.logo_label.winfo_manager():
+            self.logo_label.pack(pady=20, before=self.timeup_label)
+        elif not logo_photo and self.logo_label.winfo_manager():
+            self.logo_label.pack_forget()
 
     def _toggle_mute(self):
         """Toggle mute/unmute for time-up sound"""
         self.is_muted = not self.is_muted
 
         if self.is_muted:
-            self.audio.stop()
-            if self.mute_button:
-                self.mute_button.config(text="🔊 Unmute")
+            self.audio.stop_alerts()
+            self.render.set(self.mute_button, 'text', "🔊 Unmute")
         else:
             # Re-enable audio service
             self.audio.enable()
-            if self.mute_button:
-                self.mute_button.config(text="🔇 Mute")
+            self.render.set(self.mute_button, 'text', "🔇 Mute")
 
     def dismiss(self):
-        """Dismiss the window"""
-        if self.auto_close_id:
-            try:
-                self.window.after_cancel(self.auto_close_id)
-            except Exception:
-                pass
+        """Hide the window (it is reused for the next time-up)"""
+        self.timer_hub.cancel(TIMEUP_CLOSE_JOB)
+        self.is_visible = False
 
-        if self.window:
-            self.window.destroy()
-            self.window = None
+        if self.window and self.window.winfo_exists():
+            self.window.withdraw()
@@ -0,0 +1,158 @@
+"""
+TaSched - Audience View
+Display-only countdown for the projector in dual-display mode
+Shows the countdown, task title, next task and ticker full screen on the
+second monitor. It has no controls and builds no strings of its own: the
+operator console (RunWindow) builds one RunFrame per tick and this view
+only pushes the values that changed.
+"""
+
+import tkinter as tk
+from typing import Optional
+
+from tasched.services.theme_service import get_theme_service
+from tasched.ui.glyph_countdown import GlyphCountdown
+from tasched.ui.render_model import RenderModel, RunFrame
+from tasched.ui.ticker import TickerAnimator
+from tasched.constants import *
+
+
+class AudienceView:
+    """
+    Full-screen audience window mirroring the operator console
+    """
+
+    def __init__(self, parent: tk.Tk, glyph_countdown: bool = False, monitor_x: Optional[int] = None):
+        self.parent = parent
+        self.window = tk.Toplevel(parent)
+        self.theme = get_theme_service()
+        self.render = RenderModel()
+        self.glyph_countdown = glyph_countdown
+        self.countdown_glyphs = None
+        self.is_fullscreen = True
+
+        self._setup_window(monitor_x)
+        self._create_widgets()
+
+    def _setup_window(self, monitor_x: Optional[int]):
+        """Move to the second monitor and go full screen there"""
+        self.window.title(f"{APP_NAME} - Audience")
+        self.window.configure(bg=self.theme.background)
+
+        # Tk cannot list monitors; the second one normally starts where the
+        # primary ends. Full screen then fills whichever monitor holds the window.
+        x = monitor_x if monitor_x is not None else self.window.winfo_screenwidth()
+        self.window.geometry(f"{RUN_WINDOW_WIDTH}x{RUN_WINDOW_HEIGHT}+{x}+0")
+        self.window.update_idletasks()
+        self.window.attributes('-fullscreen', True)
+
+        self.window.bind('<F11>', lambda e: self.toggle_fullscreen())
+        # Closing is done from the operator console
+        self.window.protocol("WM_DELETE_WINDOW", lambda: None)
+
+    def _create_widgets(self):
+        """Create the display widgets"""
+        background = self.theme.background
+
+        # Footer first so it stays at the bottom
+        self.ticker_frame = tk.Frame(self.window, bg=self.theme.accent_1, height=AUDIENCE_TICKER_HEIGHT)
+        self.ticker_frame.pack_propagate(False)
+        self.ticker_canvas = tk.Canvas(self.ticker_frame, bg=self.theme.accent_1,
+                                       highlightthickness=0, height=AUDIENCE_TICKER_HEIGHT)
+        self.ticker_canvas.pack(fill=tk.BOTH, expand=True)
+        self.ticker = TickerAnimator(self.ticker_canvas,
+                                     font=(FONT_FAMILY, AUDIENCE_TICKER_FONT_SIZE, 'bold'),
+                                     y=AUDIENCE_TICKER_HEIGHT // 2)
+
+        center_frame = tk.Frame(self.window, bg=background)
+        center_frame.place(relx=0.5, rely=0.45, anchor=tk.CENTER)
+
+        self.title_label = tk.Label(
+            center_frame,
+            text="",
+            font=(FONT_FAMILY, AUDIENCE_TITLE_FONT_SIZE, 'bold'),
+            bg=background,
+            fg=self.theme.primary_text,
+            wraplength=self.window.winfo_screenwidth() - 100,
+            justify=tk.CENTER
+        )
+        self.title_label.pack(pady=(0, 20))
+
+        # Countdown timer (very large)
+        if self.glyph_countdown:
+            self.countdown_glyphs = GlyphCountdown.create(
+                center_frame, AUDIENCE_COUNTDOWN_FONT_SIZE, background, self.theme.accent_3
+            )
+        if self.countdown_glyphs:
+            self.countdown_glyphs.set("00:00:00")
+            self.countdown_glyphs.pack(pady=20)
+        else:
+            self.countdown_label = tk.Label(
+                center_frame,
+                text="00:00:00",
+                font=(FONT_FAMILY, AUDIENCE_COUNTDOWN_FONT_SIZE, 'bold'),
+                bg=background,
+                fg=self.theme.accent_3
+            )
+            self.countdown_label.pack(pady=20)
+
+        self.next_label = tk.Label(
+            center_frame,
+            text="",
+            font=(FONT_FAMILY, FONT_SIZE_TITLE),
+            bg=background,
+            fg=self.theme.primary_text
+        )
+        self.next_label.pack(pady=20)
+
+    def apply(self, frame: RunFrame):
+        """
+        Push a frame (only changed values touch Tk)
+
+        Args:
+            frame: Display values built by the operator console
+        """
+        render = self.render
+        render.set(self.title_label, 'text', frame.title_text)
+        render.set(self.next_label, 'text', frame.next_text)
+
+        if self.countdown_glyphs:
+            self.countdown_glyphs.set(frame.countdown_text, frame.countdown_color)
+        else:
+            render.set(self.countdown_label, 'text', frame.countdown_text)
+            render.set(self.countdown_label, 'fg', frame.countdown_color)
+
+        self._update_ticker(frame)
+
+    def _update_ticker(self, frame: RunFrame):
+        """Show the ticker while the frame has it enabled"""
+        if not frame.ticker_enabled:
+            self.ticker.stop()
+            if self.ticker_frame.winfo_manager():
+                self.ticker_frame.pack_forget()
+            return
+
+        if not self.ticker_frame.winfo_manager():
+            self.ticker_frame.pack(fill=tk.X, side=tk.BOTTOM)
+
+        if frame.ticker_message:
+            self.ticker.set_message(frame.ticker_message, frame.ticker_speed, frame.ticker_direction)
+            self.ticker.start()
+
+    def toggle_fullscreen(self):
+        """Toggle fullscreen mode"""
+        self.is_fullscreen = not self.is_fullscreen
+        self.window.attributes('-fullscreen', self.is_fullscreen)
+
+    def show(self):
+        """Show the window"""
+        self.window.deiconify()
+
+    def hide(self):
+        """Hide the window"""
+        self.window.withdraw()
+
+    def destroy(self):
+        """Stop the ticker and destroy the window"""
+        self.ticker.stop()
+        self.window.destroy()
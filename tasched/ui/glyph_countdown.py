@@ -0,0 +1,210 @@
+"""
+TaSched - Glyph Countdown
+Canvas countdown composed from pre-rasterised digit images
+The glyphs 0-9 and ':' are rendered with PIL once per font, size and
+colour. Each tick only swaps the image of the character cells that
+changed, so the per-second cost does not grow with the display size.
+PIL is imported only when the renderer is enabled.
+"""
+
+import tkinter as tk
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from PIL import ImageFont, ImageTk
+
+from tasched.constants import GLYPH_CHARACTERS, GLYPH_FONT_FILES
+
+
+class GlyphSet:
+    """Rasterised glyphs for one font, pixel size and colour"""
+
+    def __init__(self, images: Dict[str, "ImageTk.PhotoImage"], widths: Dict[str, int], height: int):
+        self.images = images
+        self.widths = widths
+        self.height = height
+
+
+class GlyphCache:
+    """
+    Glyph sets keyed by (font file, pixel size, colour)
+    A theme uses three countdown colours, so the cache stays small
+    """
+
+    def __init__(self, font_files: Tuple[str, ...] = GLYPH_FONT_FILES):
+        self.font_files = font_files
+        self._fonts: Dict[int, Optional[Tuple[str, "ImageFont.FreeTypeFont"]]] = {}
+        self._sets: Dict[Tuple[str, int, str], GlyphSet] = {}
+
+    def get_font(self, size: int) -> Optional[Tuple[str, "ImageFont.FreeTypeFont"]]:
+        """
+        Load the first available font file at a pixel size
+
+        Returns:
+            (font file, font) or None if no font could be loaded
+        """
+        if size in self._fonts:
+            return self._fonts[size]
+
+        from PIL import ImageFont
+
+        found = None
+        for font_file in self.font_files:
+            try:
+                found = (font_file, ImageFont.truetype(font_file, size))
+                break
+            except OSError:
+                continue
+
+        if found is None:
+            print(f"[GlyphCache] None of {', '.join(self.font_files)} could be loaded")
+        self._fonts[size] = found
+        return found
+
+    def get(self, master: tk.Misc, size: int, color: str) -> Optional[GlyphSet]:
+        """
+        Get (or render) the glyph set for a size and colour
+
+        Args:
+            master: Widget owning the PhotoImages
+            size: Font size in pixels
+            color: Text colour (any PIL colour string)
+
+        Returns:
+            GlyphSet or None if no font is available
+        """
+        font_entry = self.get_font(size)
+        if font_entry is None:
+            return None
+        font_file, font = font_entry
+
+        key = (font_file, size, color)
+        glyphs = self._sets.get(key)
+        if glyphs is None:
+            glyphs = self._render(master, font, color)
+            self._sets[key] = glyphs
+        return glyphs
+
+    def clear(self):
+        """Drop every rendered glyph set"""
+        self._sets.clear()
+
+    def _render(self, master: tk.Misc, font: "ImageFont.FreeTypeFont", color: str) -> GlyphSet:
+        """Rasterise every glyph on a transparent background"""
+        from PIL import Image, ImageDraw, ImageTk
+
+        ascent, descent = font.getmetrics()
+        height = ascent + descent
+
+        # Digits share one cell width so the countdown never jitters
+        digit_width = max(int(round(font.getlength(ch))) for ch in GLYPH_CHARACTERS if ch.isdigit())
+
+        images = {}
+        widths = {}
+        for ch in GLYPH_CHARACTERS:
+            advance = int(round(font.getlength(ch)))
+            width = digit_width if ch.isdigit() else advance
+            image = Image.new("RGBA", (max(1, width), height), (0, 0, 0, 0))
+            ImageDraw.Draw(image).text(((width - advance) / 2, 0), ch, font=font, fill=color)
+            images[ch] = ImageTk.PhotoImage(image, master=master)
+            widths[ch] = width
+
+        return GlyphSet(images, widths, height)
+
+
+class GlyphCountdown:
+    """
+    Countdown display drawn from cached glyph images on a canvas
+    """
+
+    def __init__(self, parent: tk.Misc, font_size: int, bg: str, color: str,
+                 cache: GlyphCache = None):
+        self.canvas = tk.Canvas(parent, bg=bg, highlightthickness=0, bd=0)
+        self.cache = cache or get_glyph_cache()
+        # Tk font sizes are points; PIL wants pixels
+        self.size = int(round(font_size * parent.winfo_fpixels('1p')))
+        self.color = color
+
+        self.text = ""
+        self._items: List[int] = []
+        self._cells: List[Tuple[str, str]] = []  # (character, colour) shown per cell
+        self._glyphs: Optional[GlyphSet] = None
+
+        self.updated = 0
+        self.skipped = 0
+
+    @classmethod
+    def create(cls, parent: tk.Misc, font_size: int, bg: str, color: str) -> Optional['GlyphCountdown']:
+        """
+        Create the renderer, or return None if no glyph font is available
+        """
+        cache = get_glyph_cache()
+        size = int(round(font_size * parent.winfo_fpixels('1p')))
+        if cache.get_font(size) is None:
+            return None
+        return cls(parent, font_size, bg, color, cache)
+
+    def pack(self, **kwargs):
+        """Pack the canvas"""
+        self.canvas.pack(**kwargs)
+
+    def set(self, text: str, color: str = None):
+        """
+        Show a countdown string, swapping only the cells that changed
+
+        Args:
+            text: Countdown text (digits and ':')
+            color: Text colour (unchanged if None)
+        """
+        if color is not None and color != self.color:
+            self.color = color
+            self._glyphs = None
+
+        if self._glyphs is None:
+            self._glyphs = self.cache.get(self.canvas, self.size, self.color)
+            if self._glyphs is None:
+                return
+
+        text = ''.join(ch for ch in text if ch in self._glyphs.images)
+        if len(text) != len(self._cells) or any(
+                (ch == ':') != (cell[0] == ':') for ch, cell in zip(text, self._cells)):
+            self._layout(text)
+
+        glyphs = self._glyphs
+        for index, ch in enumerate(text):
+            cell = (ch, self.color)
+            if self._cells[index] == cell:
+                self.skipped += 1
+                continue
+            self.canvas.itemconfigure(self._items[index], image=glyphs.images[ch])
+            self._cells[index] = cell
+            self.updated += 1
+
+        self.text = text
+
+    def _layout(self, text: str):
+        """Create one image item per character cell and size the canvas"""
+        glyphs = self._glyphs
+        self.canvas.delete('all')
+        self._items = []
+        self._cells = []
+
+        x = 0
+        for ch in text:
+            self._items.append(self.canvas.create_image(x, 0, anchor='nw'))
+            self._cells.append(('', ''))
+            x += glyphs.widths[ch]
+
+        self.canvas.configure(width=x, height=glyphs.height)
+
+
+# Global glyph cache instance
+_glyph_cache = None
+
+
+def get_glyph_cache() -> GlyphCache:
+    """Get or create the global glyph cache"""
+    global _glyph_cache
+    if _glyph_cache is None:
+        _glyph_cache = GlyphCache()
+    return _glyph_cache
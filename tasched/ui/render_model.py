@@ -0,0 +1,181 @@
+"""
+TaSched - Render Model
+Diff-based widget updates for the run display
+Widget options are only reconfigured when their value changes, and
+strings that depend on the task (not the countdown) are built once per
+task instead of once per tick. A RunFrame holds everything the run views
+show for one tick; it is built once and applied to every view.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from tasched.core.models import Schedule, Task
+from tasched.core.time_service import TimeService
+
+
+_MISSING = object()
+
+
+class RenderModel:
+    """
+    Remembers the last value pushed to each widget option
+    set() only touches Tk when the value differs from the cached one
+    """
+
+    def __init__(self):
+        self._values: Dict[Tuple[str, str], Any] = {}
+        self.pushed = 0
+        self.skipped = 0
+
+    def set(self, widget, option: str, value: Any) -> bool:
+        """
+        Push a widget option if it changed
+
+        Args:
+            widget: Tk or ttk widget
+            option: Option name (e.g. 'text', 'fg', 'value')
+            value: New value
+
+        Returns:
+            True if the widget was reconfigured
+        """
+        key = (str(widget), option)
+        if self._values.get(key, _MISSING) == value:
+            self.skipped += 1
+            return False
+
+        widget[option] = value
+        self._values[key] = value
+        self.pushed += 1
+        return True
+
+    def invalidate(self, widget=None):
+        """Forget cached values (for one widget, or all) so the next set() pushes"""
+        if widget is None:
+            self._values.clear()
+            return
+        name = str(widget)
+        for key in [key for key in self._values if key[0] == name]:
+            del self._values[key]
+
+
+@dataclass(frozen=True)
+class RunFrame:
+    """Display values for one tick, shared by every run view"""
+    schedule_text: str
+    title_text: str
+    next_text: str
+    countdown_text: str
+    countdown_color: str
+    status_text: str
+    progress: Optional[float]  # percent, None for zero-length tasks
+    ticker_enabled: bool
+    ticker_message: str
+    ticker_speed: int
+    ticker_direction: str
+
+
+@dataclass(frozen=True)
+class TaskStrings:
+    """Display strings that only change at task boundaries"""
+    schedule_text: str
+    title_text: str
+    next_text: str
+
+
+def task_strings_key(schedule: Schedule, task: Task, next_task: Optional[Task]) -> Tuple:
+    """Everything the task-level strings depend on"""
+    next_key = None
+    if next_task:
+        next_key = (next_task.id, next_task.title, next_task.duration_seconds,
+                    next_task.absolute_start_time)
+    return (schedule.name, getattr(schedule, 'task_prefix', 'Now'), task.id, task.title, next_key)
+
+
+def build_task_strings(schedule: Schedule, task: Task, next_task: Optional[Task],
+                       time_service: TimeService) -> TaskStrings:
+    """
+    Build the task-level display strings
+
+    Args:
+        schedule: Running schedule
+        task: Current task
+        next_task: Following task, if any
+        time_service: Formatter
+
+    Returns:
+        TaskStrings
+    """
+    # Task title with optional prefix
+    task_prefix = getattr(schedule, 'task_prefix', 'Now')  # Default to 'Now'
+    if task_prefix:
+        title_text = f"{task_prefix}: {task.title}"
+    else:
+        title_text = task.title
+
+    # Next task info with start time if available
+    if next_task:
+        duration_str = time_service.format_duration(next_task.duration_seconds, short=True)
+        time_str = format_start_time(next_task.absolute_start_time)
+        if time_str:
+            next_text = f"Next: {next_task.title} ({duration_str}, starts at {time_str})"
+        else:
+            next_text = f"Next: {next_task.title} ({duration_str})"
+    else:
+        next_text = "Last task in schedule"
+
+    return TaskStrings(schedule_text=schedule.name, title_text=title_text, next_text=next_text)
+
+
+def build_ticker_message(task: Task, next_task: Optional[Task], time_service: TimeService) -> str:
+    """
+    Fill in the ticker text placeholders
+
+    Args:
+        task: Current task
+        next_task: Following task, if any
+        time_service: Formatter
+
+    Returns:
+        Ticker message ("" if the task has no ticker text)
+    """
+    ticker_text = task.display.ticker_text
+    if not ticker_text:
+        return ""
+
+    # Replace placeholders
+    message = ticker_text.replace("[TASK_NAME]", task.title)
+
+    if "[TIME_REMAINING]" in message:
+        time_remaining = time_service.format_seconds(task.remaining_seconds)
+        message = message.replace("[TIME_REMAINING]", time_remaining)
+
+    if "[NEXT_TASK]" in message and next_task:
+        message = message.replace("[NEXT_TASK]", next_task.title)
+    elif "[NEXT_TASK]" in message:
+        message = message.replace("Next: [NEXT_TASK]", "Last Task")
+        message = message.replace("[NEXT_TASK]", "None")
+
+    return message
+
+
+def format_start_time(absolute_start_time: Optional[str]) -> Optional[str]:
+    """
+    Convert a 24-hour HH:MM start time to 12-hour display format
+
+    Returns:
+        Display string such as "2:05pm", or None if missing or invalid
+    """
+    if not absolute_start_time:
+        return None
+    try:
+        hour, minute = map(int, absolute_start_time.split(':'))
+    except ValueError:
+        return None
+
+    ampm = 'am' if hour < 12 else 'pm'
+    display_hour = hour if hour <= 12 else hour - 12
+    if display_hour == 0:
+        display_hour = 12
+    return f"{display_hour}:{minute:02d}{ampm}"
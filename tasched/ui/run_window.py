@@ -9,18 +9,35 @@ from typing import Optional
 
 from tasched.core.models import Schedule, Task
 from tasched.core.time_service import TimeService
+from tasched.core.timer_hub import get_timer_hub
 from tasched.services.theme_service import get_theme_service
 from tasched.services.resource_service import get_resource_service
+from tasched.services.image_service import get_image_service
+from tasched.ui.render_model import (
+    RenderModel,
+    RunFrame,
+    task_strings_key,
+    build_task_strings,
+    build_ticker_message
+)
+from tasched.ui.ticker import TickerAnimator
+from tasched.ui.glyph_countdown import GlyphCountdown
 from tasched.constants import *
 
 
+CLOCK_JOB = "run_window.clock"
+REDRAW_JOB = "run_window"
+
+
 class RunWindow:
     """
     Main countdown timer window displayed during schedule execution
     """
 
     def __init__(self, parent: tk.Tk, on_pause_callback=None, on_resume_callback=None,
-                 on_skip_callback=None, on_stop_callback=None, on_force_next_callback=None):
+                 on_skip_callback=None, on_stop_callback=None, on_force_next_callback=None,
+                 glyph_countdown: bool = False, dual_display: bool = False,
+                 audience_x: Optional[int] = None):
         self.parent = parent
         self.window = tk.Toplevel(parent)
         self.theme = get_theme_service()
@@ -41,22 +58,38 @@ class RunWindow:
         self.next_task = None
         self.schedule = None
 
-        # Ticker state
-        self.ticker_offset = 0
-        self.ticker_enabled = False
+        # Draw the countdown from cached digit images instead of a Label
+        self.glyph_countdown = glyph_countdown
+        self.countdown_glyphs = None
+
+        # Last values pushed to widgets, and task-level strings for the current task
+        self.render = RenderModel()
+        self._task_strings_key = None
+        self._task_strings = None
 
-        # Timer IDs for cleanup
-        self.clock_timer_id = None
-        self.ticker_timer_id = None
+        # Clock and redraws run on the shared timer hub
+        self.timer_hub = get_timer_hub(parent)
+
+        # Dual display: this window becomes a compact operator console and a
+        # display-only audience view goes full screen on the second monitor
+        self.dual_display = dual_display
+        self.views = []
 
         # Configure window
         self._setup_window()
         self._create_widgets()
 
+        if dual_display:
+            from tasched.ui.audience_view import AudienceView
+            self.attach_view(AudienceView(parent, glyph_countdown=glyph_countdown, monitor_x=audience_x))
+
     def _setup_window(self):
         """Configure window properties"""
         self.window.title(f"{APP_NAME} - Running")
-        self.window.geometry(f"{RUN_WINDOW_WIDTH}x{RUN_WINDOW_HEIGHT}")
+        if self.dual_display:
+            self.window.geometry(f"{RUN_CONSOLE_WIDTH}x{RUN_CONSOLE_HEIGHT}")
+        else:
+            self.window.geometry(f"{RUN_WINDOW_WIDTH}x{RUN_WINDOW_HEIGHT}")
         self.window.configure(bg=self.theme.background)
 
         # Set icon
@@ -67,8 +100,9 @@ class RunWindow:
             except Exception:
                 pass
 
-        # Start in fullscreen
-        self.window.attributes('-fullscreen', True)
+        # Start in fullscreen (the operator console stays windowed in dual display)
+        self.is_fullscreen = not self.dual_display
+        self.window.attributes('-fullscreen', self.is_fullscreen)
 
         # Bind keys
         self.window.bind('<F11>', lambda e: self.toggle_fullscreen())
@@ -89,24 +123,24 @@ class RunWindow:
         self.window.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _create_widgets(self):
-        """Create UI widgets"""
+        """Create UI widgets (a reduced layout for the dual-display console)"""
+        compact = self.dual_display
+
         # Main container
         main_frame = tk.Frame(self.window, bg=self.theme.background)
         main_frame.pack(fill=tk.BOTH, expand=True)
 
         # Top bar (logo, schedule name and clock)
-        top_frame = tk.Frame(main_frame, bg=self.theme.background, height=80)
-        top_frame.pack(fill=tk.X, padx=20, pady=10)
+        top_frame = tk.Frame(main_frame, bg=self.theme.background, height=40 if compact else 80)
+        top_frame.pack(fill=tk.X, padx=20, pady=(5 if compact else 10))
         top_frame.pack_propagate(False)
 
         # WAEC Logo on the left
         logo_path = self.resource.get_image(WAEC_LOGO)
         if logo_path:
             try:
-                from PIL import Image, ImageTk
-                logo_img = Image.open(logo_path)
-                logo_img = logo_img.resize((60, 60), Image.Resampling.LANCZOS)
-                logo_photo = ImageTk.PhotoImage(logo_img)
+                logo_size = (32, 32) if compact else (60, 60)
+                logo_photo = get_image_service().get_photo(logo_path, logo_size)
 
                 logo_label = tk.Label(top_frame, image=logo_photo, bg=self.theme.background)
                 logo_label.image = logo_photo  # Keep reference
@@ -117,7 +151,7 @@ class RunWindow:
         self.schedule_label = tk.Label(
             top_frame,
             text="",
-            font=(FONT_FAMILY, 32, 'bold'),  # Increased from FONT_SIZE_LARGE (18) to 32
+            font=(FONT_FAMILY, FONT_SIZE_LARGE if compact else 32, 'bold'),
             bg=self.theme.background,
             fg=self.theme.accent_1
         )
@@ -126,7 +160,7 @@ class RunWindow:
         self.clock_label = tk.Label(
             top_frame,
             text="",
-            font=(FONT_FAMILY, FONT_SIZE_XLARGE, 'bold'),
+            font=(FONT_FAMILY, FONT_SIZE_LARGE if compact else FONT_SIZE_XLARGE, 'bold'),
             bg=self.theme.background,
             fg=self.theme.accent_3
         )
@@ -137,40 +171,49 @@ class RunWindow:
         center_frame.pack(fill=tk.BOTH, expand=True)
 
         # Task title (limited height to prevent footer from being pushed off screen)
-        task_title_container = tk.Frame(center_frame, bg=self.theme.background, height=150)
-        task_title_container.pack(pady=(40, 20))
+        task_title_container = tk.Frame(center_frame, bg=self.theme.background, height=40 if compact else 150)
+        task_title_container.pack(fill=tk.X if compact else tk.NONE, pady=(5, 0) if compact else (40, 20))
         task_title_container.pack_propagate(False)
 
         self.task_title_label = tk.Label(
             task_title_container,
             text="",
-            font=(FONT_FAMILY, 48, 'bold'),  # Increased from 32 to 48
+            font=(FONT_FAMILY, FONT_SIZE_XLARGE if compact else 48, 'bold'),
             bg=self.theme.background,
             fg=self.theme.primary_text,
-            wraplength=1000,  # Allow text wrapping
+            wraplength=RUN_CONSOLE_WIDTH - 40 if compact else 1000,  # Allow text wrapping
             justify=tk.CENTER
         )
         self.task_title_label.pack()
 
-        # Countdown timer (large)
+        # Countdown timer (large; the audience view has the big one in dual display)
+        countdown_size = CONSOLE_COUNTDOWN_FONT_SIZE if compact else FONT_SIZE_CLOCK
         self.countdown_label = tk.Label(
             center_frame,
             text="00:00:00",
-            font=(FONT_FAMILY, FONT_SIZE_CLOCK, 'bold'),
+            font=(FONT_FAMILY, countdown_size, 'bold'),
             bg=self.theme.background,
             fg=self.theme.accent_3
         )
-        self.countdown_label.pack(pady=20)
+        if self.glyph_countdown:
+            self.countdown_glyphs = GlyphCountdown.create(
+                center_frame, countdown_size, self.theme.background, self.theme.accent_3
+            )
+        if self.countdown_glyphs:
+            self.countdown_glyphs.set("00:00:00")
+            self.countdown_glyphs.pack(pady=5 if compact else 20)
+        else:
+            self.countdown_label.pack(pady=5 if compact else 20)
 
         # Status message
         self.status_label = tk.Label(
             center_frame,
             text="",
-            font=(FONT_FAMILY, FONT_SIZE_XLARGE, 'bold'),
+            font=(FONT_FAMILY, FONT_SIZE_LARGE if compact else FONT_SIZE_XLARGE, 'bold'),
             bg=self.theme.background,
             fg=self.theme.accent_1
         )
-        self.status_label.pack(pady=10)
+        self.status_label.pack(pady=2 if compact else 10)
 
         # Next task info
         self.next_task_label = tk.Label(
@@ -180,20 +223,22 @@ class RunWindow:
             bg=self.theme.background,
             fg=self.theme.primary_text
         )
-        self.next_task_label.pack(pady=10)
+        self.next_task_label.pack(pady=2 if compact else 10)
 
         # Progress bar
         self.progress = ttk.Progressbar(
             center_frame,
             orient=tk.HORIZONTAL,
-            length=600,
+            length=RUN_CONSOLE_WIDTH - 120 if compact else 600,
             mode='determinate'
         )
-        self.progress.pack(pady=20)
+        self.progress.pack(pady=5 if compact else 20)
 
         # Control buttons
         button_frame = tk.Frame(center_frame, bg=self.theme.background)
-        button_frame.pack(pady=30)
+        button_frame.pack(pady=10 if compact else 30)
+        button_width = 10 if compact else 14
+        button_padx = 4 if compact else 10
 
         self.pause_button = tk.Button(
             button_frame,
@@ -201,9 +246,9 @@ class RunWindow:
             font=(FONT_FAMILY, FONT_SIZE_NORMAL, 'bold'),
             command=self.toggle_pause,
             **self.theme.get_button_style(),
-            width=14
+            width=button_width
         )
-        self.pause_button.pack(side=tk.LEFT, padx=10)
+        self.pause_button.pack(side=tk.LEFT, padx=button_padx)
 
         # Mute toggle button
         self.is_muted = False
@@ -213,9 +258,9 @@ class RunWindow:
             font=(FONT_FAMILY, FONT_SIZE_NORMAL, 'bold'),
             command=self.toggle_mute,
             **self.theme.get_button_style(),
-            width=14
+            width=button_width
         )
-        self.mute_button.pack(side=tk.LEFT, padx=10)
+        self.mute_button.pack(side=tk.LEFT, padx=button_padx)
 
         skip_button = tk.Button(
             button_frame,
@@ -223,9 +268,9 @@ class RunWindow:
             font=(FONT_FAMILY, FONT_SIZE_NORMAL, 'bold'),
             command=self._on_skip,
             **self.theme.get_button_style(),
-            width=14
+            width=button_width
         )
-        skip_button.pack(side=tk.LEFT, padx=10)
+        skip_button.pack(side=tk.LEFT, padx=button_padx)
 
         # Next Task button (forces immediate start, adjusts remaining times)
         next_button = tk.Button(
@@ -234,9 +279,9 @@ class RunWindow:
             font=(FONT_FAMILY, FONT_SIZE_NORMAL, 'bold'),
             command=self._on_force_next,  # Different from skip
             **self.theme.get_button_style(),
-            width=14
+            width=button_width
         )
-        next_button.pack(side=tk.LEFT, padx=10)
+        next_button.pack(side=tk.LEFT, padx=button_padx)
 
         stop_button = tk.Button(
             button_frame,
@@ -251,9 +296,9 @@ class RunWindow:
             bd=0,
             padx=20,
             pady=10,
-            width=14
+            width=button_width
         )
-        stop_button.pack(side=tk.LEFT, padx=10)
+        stop_button.pack(side=tk.LEFT, padx=button_padx)
 
         # Footer bar (pack first so it's at the bottom)
         footer_frame = tk.Frame(main_frame, bg=self.theme.background, height=40)
@@ -269,11 +314,12 @@ class RunWindow:
                                        highlightthickness=0, height=50)
         self.ticker_canvas.pack(fill=tk.BOTH, expand=True)
 
-        self.ticker_text_id = None
-        self.ticker_message = ""
+        self.ticker = TickerAnimator(self.ticker_canvas)
 
         # Help text on left
-        help_text = "P: Pause | M: Mute | S: Skip | N: Next | X: Stop | F11: Fullscreen | ESC: Exit Fullscreen"
+        help_text = "P: Pause | M: Mute | S: Skip | N: Next | X: Stop"
+        if not compact:
+            help_text += " | F11: Fullscreen | ESC: Exit Fullscreen"
         help_label = tk.Label(
             footer_frame,
             text=help_text,
@@ -305,82 +351,114 @@ class RunWindow:
         )
         waec_label.pack(side=tk.LEFT)
 
-        # Update clock periodically
+        # Update clock on every wall-clock second, in step with the countdown
         self._update_clock()
+        self.timer_hub.add_periodic(CLOCK_JOB, self._update_clock, 1000)
 
     def update(self, schedule: Schedule, current_task: Task, next_task: Optional[Task] = None):
-        """Update display with current schedule state"""
+        """Update display with current schedule state (drawn in the hub's next idle pass)"""
         # Store references
         self.current_task = current_task
         self.next_task = next_task
         self.schedule = schedule
 
-        # Update schedule name
-        self.schedule_label.config(text=schedule.name)
+        self.timer_hub.request_redraw(REDRAW_JOB, self._render)
 
-        # Update task title with optional prefix
-        task_prefix = getattr(schedule, 'task_prefix', 'Now')  # Default to 'Now'
-        if task_prefix:
-            title_text = f"{task_prefix}: {current_task.title}"
-        else:
-            title_text = current_task.title
-        self.task_title_label.config(text=title_text)
+    def attach_view(self, view):
+        """
+        Mirror every frame to another view (e.g. AudienceView)
 
-        # Update countdown
-        remaining = current_task.remaining_seconds
-        countdown_text = self.time_service.format_seconds(remaining)
-        self.countdown_label.config(text=countdown_text)
-
-        # Update status
-        status_text = self.time_service.get_friendly_time_remaining(remaining)
-        self.status_label.config(text=status_text)
-
-        # Update next task info with start time if available
-        if next_task:
-            duration_str = self.time_service.format_duration(next_task.duration_seconds, short=True)
-
-            # Add start time if task has absolute_start_time
-            if hasattr(next_task, 'absolute_start_time') and next_task.absolute_start_time:
-                # Convert 24-hour to 12-hour format for display
-                try:
-                    hour, minute = map(int, next_task.absolute_start_time.split(':'))
-                    ampm = 'am' if hour < 12 else 'pm'
-                    display_hour = hour if hour <= 12 else hour - 12
-                    if display_hour == 0:
-                        display_hour = 12
-                    time_str = f"{display_hour}:{minute:02d}{ampm}"
-                    next_text = f"Next: {next_task.title} ({duration_str}, starts at {time_str})"
-                except:
-                    next_text = f"Next: {next_task.title} ({duration_str})"
-            else:
-                next_text = f"Next: {next_task.title} ({duration_str})"
-
-            self.next_task_label.config(text=next_text)
-        else:
-            self.next_task_label.config(text="Last task in schedule")
+        Args:
+            view: Object with apply(frame), show(), hide() and destroy()
+        """
+        self.views.append(view)
+
+    def _render(self):
+        """Build the frame once and push it to this window and every attached view"""
+        frame = self._build_frame()
+        if frame is None:
+            return
+
+        self._apply_frame(frame)
+        for view in self.views:
+            view.apply(frame)
+
+    def _build_frame(self) -> Optional[RunFrame]:
+        """Display values for the stored schedule state"""
+        schedule = self.schedule
+        current_task = self.current_task
+        next_task = self.next_task
+        if not schedule or not current_task:
+            return None
+
+        # Task-level strings are rebuilt only when the task (or what follows it) changes
+        strings_key = task_strings_key(schedule, current_task, next_task)
+        if strings_key != self._task_strings_key:
+            self._task_strings_key = strings_key
+            self._task_strings = build_task_strings(schedule, current_task, next_task, self.time_service)
+        strings = self._task_strings
 
-        # Update progress bar
+        remaining = current_task.remaining_seconds
+        progress = None
         if current_task.duration_seconds > 0:
             progress_value = ((current_task.duration_seconds - remaining) / current_task.duration_seconds) * 100
-            self.progress['value'] = progress_value
+            progress = round(progress_value, 2)
+
+        display = current_task.display
+        ticker_message = ""
+        if display.ticker_enabled:
+            ticker_message = build_ticker_message(current_task, next_task, self.time_service)
+
+        return RunFrame(
+            schedule_text=strings.schedule_text,
+            title_text=strings.title_text,
+            next_text=strings.next_text,
+            countdown_text=self.time_service.format_seconds(remaining),
+            countdown_color=self._countdown_color(remaining),
+            status_text=self.time_service.get_friendly_time_remaining(remaining),
+            progress=progress,
+            ticker_enabled=display.ticker_enabled,
+            ticker_message=ticker_message,
+            ticker_speed=display.ticker_speed,
+            ticker_direction=display.ticker_direction
+        )
 
-        # Color coding based on time remaining
-        if remaining <= 60:
-            self.countdown_label.config(fg=self.theme.accent_2)  # Red for last minute
-        elif remaining <= 300:
-            self.countdown_label.config(fg="#FFA500")  # Orange for last 5 minutes
+    def _apply_frame(self, frame: RunFrame):
+        """Push a frame to this window's widgets"""
+        self.render.set(self.schedule_label, 'text', frame.schedule_text)
+        self.render.set(self.task_title_label, 'text', frame.title_text)
+        self.render.set(self.next_task_label, 'text', frame.next_text)
+
+        # Per-tick values
+        if self.countdown_glyphs:
+            self.countdown_glyphs.set(frame.countdown_text, frame.countdown_color)
         else:
-            self.countdown_label.config(fg=self.theme.accent_3)  # Normal color
+            self.render.set(self.countdown_label, 'text', frame.countdown_text)
+            self.render.set(self.countdown_label, 'fg', frame.countdown_color)
+        self.render.set(self.status_label, 'text', frame.status_text)
+
+        if frame.progress is not None:
+            self.render.set(self.progress, 'value', frame.progress)
+
+        # The ticker is shown on the audience view in dual display
+        self._update_ticker(frame if not self.dual_display else None)
 
-        # Update ticker if enabled
-        if current_task.display.ticker_enabled:
-            self._update_ticker()
+    def _countdown_color(self, remaining: int) -> str:
+        """Countdown colour for the time remaining"""
+        if remaining <= 60:
+            return self.theme.accent_2  # Red for last minute
+        if remaining <= 300:
+            return "#FFA500"  # Orange for last 5 minutes
+        return self.theme.accent_3  # Normal color
 
     def _update_clock(self):
         """Update the clock display"""
+        self.timer_hub.request_redraw(CLOCK_JOB, self._render_clock)
+
+    def _render_clock(self):
+        """Push the current time to the clock label"""
         current_time = self.time_service.get_current_time()
-        self.clock_label.config(text=current_time)
-        self.clock_timer_id = self.window.after(1000, self._update_clock)
+        self.render.set(self.clock_label, 'text', current_time)
 
     def toggle_pause(self):
         """Toggle pause/resume"""
@@ -438,117 +516,47 @@ class RunWindow:
         """Show the window"""
         self.window.deiconify()
         self.window.lift()
+        for view in self.views:
+            view.show()
 
     def hide(self):
         """Hide the window"""
         self.window.withdraw()
+        for view in self.views:
+            view.hide()
 
     def destroy(self):
         """Destroy the window and cancel all timers"""
-        # Cancel clock timer
-        if self.clock_timer_id:
-            self.window.after_cancel(self.clock_timer_id)
-            self.clock_timer_id = None
+        # Cancel clock job and pending redraws
+        self.timer_hub.cancel(CLOCK_JOB)
+        self.timer_hub.cancel(REDRAW_JOB)
 
-        # Cancel ticker timer
-        if self.ticker_timer_id:
-            try:
-                self.ticker_canvas.after_cancel(self.ticker_timer_id)
-            except:
-                pass
-            self.ticker_timer_id = None
+        # Stop ticker animation
+        self.ticker.stop()
+
+        for view in self.views:
+            view.destroy()
+        self.views = []
 
         # Destroy window
         self.window.destroy()
 
-    def _update_ticker(self):
-        """Update ticker message and animate"""
-        if not self.current_task or not self.current_task.display.ticker_enabled:
+    def _update_ticker(self, frame: Optional[RunFrame]):
+        """Show the ticker and keep it running while the frame has it enabled"""
+        if frame is None or not frame.ticker_enabled:
             # Hide ticker if not enabled
-            self.ticker_frame.pack_forget()
+            self.ticker.stop()
+            if self.ticker_frame.winfo_manager():
+                self.ticker_frame.pack_forget()
             return
 
         # Show ticker frame
-        self.ticker_frame.pack(fill=tk.X, side=tk.BOTTOM)
-
-        # Build ticker message from placeholders
-        ticker_text = self.current_task.display.ticker_text
-        if not ticker_text:
-            return
-
-        # Replace placeholders
-        message = ticker_text.replace("[TASK_NAME]", self.current_task.title)
-
-        if "[TIME_REMAINING]" in message:
-            time_remaining = self.time_service.format_seconds(self.current_task.remaining_seconds)
-            message = message.replace("[TIME_REMAINING]", time_remaining)
-
-        if "[NEXT_TASK]" in message and self.next_task:
-            message = message.replace("[NEXT_TASK]", self.next_task.title)
-        elif "[NEXT_TASK]" in message:
-            message = message.replace("Next: [NEXT_TASK]", "Last Task")
-            message = message.replace("[NEXT_TASK]", "None")
-
-        # Only update if message changed
-        if message != self.ticker_message:
-            self.ticker_message = message
-            self.ticker_offset = 0
-            if self.ticker_text_id:
-                self.ticker_canvas.delete(self.ticker_text_id)
-
-            # Create scrolling text
-            self.ticker_text_id = self.ticker_canvas.create_text(
-                self.ticker_canvas.winfo_width(),
-                25,
-                text=self.ticker_message,
-                font=(FONT_FAMILY, 18, 'bold'),
-                fill='white',
-                anchor='w'
-            )
-
-        # Animate ticker
-        self._animate_ticker()
+        if not self.ticker_frame.winfo_manager():
+            self.ticker_frame.pack(fill=tk.X, side=tk.BOTTOM)
 
-    def _animate_ticker(self):
-        """Animate ticker scrolling"""
-        if not self.current_task or not self.current_task.display.ticker_enabled:
+        if not frame.ticker_message:
             return
 
-        if not self.ticker_text_id:
-            return
-
-        # Get speed from current task display options
-        speed = self.current_task.display.ticker_speed
-        direction = self.current_task.display.ticker_direction
-
-        # Move text
-        if direction == "left":
-            self.ticker_canvas.move(self.ticker_text_id, -speed, 0)
-        else:
-            self.ticker_canvas.move(self.ticker_text_id, speed, 0)
-
-        # Get current position
-        coords = self.ticker_canvas.coords(self.ticker_text_id)
-        if not coords:
-            return
-
-        x_pos = coords[0]
-
-        # Reset position if scrolled off screen
-        canvas_width = self.ticker_canvas.winfo_width()
-        bbox = self.ticker_canvas.bbox(self.ticker_text_id)
-
-        if bbox:
-            text_width = bbox[2] - bbox[0]
-
-            if direction == "left":
-                # Reset to right side when fully scrolled off left
-                if x_pos + text_width < 0:
-                    self.ticker_canvas.coords(self.ticker_text_id, canvas_width, 25)
-            else:
-                # Reset to left side when fully scrolled off right
-                if x_pos > canvas_width:
-                    self.ticker_canvas.coords(self.ticker_text_id, -text_width, 25)
-
-        # Continue animation (100ms delay for smoother, slower scrolling)
-        self.ticker_timer_id = self.ticker_canvas.after(100, self._animate_ticker)
+        # The animator only recreates the text when the message changed
+        self.ticker.set_message(frame.ticker_message, frame.ticker_speed, frame.ticker_direction)
+        self.ticker.start()
@@ -12,6 +12,8 @@ from tasched.core.models import Task, Schedule, Settings, SoundProfile, DisplayO
 from tasched.services.theme_service import get_theme_service
 from tasched.services.resource_service import get_resource_service
 from tasched.services.storage_service import get_storage_service
+from tasched.services.image_service import get_image_service
+from tasched.ui.task_tree_model import TaskTreeModel
 from tasched.constants import *
 
 
@@ -55,10 +57,7 @@ class TaskDialog:
         logo_path = self.resource.get_image(WAEC_LOGO)
         if logo_path:
             try:
-                from PIL import Image, ImageTk
-                logo_img = Image.open(logo_path)
-                logo_img = logo_img.resize((60, 60), Image.Resampling.LANCZOS)
-                logo_photo = ImageTk.PhotoImage(logo_img)
+                logo_photo = get_image_service().get_photo(logo_path, (60, 60))
 
                 logo_label = tk.Label(logo_frame, image=logo_photo, bg=self.theme.background)
                 logo_label.image = logo_photo  # Keep reference
@@ -162,7 +161,7 @@ class TaskDialog:
                 bg=self.theme.background, fg=self.theme.primary_text).grid(row=6, column=0, sticky='w', pady=5)
 
         self.warning_sound_var = tk.StringVar()
-        sound_files = self.resource.list_sound_names()
+        sound_files = self._sound_choices()
         self.warning_combo = ttk.Combobox(main_frame, textvariable=self.warning_sound_var,
                                          values=sound_files, state='readonly', width=37)
         self.warning_combo.grid(row=5, column=1, columnspan=2, sticky='ew', pady=5)
@@ -300,7 +299,7 @@ class TaskDialog:
         self.warnings_entry.insert(0, warnings_str)
 
         # Sounds
-        sound_files = self.resource.list_sound_names()
+        sound_files = self._sound_choices()
 
         if self.task.sound_profile.warning_sound:
             if self.task.sound_profile.warning_sound in sound_files:
@@ -446,9 +445,15 @@ class TaskDialog:
 
             try:
                 shutil.copy(filename, dest_path)
+                # Forced: FAT/exFAT mtimes (2 s resolution) may not show the new file
+                self.resource.refresh_index(force=True)
+
+                # Transcode the new tone in the background before it is first used
+                from tasched.services.tone_cache import get_tone_cache
+                get_tone_cache().prewarm([str(dest_path)])
 
                 # Refresh combos and select new file
-                sound_files = self.resource.list_sound_names()
+                sound_files = self._sound_choices()
 
                 # Update both warning and timeup combos
                 self.warning_combo['values'] = sound_files
@@ -462,6 +467,10 @@ class TaskDialog:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to copy sound file: {e}")
 
+    def _sound_choices(self) -> List[str]:
+        """Sound names offered in the combos (built-in synth beeps first)"""
+        return [SYNTH_TONE] + self.resource.list_sound_names()
+
     def _build_ticker_text(self) -> str:
         """Build ticker message from checkbox selections"""
         parts = []
@@ -545,10 +554,7 @@ class SetupWindow(tk.Frame):
         logo_path = self.resource.get_image(WAEC_LOGO)
         if logo_path:
             try:
-                from PIL import Image, ImageTk
-                logo_img = Image.open(logo_path)
-                logo_img = logo_img.resize((80, 80), Image.Resampling.LANCZOS)
-                logo_photo = ImageTk.PhotoImage(logo_img)
+                logo_photo = get_image_service().get_photo(logo_path, (80, 80))
 
                 logo_label = tk.Label(header_frame, image=logo_photo, bg=self.theme.background)
                 logo_label.image = logo_photo  # Keep reference
@@ -603,7 +609,8 @@ class SetupWindow(tk.Frame):
         self.task_tree.column('Warnings', width=150)
 
         scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.task_tree.yview)
-        self.task_tree.configure(yscrollcommand=scrollbar.set)
+        # Rows are kept in step incrementally and rendered only when visible
+        self.task_model = TaskTreeModel(self.task_tree, scrollbar)
 
         self.task_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -651,6 +658,16 @@ class SetupWindow(tk.Frame):
                  bg=self.theme.accent_1, fg=self.theme.background,
                  padx=20, pady=12).pack(side=tk.LEFT, padx=5)
 
+        tk.Button(action_frame, text="📤 Export", command=self._export_schedule,
+                 font=(FONT_FAMILY, FONT_SIZE_NORMAL, 'bold'),
+                 bg=self.theme.accent_3, fg=self.theme.background,
+                 padx=20, pady=12).pack(side=tk.LEFT, padx=5)
+
+        tk.Button(action_frame, text="📥 Import", command=self._import_schedule,
+                 font=(FONT_FAMILY, FONT_SIZE_NORMAL, 'bold'),
+                 bg=self.theme.accent_1, fg=self.theme.background,
+                 padx=20, pady=12).pack(side=tk.LEFT, padx=5)
+
         tk.Button(action_frame, text="▶ Start Schedule", command=self._start_schedule,
                  font=(FONT_FAMILY, FONT_SIZE_LARGE, 'bold'),
                  bg=self.theme.accent_1, fg=self.theme.background,
@@ -663,17 +680,16 @@ class SetupWindow(tk.Frame):
 
         if task:
             self.current_schedule.add_task(task)
-            self._refresh_task_list()
+            self.task_model.append(task)
 
     def _edit_task(self):
         """Edit selected task"""
-        selection = self.task_tree.selection()
-        if not selection:
+        item = self.task_model.selected()
+        if not item:
             messagebox.showwarning("No Selection", "Please select a task to edit")
             return
 
-        item = selection[0]
-        index = self.task_tree.index(item)
+        index = self.task_model.index_of(item)
 
         task = self.current_schedule.tasks[index]
         dialog = TaskDialog(self.parent, task)
@@ -681,68 +697,50 @@ class SetupWindow(tk.Frame):
 
         if updated_task:
             self.current_schedule.tasks[index] = updated_task
-            self._refresh_task_list()
+            self.task_model.update(item, updated_task)
 
     def _remove_task(self):
         """Remove selected task"""
-        selection = self.task_tree.selection()
-        if not selection:
+        item = self.task_model.selected()
+        if not item:
             messagebox.showwarning("No Selection", "Please select a task to remove")
             return
 
         if messagebox.askyesno("Confirm", "Remove this task?"):
-            item = selection[0]
-            index = self.task_tree.index(item)
+            index = self.task_model.index_of(item)
             self.current_schedule.tasks.pop(index)
             self.current_schedule.task_ids.pop(index)
-            self._refresh_task_list()
+            self.task_model.remove(item)
 
     def _move_up(self):
         """Move task up in order"""
-        selection = self.task_tree.selection()
-        if not selection:
+        item = self.task_model.selected()
+        if not item:
             return
 
-        item = selection[0]
-        index = self.task_tree.index(item)
+        index = self.task_model.index_of(item)
 
         if index > 0:
             self.current_schedule.reorder_tasks(index, index - 1)
-            self._refresh_task_list()
-            # Reselect moved item
-            new_item = self.task_tree.get_children()[index - 1]
-            self.task_tree.selection_set(new_item)
+            self.task_model.move(item, index - 1)
+            self.task_model.select(item)
 
     def _move_down(self):
         """Move task down in order"""
-        selection = self.task_tree.selection()
-        if not selection:
+        item = self.task_model.selected()
+        if not item:
             return
 
-        item = selection[0]
-        index = self.task_tree.index(item)
+        index = self.task_model.index_of(item)
 
         if index < len(self.current_schedule.tasks) - 1:
             self.current_schedule.reorder_tasks(index, index + 1)
-            self._refresh_task_list()
-            # Reselect moved item
-            new_item = self.task_tree.get_children()[index + 1]
-            self.task_tree.selection_set(new_item)
+            self.task_model.move(item, index + 1)
+            self.task_model.select(item)
 
     def _refresh_task_list(self):
-        """Refresh task list display"""
-        # Clear existing items
-        for item in self.task_tree.get_children():
-            self.task_tree.delete(item)
-
-        # Add tasks
-        for i, task in enumerate(self.current_schedule.tasks):
-            duration_str = f"{task.duration_seconds // 3600}h {(task.duration_seconds % 3600) // 60}m {task.duration_seconds % 60}s"
-            # Display warnings in minutes (converted from seconds)
-            warnings_str = ', '.join([f"{w // 60}min" for w in task.warning_points_seconds[:3] if w > 0])
-
-            self.task_tree.insert('', 'end', text=f"{i+1}",
-                                 values=(task.title, duration_str, warnings_str))
+        """Reload the task list from the current schedule (edits update rows individually)"""
+        self.task_model.load(self.current_schedule.tasks)
 
     def _save_schedule(self):
         """Save current schedule"""
@@ -867,6 +865,47 @@ class SetupWindow(tk.Frame):
                  relief='groove',
                  padx=20, pady=8).pack(side=tk.LEFT, padx=5)
 
+    def _export_schedule(self):
+        """Write the current schedule to a file for another PC"""
+        if not self.current_schedule.tasks:
+            messagebox.showwarning("No Tasks", "Add at least one task before exporting")
+            return
+
+        self.current_schedule.name = self.schedule_name_var.get()
+        filename = filedialog.asksaveasfilename(
+            title="Export Schedule",
+            defaultextension=SCHEDULE_EXPORT_EXTENSION,
+            initialfile=f"{self.current_schedule.name}{SCHEDULE_EXPORT_EXTENSION}",
+            filetypes=[("TaSched schedules", f"*{SCHEDULE_EXPORT_EXTENSION}"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+
+        try:
+            self.storage.export_schedule(self.current_schedule, filename)
+            messagebox.showinfo("Exported", f"Schedule '{self.current_schedule.name}' exported successfully!")
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to export schedule: {e}")
+
+    def _import_schedule(self):
+        """Load a schedule exported on another PC (snapshot or JSON) into the editor"""
+        filename = filedialog.askopenfilename(
+            title="Import Schedule",
+            filetypes=[("TaSched schedules", f"*{SCHEDULE_EXPORT_EXTENSION} *.json"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+
+        schedule = self.storage.import_schedule(filename)
+        if schedule is None:
+            messagebox.showerror("Error", "The file is not a TaSched schedule")
+            return
+
+        schedule.reset()
+        self.current_schedule = schedule
+        self.schedule_name_var.set(schedule.name)
+        self._refresh_task_list()
+
     def _start_schedule(self):
         """Start the current schedule"""
         if not self.current_schedule.tasks:
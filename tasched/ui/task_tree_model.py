@@ -0,0 +1,186 @@
+"""
+TaSched - Task Tree Model
+Incremental, lazily rendered task list for the setup window
+Rows are keyed by task id and inserted, updated, moved or removed one at
+a time. New rows start as empty placeholders; only rows in (or near) the
+visible part of the Treeview get their text and values filled in.
+Formatted strings are cached per task and rebuilt only when the task's
+title, duration or warnings change.
+"""
+
+import math
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, List, Optional, Tuple
+
+from tasched.core.models import Task
+from tasched.constants import TASK_TREE_OVERSCAN
+
+
+def format_task_row(task: Task) -> Tuple[str, str, str]:
+    """
+    Build the Treeview values for a task
+
+    Returns:
+        (title, duration, warnings)
+    """
+    duration = task.duration_seconds
+    duration_str = f"{duration // 3600}h {(duration % 3600) // 60}m {duration % 60}s"
+    # Display warnings in minutes (converted from seconds)
+    warnings_str = ', '.join([f"{w // 60}min" for w in task.warning_points_seconds[:3] if w > 0])
+    return (task.title, duration_str, warnings_str)
+
+
+class TaskTreeModel:
+    """
+    Keeps a Treeview in step with a task list without rebuilding it
+    """
+
+    def __init__(self, tree: ttk.Treeview, scrollbar: ttk.Scrollbar = None,
+                 overscan: int = TASK_TREE_OVERSCAN):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.overscan = overscan
+
+        self._order: List[str] = []  # row ids in display order
+        self._tasks: Dict[str, Task] = {}  # row id -> task
+        self._shown: Dict[str, Tuple] = {}  # row id -> (text, values) last pushed
+        self._strings: Dict[str, Tuple[Tuple, Tuple[str, str, str]]] = {}  # row id -> (key, values)
+        self._render_id = None
+
+        tree.configure(yscrollcommand=self._on_scroll)
+        tree.bind('<Configure>', lambda e: self._schedule_render(), add='+')
+
+    # ========== Row Operations ==========
+
+    def load(self, tasks: List[Task]):
+        """Replace every row (used when a whole schedule is loaded)"""
+        self.tree.delete(*self.tree.get_children())
+        self._order = []
+        self._tasks = {}
+        self._shown = {}
+        self._strings = {}
+        for task in tasks:
+            self.insert(len(self._order), task)
+
+    def insert(self, index: int, task: Task) -> str:
+        """
+        Insert a placeholder row for a task
+
+        Args:
+            index: Display position
+            task: Task for the row
+
+        Returns:
+            Row id
+        """
+        row_id = self._new_row_id(task)
+        self.tree.insert('', index, iid=row_id)
+        self._order.insert(index, row_id)
+        self._tasks[row_id] = task
+        self._schedule_render()
+        return row_id
+
+    def append(self, task: Task) -> str:
+        """Add a row at the end"""
+        return self.insert(len(self._order), task)
+
+    def update(self, row_id: str, task: Task = None):
+        """
+        Refresh one row after its task was edited
+
+        Args:
+            row_id: Row id
+            task: Replacement task (defaults to the existing, edited one)
+        """
+        if task is not None:
+            self._tasks[row_id] = task
+        self._shown.pop(row_id, None)
+        self._schedule_render()
+
+    def remove(self, row_id: str):
+        """Remove one row"""
+        self.tree.delete(row_id)
+        self._order.remove(row_id)
+        self._tasks.pop(row_id, None)
+        self._shown.pop(row_id, None)
+        self._strings.pop(row_id, None)
+        self._schedule_render()
+
+    def move(self, row_id: str, index: int):
+        """Move one row to a new display position"""
+        self.tree.move(row_id, '', index)
+        self._order.remove(row_id)
+        self._order.insert(index, row_id)
+        self._schedule_render()
+
+    def index_of(self, row_id: str) -> int:
+        """Display position of a row"""
+        return self._order.index(row_id)
+
+    def selected(self) -> Optional[str]:
+        """Row id of the first selected row, if any"""
+        selection = self.tree.selection()
+        return selection[0] if selection else None
+
+    def select(self, row_id: str):
+        """Select a row and scroll it into view"""
+        self.tree.selection_set(row_id)
+        self.tree.see(row_id)
+
+    # ========== Lazy Rendering ==========
+
+    def _new_row_id(self, task: Task) -> str:
+        """Row id from the task id (suffixed if the id is already shown)"""
+        row_id = task.id
+        suffix = 1
+        while row_id in self._tasks:
+            suffix += 1
+            row_id = f"{task.id}#{suffix}"
+        return row_id
+
+    def _on_scroll(self, first, last):
+        """Treeview yscrollcommand: forward to the scrollbar and render newly visible rows"""
+        if self.scrollbar:
+            self.scrollbar.set(first, last)
+        self._schedule_render()
+
+    def _schedule_render(self):
+        """Render visible rows once, after pending changes settle"""
+        if self._render_id is None:
+            self._render_id = self.tree.after_idle(self._render_visible)
+
+    def _render_visible(self):
+        """Fill in text and values for rows in view (plus an overscan margin)"""
+        self._render_id = None
+        count = len(self._order)
+        if not count:
+            return
+
+        first, last = self.tree.yview()
+        start = max(0, int(first * count) - self.overscan)
+        end = min(count, int(math.ceil(last * count)) + self.overscan)
+        for index in range(start, end):
+            self._render_row(index)
+
+    def _render_row(self, index: int):
+        """Push a row's number and values if they changed"""
+        row_id = self._order[index]
+        state = (str(index + 1), self._row_strings(row_id))
+        if self._shown.get(row_id) == state:
+            return
+        try:
+            self.tree.item(row_id, text=state[0], values=state[1])
+        except tk.TclError:
+            return
+        self._shown[row_id] = state
+
+    def _row_strings(self, row_id: str) -> Tuple[str, str, str]:
+        """Formatted values for a row, rebuilt only when the task changed"""
+        task = self._tasks[row_id]
+        key = (task.title, task.duration_seconds, tuple(task.warning_points_seconds[:3]))
+        cached = self._strings.get(row_id)
+        if cached is None or cached[0] != key:
+            cached = (key, format_task_row(task))
+            self._strings[row_id] = cached
+        return cached[1]
@@ -0,0 +1,202 @@
+"""
+TaSched - Ticker Animator
+Frame job for the scrolling ticker message
+Frames run on the shared timer hub heartbeat. Motion is time-based
+(pixels per second), so the scroll speed does not depend on the frame
+rate or on late frames. The text width is measured
+once per message instead of every frame, and the loop pauses while the
+window is minimised.
+"""
+
+import time
+import tkinter as tk
+from typing import Dict
+
+from tasched.core.timer_hub import get_timer_hub
+from tasched.constants import (
+    FONT_FAMILY,
+    TICKER_DIRECTION_LEFT,
+    TICKER_FPS,
+    TICKER_PIXELS_PER_SPEED
+)
+
+
+class TickerAnimator:
+    """
+    Scrolls one text item across a canvas from a timer hub frame job
+    """
+
+    def __init__(self, canvas: tk.Canvas, fps: int = TICKER_FPS,
+                 font=(FONT_FAMILY, 18, 'bold'), fill: str = 'white', y: int = 25):
+        self.canvas = canvas
+        self.fps = max(1, fps)
+        self.font = font
+        self.fill = fill
+
+        self.message = ""
+        self.speed = 1
+        self.direction = TICKER_DIRECTION_LEFT
+
+        self._text_id = None
+        self._text_width = 0
+        self._x = 0.0
+        self._y = y  # vertical centre of the text
+        self.timer_hub = get_timer_hub(canvas)
+        self._job_name = f"ticker{canvas}"
+        self._running = False
+        self._paused = False
+        self._last_frame = None
+
+        # Frame timing
+        self.frames = 0
+        self._frame_time_total = 0.0
+        self._frame_time_max = 0.0
+
+        toplevel = canvas.winfo_toplevel()
+        toplevel.bind('<Unmap>', self._on_unmap, add='+')
+        toplevel.bind('<Map>', self._on_map, add='+')
+        self._toplevel = toplevel
+
+    # ========== Public API ==========
+
+    def set_message(self, message: str, speed: int = None, direction: str = None):
+        """
+        Set the scrolling text and motion
+        A changed message is swapped in place; scrolling continues from
+        the current position
+
+        Args:
+            message: Text to scroll
+            speed: Ticker speed setting (TICKER_SPEED_*)
+            direction: TICKER_DIRECTION_LEFT or TICKER_DIRECTION_RIGHT
+        """
+        if speed is not None:
+            self.speed = speed
+        if direction is not None:
+            self.direction = direction
+
+        if message == self.message and self._text_id:
+            return
+
+        self.message = message
+        if self._text_id:
+            self.canvas.itemconfigure(self._text_id, text=message)
+            self._measure()
+            return
+
+        self._text_id = self.canvas.create_text(
+            0, self._y, text=message, font=self.font, fill=self.fill, anchor='w'
+        )
+        self._measure()
+        self._x = self._start_x()
+        self.canvas.coords(self._text_id, self._x, self._y)
+
+    def start(self):
+        """Start the frame loop (no-op if already running)"""
+        if self._running:
+            return
+        self._running = True
+        self._last_frame = None
+        self._schedule()
+
+    def stop(self):
+        """Stop the frame loop"""
+        self._running = False
+        self._cancel()
+
+    def clear(self):
+        """Stop and remove the text"""
+        self.stop()
+        if self._text_id:
+            self.canvas.delete(self._text_id)
+        self._text_id = None
+        self.message = ""
+
+    def get_stats(self) -> Dict[str, float]:
+        """Frame count and per-frame work time in milliseconds"""
+        average = (self._frame_time_total / self.frames) if self.frames else 0.0
+        return {
+            'frames': self.frames,
+            'avg_ms': average * 1000,
+            'max_ms': self._frame_time_max * 1000
+        }
+
+    # ========== Frame Loop ==========
+
+    def _schedule(self):
+        """Register the frame job on the hub (re-registering replaces it)"""
+        if self._running and not self._paused:
+            self.timer_hub.add_periodic(self._job_name, self._frame, 1000 / self.fps)
+
+    def _cancel(self):
+        """Remove the frame job"""
+        self.timer_hub.cancel(self._job_name)
+
+    def _frame(self):
+        """Advance the text by the time elapsed since the last frame"""
+        started = time.perf_counter()
+        self.advance(started)
+        self._record_frame(time.perf_counter() - started)
+
+    def advance(self, now: float = None):
+        """
+        Move the text for the time elapsed since the previous call
+
+        Args:
+            now: Current perf_counter time
+        """
+        now = time.perf_counter() if now is None else now
+        elapsed = 0.0 if self._last_frame is None else now - self._last_frame
+        self._last_frame = now
+
+        if not self._text_id:
+            return
+
+        distance = self.speed * TICKER_PIXELS_PER_SPEED * elapsed
+        canvas_width = self.canvas.winfo_width()
+
+        if self.direction == TICKER_DIRECTION_LEFT:
+            self._x -= distance
+            # Reset to right side when fully scrolled off left
+            if self._x + self._text_width < 0:
+                self._x = canvas_width
+        else:
+            self._x += distance
+            # Reset to left side when fully scrolled off right
+            if self._x > canvas_width:
+                self._x = -self._text_width
+
+        self.canvas.coords(self._text_id, self._x, self._y)
+
+    def _record_frame(self, duration: float):
+        """Track per-frame work time"""
+        self.frames += 1
+        self._frame_time_total += duration
+        if duration > self._frame_time_max:
+            self._frame_time_max = duration
+
+    def _measure(self):
+        """Measure the text once per message; moving the item does not change it"""
+        bbox = self.canvas.bbox(self._text_id)
+        self._text_width = (bbox[2] - bbox[0]) if bbox else 0
+
+    def _start_x(self) -> float:
+        """Starting x position for the current direction"""
+        if self.direction == TICKER_DIRECTION_LEFT:
+            return self.canvas.winfo_width()
+        return -self._text_width
+
+    # ========== Minimise Handling ==========
+
+    def _on_unmap(self, event):
+        """Pause while the window is minimised or hidden"""
+        if event.widget is self._toplevel:
+            self._paused = True
+            self._cancel()
+
+    def _on_map(self, event):
+        """Resume when the window is shown again"""
+        if event.widget is self._toplevel and self._paused:
+            self._paused = False
+            self._last_frame = None
+            self._schedule()
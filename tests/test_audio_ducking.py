@@ -0,0 +1,112 @@
+"""
+Music ducking under alerts and how often the audio worker wakes
+
+Usage:
+    python -m unittest tests.test_audio_ducking
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tasched.constants import (
+    AUDIO_DUCK_ATTACK_MS,
+    AUDIO_DUCK_LEVEL,
+    AUDIO_DUCK_POLL_MS,
+    AUDIO_DUCK_RELEASE_MS,
+    AUDIO_ENVELOPE_STEP_MS
+)
+from tasched.services import audio_service
+from tasched.services.audio_backend import AudioBackend
+from tasched.services.tone_cache import ToneCache
+
+
+class FakeBackend(AudioBackend):
+    """Mixer with one playing alert and streamed music"""
+
+    name = "fake"
+
+    def __init__(self):
+        self.alert_playing = True
+        self.music_volumes = []
+
+    def init(self, frequency, size, channels, buffer, reserved_channels):
+        pass
+
+    def quit(self):
+        pass
+
+    def channel_busy(self, channel_id):
+        return self.alert_playing
+
+    def music_busy(self):
+        return True
+
+    def set_music_volume(self, volume):
+        self.music_volumes.append(volume)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class DuckingTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        tone_cache = mock.patch.object(audio_service, 'get_tone_cache',
+                                       return_value=ToneCache(cache_dir=directory.name))
+        tone_cache.start()
+        self.addCleanup(tone_cache.stop)
+        clock = mock.patch.object(audio_service, 'time', FakeClock())
+        self.clock = clock.start()
+        self.addCleanup(clock.stop)
+
+        self.backend = FakeBackend()
+        with mock.patch('builtins.print'):
+            self.service = audio_service.AudioService(backend=self.backend)
+            self.service.wait_until_ready(2.0)
+            self.addCleanup(self.service.cleanup)
+
+    def advance(self, ms):
+        self.clock.now += ms / 1000.0
+        self.service._service_envelope()
+
+    def test_idle_worker_blocks(self):
+        self.assertIsNone(self.service._envelope_wait())
+
+    def test_wakes_quickly_only_while_ramping(self):
+        service = self.service
+        service.duck_envelope.ramp_to(AUDIO_DUCK_LEVEL, AUDIO_DUCK_ATTACK_MS)
+        service._ducked = True
+        self.assertEqual(service._envelope_wait(), AUDIO_ENVELOPE_STEP_MS / 1000.0)
+
+        # Held at the duck level while the alert plays: coarse polling
+        self.advance(AUDIO_DUCK_ATTACK_MS + AUDIO_ENVELOPE_STEP_MS)
+        self.assertEqual(service.duck_envelope.gain, AUDIO_DUCK_LEVEL)
+        self.assertEqual(service._envelope_wait(), AUDIO_DUCK_POLL_MS / 1000.0)
+        self.advance(AUDIO_DUCK_POLL_MS)
+        self.assertEqual(service._envelope_wait(), AUDIO_DUCK_POLL_MS / 1000.0)
+
+        # Alert finished: release ramp, then back to blocking
+        self.backend.alert_playing = False
+        self.advance(AUDIO_DUCK_POLL_MS)
+        self.assertFalse(service._ducked)
+        self.assertEqual(service._envelope_wait(), AUDIO_ENVELOPE_STEP_MS / 1000.0)
+        self.advance(AUDIO_DUCK_RELEASE_MS + AUDIO_ENVELOPE_STEP_MS)
+        self.assertEqual(service.duck_envelope.gain, 1.0)
+        self.assertAlmostEqual(self.backend.music_volumes[-1], service.volume)
+        self.assertIsNone(service._envelope_wait())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+Hall sync: a follower joining before the master starts, and the master loop
+Runs without a display: the scheduler gets a stub Tk root and App's
+follow step is called on a stub instance.
+
+Usage:
+    python -m unittest tests.test_hall_follow
+"""
+
+import os
+import socket
+import sys
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tasched.core.models import Schedule, Task
+from tasched.core.scheduler_engine import SchedulerEngine
+from tasched.services import journal_service
+from tasched.services.hall_sync_service import (
+    FRAME_MAGIC,
+    FRAME_PING,
+    FRAME_VERSION,
+    PING_FORMAT,
+    PONG_FORMAT,
+    HallState,
+    HallSyncService,
+    id_key
+)
+from tasched.constants import *
+
+
+class StubRoot:
+    """Enough of tk.Tk for the timer hub"""
+
+    def after(self, delay_ms, callback=None, *args):
+        return "after#0"
+
+    def after_idle(self, callback, *args):
+        return "after#1"
+
+    def after_cancel(self, after_id):
+        pass
+
+
+class StubHallSync:
+    """Returns a fixed master state"""
+
+    role = HALL_SYNC_ROLE_FOLLOWER
+
+    def __init__(self, state: HallState):
+        self.state = state
+
+    def latest(self):
+        return self.state
+
+    def remaining_seconds(self, state: HallState) -> int:
+        return state.remaining
+
+
+def build_schedule() -> Schedule:
+    schedule = Schedule(name="Hall")
+    schedule.add_task(Task(title="Paper 1", duration_seconds=600))
+    schedule.add_task(Task(title="Paper 2", duration_seconds=600))
+    return schedule
+
+
+def master_state(schedule: Schedule, state: str, remaining: int = 0, task_index: int = 0) -> HallState:
+    return HallState(1, id_key(schedule.id), id_key(schedule.tasks[task_index].id), task_index,
+                     len(schedule.tasks), state, remaining, 0.0, time.monotonic())
+
+
+class FollowBeforeMasterTest(unittest.TestCase):
+
+    def setUp(self):
+        # A journal without sinks: nothing is written to the log or database
+        patcher = mock.patch.object(journal_service, '_event_journal', journal_service.EventJournal())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.schedule = build_schedule()
+        self.engine = SchedulerEngine(StubRoot())
+        self.engine.load_schedule(self.schedule)
+        self.events = []
+        self.engine.set_timeup_callback(lambda *args: self.events.append("timeup"))
+        self.engine.set_task_complete_callback(lambda *args: self.events.append("complete"))
+        self.engine.set_schedule_complete_callback(lambda *args: self.events.append("schedule_complete"))
+
+    def follow_stub(self, state: HallState) -> SimpleNamespace:
+        """App instance reduced to what _follow_master uses"""
+        import app
+        stub = SimpleNamespace(
+            hall_sync=StubHallSync(state),
+            scheduler=self.engine,
+            _hall_schedule_key=id_key(self.schedule.id),
+            _hall_task_index={id_key(task.id): index for index, task in enumerate(self.schedule.tasks)},
+            _followed=None
+        )
+        app.TaSchedApp._follow_master(stub)
+        return stub
+
+    def assert_waiting(self):
+        self.assertEqual(self.events, [])
+        self.assertEqual(self.schedule.state, SCHEDULE_STATE_IDLE)
+        self.assertEqual(self.schedule.tasks[0].state, TASK_STATE_PENDING)
+        self.assertEqual(self.schedule.tasks[0].remaining_seconds, 600)
+
+    def test_idle_master_leaves_follower_waiting(self):
+        self.engine.follow(0, 0, SCHEDULE_STATE_IDLE)
+        self.engine.follow(0, 0, SCHEDULE_STATE_READY)
+        self.assert_waiting()
+
+    def test_stale_finished_frame_is_ignored(self):
+        self.engine.follow(1, 0, SCHEDULE_STATE_COMPLETED)
+        self.engine.follow(1, 0, SCHEDULE_STATE_CANCELLED)
+        self.assert_waiting()
+
+    def test_other_schedule_is_ignored(self):
+        other = build_schedule()
+        self.follow_stub(master_state(other, SCHEDULE_STATE_RUNNING, remaining=0))
+        self.assert_waiting()
+
+    def test_running_master_is_followed(self):
+        self.follow_stub(master_state(self.schedule, SCHEDULE_STATE_RUNNING, remaining=540))
+        self.assertEqual(self.schedule.state, SCHEDULE_STATE_RUNNING)
+        self.assertEqual(self.schedule.tasks[0].state, TASK_STATE_ACTIVE)
+        self.assertEqual(self.schedule.tasks[0].remaining_seconds, 540)
+        self.assertEqual(self.events, [])
+
+
+class ScriptedSocket:
+    """recvfrom() results in order; the service stops when they run out"""
+
+    def __init__(self, service: HallSyncService, results):
+        self.service = service
+        self.results = list(results)
+        self.sent = []
+
+    def recvfrom(self, size):
+        if not self.results:
+            self.service._running = False
+            raise socket.timeout()
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def sendto(self, data, address):
+        self.sent.append((data, address))
+
+
+class MasterLoopTest(unittest.TestCase):
+
+    def test_connection_reset_does_not_stop_the_master(self):
+        service = HallSyncService()
+        ping = PING_FORMAT.pack(FRAME_MAGIC, FRAME_VERSION, FRAME_PING, 7, 123.0)
+        service._sock = ScriptedSocket(service, [
+            ConnectionResetError(10054, "WSAECONNRESET"),
+            OSError("transient"),
+            (ping, ("10.0.0.2", 40000))
+        ])
+        service._frame_sent_at = float('inf')  # no state resends in this test
+        service._running = True
+
+        service._master_loop()
+
+        self.assertEqual(len(service._sock.sent), 1)
+        data, address = service._sock.sent[0]
+        self.assertEqual(address, ("10.0.0.2", 40000))
+        self.assertEqual(PONG_FORMAT.unpack(data)[3], 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Task and Schedule state changes, and the slotted model layout
+
+Usage:
+    python -m unittest tests.test_models
+"""
+
+import copy
+import os
+import pickle
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tasched.constants import *
+from tasched.core.models import DisplayOptions, Schedule, SoundProfile, Task
+
+
+def build_schedule() -> Schedule:
+    schedule = Schedule(name="Mocks")
+    schedule.add_task(Task(title="English", duration_seconds=2))
+    schedule.add_task(Task(title="Maths", duration_seconds=3))
+    return schedule
+
+
+class TaskStateTest(unittest.TestCase):
+
+    def test_tick_counts_down_only_while_active(self):
+        task = Task(duration_seconds=2)
+        self.assertEqual(task.remaining_seconds, 2)
+        self.assertFalse(task.tick())
+        task.start()
+        self.assertIsNotNone(task.started_at)
+        self.assertFalse(task.tick())
+        task.pause()
+        self.assertFalse(task.tick())
+        self.assertEqual(task.remaining_seconds, 1)
+        task.resume()
+        self.assertTrue(task.tick())
+        self.assertFalse(task.tick())
+        self.assertEqual(task.remaining_seconds, 0)
+
+    def test_complete_skip_and_reset(self):
+        task = Task(duration_seconds=60)
+        task.start()
+        task.complete()
+        self.assertEqual(task.state, TASK_STATE_COMPLETED)
+        self.assertEqual(task.remaining_seconds, 0)
+        self.assertIsNotNone(task.completed_at)
+
+        task.reset()
+        self.assertEqual(task.state, TASK_STATE_PENDING)
+        self.assertEqual(task.remaining_seconds, 60)
+        self.assertIsNone(task.started_at)
+        self.assertIsNone(task.completed_at)
+
+        task.skip()
+        self.assertEqual(task.state, TASK_STATE_SKIPPED)
+        self.assertEqual(task.remaining_seconds, 60)
+
+    def test_warning_thresholds_descending(self):
+        self.assertEqual(Task(warning_points_seconds=[60, 300, 10]).get_warning_thresholds(), [300, 60, 10])
+
+
+class ScheduleStateTest(unittest.TestCase):
+
+    def test_run_through(self):
+        schedule = build_schedule()
+        schedule.start()
+        self.assertEqual(schedule.state, SCHEDULE_STATE_RUNNING)
+        self.assertEqual(schedule.tasks[0].state, TASK_STATE_ACTIVE)
+        self.assertIs(schedule.get_next_task(), schedule.tasks[1])
+
+        schedule.pause()
+        self.assertEqual(schedule.state, SCHEDULE_STATE_PAUSED)
+        self.assertEqual(schedule.tasks[0].state, TASK_STATE_PAUSED)
+        schedule.resume()
+        self.assertEqual(schedule.tasks[0].state, TASK_STATE_ACTIVE)
+
+        self.assertTrue(schedule.advance_to_next_task())
+        self.assertIs(schedule.get_current_task(), schedule.tasks[1])
+        self.assertIsNone(schedule.get_next_task())
+        self.assertFalse(schedule.advance_to_next_task())
+        self.assertIsNone(schedule.get_current_task())
+        schedule.complete()
+        self.assertEqual(schedule.state, SCHEDULE_STATE_COMPLETED)
+
+    def test_cancel_and_reset(self):
+        schedule = build_schedule()
+        schedule.start()
+        schedule.tasks[0].tick()
+        schedule.cancel()
+        self.assertEqual(schedule.state, SCHEDULE_STATE_CANCELLED)
+        self.assertIsNotNone(schedule.completed_at)
+
+        schedule.reset()
+        self.assertEqual(schedule.state, SCHEDULE_STATE_IDLE)
+        self.assertEqual(schedule.current_task_index, 0)
+        self.assertEqual(schedule.tasks[0].remaining_seconds, 2)
+        self.assertEqual(schedule.tasks[0].state, TASK_STATE_PENDING)
+
+    def test_editing_tasks(self):
+        schedule = build_schedule()
+        first, second = schedule.tasks
+        schedule.reorder_tasks(1, 0)
+        self.assertEqual(schedule.task_ids, [second.id, first.id])
+
+        schedule.duplicate_task(second.id)
+        copy_task = schedule.tasks[1]
+        self.assertEqual(copy_task.title, "Maths (Copy)")
+        self.assertNotEqual(copy_task.id, second.id)
+        self.assertIsNot(copy_task.sound_profile, second.sound_profile)
+        self.assertEqual(schedule.task_ids, [t.id for t in schedule.tasks])
+
+        schedule.remove_task(second.id)
+        self.assertEqual([t.title for t in schedule.tasks], ["Maths (Copy)", "English"])
+        self.assertEqual(schedule.get_total_duration(), 5)
+        self.assertTrue(schedule.validate_24_hour_constraint())
+
+
+class SlotsTest(unittest.TestCase):
+
+    def test_models_have_no_instance_dict(self):
+        for obj in (SoundProfile(), DisplayOptions(), Task(), Schedule()):
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj).__name__)
+            with self.assertRaises(AttributeError):
+                obj.misspelt_field = 1
+
+    def test_copy_and_pickle(self):
+        schedule = build_schedule()
+        for clone in (copy.deepcopy(schedule), pickle.loads(pickle.dumps(schedule))):
+            self.assertEqual(clone, schedule)
+            self.assertIsNot(clone.tasks[0], schedule.tasks[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Scheduler tick timing around start, resume, skip and next
+
+Usage:
+    python -m unittest tests.test_scheduler_ticks
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tasched.core import scheduler_engine
+from tasched.core.models import Schedule, Task
+from tasched.core.scheduler_engine import SchedulerEngine
+from tasched.services import journal_service
+
+
+class StubRoot:
+    """Enough of tk.Tk for the timer hub"""
+
+    def after(self, delay_ms, callback=None, *args):
+        return "after#0"
+
+    def after_idle(self, callback, *args):
+        return "after#1"
+
+    def after_cancel(self, after_id):
+        pass
+
+
+class FakeHub:
+    """Holds the pending tick instead of running a Tk loop"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.due = None
+        self.callback = None
+
+    def schedule(self, name, callback, delay_ms, aligned=False):
+        self.due = self.clock() + delay_ms / 1000
+        self.callback = callback
+
+    def cancel(self, name):
+        self.due = self.callback = None
+
+
+class TickTimingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1000.37
+        patcher = mock.patch.object(scheduler_engine.time, 'time', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # A journal without sinks: nothing is written to the log or database
+        patcher = mock.patch.object(journal_service, '_event_journal', journal_service.EventJournal())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.engine = SchedulerEngine(StubRoot())
+        self.hub = self.engine.timer_hub = FakeHub(lambda: self.now)
+
+        self.schedule = Schedule(name="Ticks")
+        for _ in range(3):
+            self.schedule.add_task(Task(duration_seconds=60))
+        self.engine.load_schedule(self.schedule)
+
+    def run_ticks(self, count: int, late: float = 0.0):
+        for _ in range(count):
+            self.now = self.hub.due + late
+            self.hub.callback()
+
+    def test_first_tick_after_start_is_one_second(self):
+        self.engine.start()
+        self.assertAlmostEqual(self.hub.due - self.now, 1.0)
+
+    def test_ticks_move_onto_wall_clock_seconds_gradually(self):
+        self.engine.start()
+        previous = self.now
+        for _ in range(12):
+            self.run_ticks(1)
+            self.assertAlmostEqual(self.hub.due - self.now, 1.0, delta=0.051)
+            previous = self.now
+        self.assertAlmostEqual(previous % 1, 0.0, places=6)
+
+    def test_late_tick_is_caught_up(self):
+        self.engine.start()
+        self.run_ticks(1, late=0.7)
+        due_after_late = self.hub.due
+        self.assertLess(due_after_late - self.now, 0.5)
+        self.assertEqual(self.schedule.tasks[0].remaining_seconds, 58)
+
+    def test_resume_restarts_the_second(self):
+        self.engine.start()
+        self.run_ticks(3)
+        self.now += 0.43
+        self.engine.pause()
+        self.now += 5.0
+        self.engine.resume()
+        self.assertAlmostEqual(self.hub.due - self.now, 1.0)
+
+    def test_skip_and_next_restart_the_second(self):
+        self.engine.start()
+        self.run_ticks(12)
+        for action in (self.engine.skip_task, self.engine.force_next_task):
+            self.now += 0.61
+            action()
+            self.assertAlmostEqual(self.hub.due - self.now, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Generated model encoders/decoders
+
+Usage:
+    python -m unittest tests.test_serializers
+"""
+
+import os
+import sys
+import unittest
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tasched.constants import DEFAULT_WARNING_POINTS, TASK_STATE_PENDING, WAEC_TONE
+from tasched.core.models import DisplayOptions, Schedule, Settings, SoundProfile, Task
+from tasched.core.serializers import generate_codec
+
+
+@dataclass
+class Leaf:
+    value: int = 1
+    tags: List[str] = field(default_factory=list)
+
+
+generate_codec(Leaf)
+
+
+@dataclass
+class Branch:
+    name: str
+    leaf: Leaf = field(default_factory=Leaf)
+    leaves: List[Leaf] = field(default_factory=list)
+    note: Optional[str] = None
+    post_init_calls: int = 0
+
+    def __post_init__(self):
+        self.post_init_calls += 1
+
+
+encode_branch, decode_branch = generate_codec(Branch, exclude=('post_init_calls',))
+
+
+class CodecTest(unittest.TestCase):
+
+    def test_round_trip_with_nested_models(self):
+        branch = Branch("b", Leaf(2, ["x"]), [Leaf(3), Leaf(4, ["y", "z"])], "note")
+        data = encode_branch(branch)
+        self.assertEqual(data, {
+            'name': "b",
+            'leaf': {'value': 2, 'tags': ["x"]},
+            'leaves': [{'value': 3, 'tags': []}, {'value': 4, 'tags': ["y", "z"]}],
+            'note': "note"
+        })
+        decoded = decode_branch(data)
+        self.assertEqual(decoded, Branch("b", Leaf(2, ["x"]), [Leaf(3), Leaf(4, ["y", "z"])], "note"))
+        self.assertEqual(decoded.post_init_calls, 1)
+
+    def test_encoder_copies_lists(self):
+        leaf = Leaf(tags=["a"])
+        data = generate_codec(Leaf)[0](leaf)
+        data['tags'].append("b")
+        self.assertEqual(leaf.tags, ["a"])
+
+    def test_missing_keys_take_defaults(self):
+        decoded = decode_branch({'name': "b", 'leaves': [{'value': 5}]})
+        self.assertEqual(decoded, Branch("b", Leaf(), [Leaf(5)]))
+        # Factories run per object
+        self.assertIsNot(decoded.leaf.tags, decoded.leaves[0].tags)
+
+    def test_missing_required_key_raises(self):
+        with self.assertRaises(KeyError):
+            decode_branch({'leaf': {}})
+
+    def test_extra_keys_are_ignored(self):
+        decoded = decode_branch({'name': "b", 'leaf': {'value': 2, 'tags': [], 'old': 1}, 'leaves': [],
+                                 'note': None, 'removed_setting': True})
+        self.assertEqual(decoded, Branch("b", Leaf(2)))
+
+    def test_decoded_objects_pass_through(self):
+        leaf = Leaf(7)
+        self.assertIs(decode_branch({'name': "b", 'leaf': leaf}).leaf, leaf)
+
+
+class ModelCodecTest(unittest.TestCase):
+
+    def test_schedule_round_trip(self):
+        schedule = Schedule(name="Mocks")
+        for index in range(3):
+            schedule.add_task(Task(title=f"Paper {index}", duration_seconds=60 * (index + 1)))
+        schedule.tasks[1].sound_profile.background_music = "calm.mp3"
+        schedule.tasks[2].display.ticker_text = "Quiet please"
+        schedule.task_prefix = "Ongoing"
+
+        data = schedule.to_dict()
+        self.assertNotIn('task_prefix', data)
+        restored = Schedule.from_dict(data)
+        self.assertEqual(restored.to_dict(), data)
+        self.assertIsInstance(restored.tasks[1].sound_profile, SoundProfile)
+        self.assertIsInstance(restored.tasks[2].display, DisplayOptions)
+        self.assertEqual(restored.task_prefix, "Now")
+
+    def test_task_from_partial_dict(self):
+        task = Task.from_dict({'title': "Oral", 'duration_seconds': 90, 'sound_profile': {}})
+        self.assertEqual(task.remaining_seconds, 90)
+        self.assertEqual(task.state, TASK_STATE_PENDING)
+        self.assertEqual(task.warning_points_seconds, DEFAULT_WARNING_POINTS)
+        self.assertIsNot(task.warning_points_seconds, DEFAULT_WARNING_POINTS)
+        self.assertEqual(task.sound_profile.timeup_sound, WAEC_TONE)
+        self.assertTrue(task.id)
+
+    def test_settings_from_older_file(self):
+        settings = Settings.from_dict({'theme': "dark", 'retired_option': 1})
+        self.assertEqual(settings.theme, "dark")
+        self.assertEqual(settings.to_dict(), Settings(theme="dark").to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
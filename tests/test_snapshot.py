@@ -0,0 +1,164 @@
+"""
+Snapshot format round trips, and template/export storage
+
+Usage:
+    python -m unittest tests.test_snapshot
+"""
+
+import datetime as dt
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tasched.core import models
+from tasched.core.models import Schedule, Task
+from tasched.core.serializers import dumps
+from tasched.core.snapshot import (
+    SNAPSHOT_VERSION,
+    Table,
+    dump_snapshot,
+    is_snapshot,
+    load_snapshot,
+    schedule_from_snapshot,
+    schedule_to_snapshot
+)
+from tasched.services.storage_service import StorageService
+
+
+def build_schedule(count: int = 40) -> Schedule:
+    """Schedule mixing default and overridden task settings"""
+    schedule = Schedule(name="Mock Exams", gap_between_tasks=30)
+    for index in range(count):
+        task = Task(title=f"Paper {index + 1}", duration_seconds=60 * (30 + index % 7))
+        schedule.add_task(task)
+    schedule.tasks[1].title = "Ünïcode ✓ 数学"
+    schedule.tasks[2].sound_profile.background_music = "calm.mp3"
+    schedule.tasks[3].display.ticker_enabled = True
+    schedule.tasks[3].display.ticker_text = "[TASK_NAME] - [TIME_REMAINING] left"
+    schedule.tasks[4].warning_points_seconds = [1, -5, 2 ** 40]
+    schedule.tasks[5].remaining_seconds = 17
+    schedule.tasks[6].repeat_days = [0, 2, 4]
+    return schedule
+
+
+class SnapshotValueTest(unittest.TestCase):
+
+    def test_values_round_trip(self):
+        value = {
+            'ints': [0, 127, 128, -1, -(2 ** 63), 2 ** 70],
+            'float': 1.5,
+            'flags': [None, True, False],
+            'text': ["", "x" * 300, "é"],
+            'long list': list(range(40)),
+            'many keys': {str(i): i for i in range(20)}
+        }
+        for compress in (False, True):
+            self.assertEqual(load_snapshot(dump_snapshot(value, compress)), value)
+
+    def test_table_restores_defaults(self):
+        rows = [{'a': 1, 'b': "x"}, {'a': 1, 'b': "y", 'c': [1]}, {'a': 2, 'b': "x"}]
+        blob = dump_snapshot(Table(rows, {'a': 1}))
+        self.assertEqual(load_snapshot(blob), rows)
+
+    def test_rejects_other_data(self):
+        self.assertFalse(is_snapshot(b'{"name": "x"}'))
+        with self.assertRaises(ValueError):
+            load_snapshot(b'{"name": "x"}')
+        with self.assertRaises(ValueError):
+            load_snapshot(b"TSNP" + bytes((SNAPSHOT_VERSION + 1, 0)) + b"\x00")
+        with self.assertRaises(ValueError):
+            load_snapshot(b"TSNP\x01\x01not zlib")
+
+
+class ScheduleSnapshotTest(unittest.TestCase):
+
+    def test_schedule_round_trip(self):
+        schedule = build_schedule()
+        for compress in (False, True):
+            restored = schedule_from_snapshot(schedule_to_snapshot(schedule, compress))
+            self.assertEqual(restored.to_dict(), schedule.to_dict())
+
+    def test_empty_schedule_round_trip(self):
+        schedule = Schedule(name="Empty")
+        self.assertEqual(schedule_from_snapshot(schedule_to_snapshot(schedule)).to_dict(), schedule.to_dict())
+
+    def test_factory_defaults_are_stored(self):
+        schedule = build_schedule(8)
+        blob = schedule_to_snapshot(schedule)
+
+        class Christmas(dt.datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return dt.datetime(2030, 12, 25)
+
+        with mock.patch.object(models, 'datetime', Christmas):
+            restored = schedule_from_snapshot(blob)
+        self.assertEqual(restored.date, schedule.date)
+        self.assertEqual(restored.created_at, schedule.created_at)
+        self.assertEqual([task.id for task in restored.tasks], [task.id for task in schedule.tasks])
+
+    def test_smaller_than_json(self):
+        schedule = build_schedule(500)
+        self.assertLess(len(schedule_to_snapshot(schedule)), len(dumps(schedule.to_dict())) // 10)
+
+
+class StorageTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        data_path = mock.patch('tasched.services.resource_service.ResourceService.get_data_path',
+                               return_value=Path(self.directory))
+        data_path.start()
+        self.addCleanup(data_path.stop)
+        self.storage = StorageService(os.path.join(self.directory, "test.db"))
+        self.schedule = build_schedule()
+
+    def set_template_data(self, data):
+        conn = self.storage._connect()
+        conn.execute("UPDATE templates SET schedule_data = ?", (data,))
+        conn.commit()
+        conn.close()
+
+    def test_template_round_trip(self):
+        self.storage.save_template("Mock", "", self.schedule)
+        self.assertEqual(self.storage.get_template("template_mock").to_dict(), self.schedule.to_dict())
+
+    def test_template_saved_as_legacy_json_loads(self):
+        self.storage.save_template("Mock", "", Schedule())
+        self.set_template_data(json.dumps(self.schedule.to_dict(), indent=2))
+        self.assertEqual(self.storage.get_template("template_mock").to_dict(), self.schedule.to_dict())
+
+    def test_template_saved_as_snapshot_loads(self):
+        self.storage.save_template("Mock", "", Schedule())
+        self.set_template_data(schedule_to_snapshot(self.schedule))
+        self.assertEqual(self.storage.get_template("template_mock").to_dict(), self.schedule.to_dict())
+
+    def test_export_import(self):
+        path = os.path.join(self.directory, "mock.tsched")
+        self.storage.export_schedule(self.schedule, path)
+        self.assertTrue(is_snapshot(open(path, 'rb').read()))
+        self.assertEqual(self.storage.import_schedule(path).to_dict(), self.schedule.to_dict())
+
+    def test_import_json_and_bad_files(self):
+        path = os.path.join(self.directory, "mock.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.schedule.to_dict(), f)
+        self.assertEqual(self.storage.import_schedule(path).to_dict(), self.schedule.to_dict())
+
+        with open(path, 'wb') as f:
+            f.write(b"TSNP\x01\x01garbage")
+        with mock.patch('builtins.print'):
+            self.assertIsNone(self.storage.import_schedule(path))
+            self.assertIsNone(self.storage.import_schedule(os.path.join(self.directory, "missing")))
+
+
+if __name__ == "__main__":
+    unittest.main()
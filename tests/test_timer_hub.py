@@ -0,0 +1,75 @@
+"""
+Timer hub scheduling against a fake clock
+
+Usage:
+    python -m unittest tests.test_timer_hub
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tasched.core import timer_hub
+from tasched.core.timer_hub import TimerHub
+
+
+class FakeRoot:
+    """Records the heartbeat instead of running a Tk loop"""
+
+    def __init__(self):
+        self.pending = None
+
+    def after(self, delay_ms, callback=None, *args):
+        self.pending = callback
+        return "after#0"
+
+    def after_idle(self, callback, *args):
+        return "after#1"
+
+    def after_cancel(self, after_id):
+        self.pending = None
+
+
+class AlignedJobTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1000.25
+        patcher = mock.patch.object(timer_hub.time, 'time', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.root = FakeRoot()
+        self.hub = TimerHub(self.root, frame_ms=16)
+        self.calls = []
+
+    def beat_at(self, when: float):
+        self.now = when
+        self.hub._heartbeat()
+
+    def test_early_heartbeat_runs_job_once_per_second(self):
+        self.hub.add_periodic("clock", lambda: self.calls.append(self.now), 1000)
+        # Heartbeats land 3 ms before each second (within half a frame)
+        for second in range(1001, 1011):
+            self.beat_at(second - 0.003)
+            self.beat_at(second + 0.001)
+        self.assertEqual(len(self.calls), 10)
+        self.assertEqual(self.hub._jobs["clock"].due, 1011)
+
+    def test_late_heartbeat_skips_to_next_boundary(self):
+        self.hub.add_periodic("clock", lambda: self.calls.append(self.now), 1000)
+        self.beat_at(1001.7)
+        self.assertEqual(self.hub._jobs["clock"].due, 1002)
+        self.beat_at(1002.0)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_unaligned_periodic_keeps_interval(self):
+        self.hub.add_periodic("poll", lambda: self.calls.append(self.now), 20, aligned=False)
+        for step in range(1, 6):
+            self.beat_at(1000.25 + step * 0.020)
+        self.assertEqual(len(self.calls), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()